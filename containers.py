@@ -3,8 +3,17 @@ from user.application.user_service import UserService
 from user.infra.repository.postgres_user_repo import PostgresUserRepository
 from report.application.report_service import ReportService
 from report.infra.repository.postgres_report_repo import PostgresReportRepository
+from report.application.report_cluster_service import ReportClusterService
+from report.application.feedback_buffer import create_feedback_buffer
+from report.infra.repository.postgres_report_cluster_repo import (
+    PostgresReportClusterRepository,
+)
 from route.application.route_service import RouteService
 from route.infra.repository.postgres_route_repo import PostgresRouteRepository
+from route.infra.road_network_loader import load_road_network
+from route.application.hazard_overlay import create_hazard_overlay
+from route.infra.tmap_cache import InMemoryTMapRouteCache
+from route.infra.tmap_client import TMapClient
 from report.application.report_comment_service import ReportCommentService
 from report.infra.repository.postgres_report_comment_repo import (
     PostgresReportCommentRepository,
@@ -20,6 +29,13 @@ from report.infra.repository.postgres_report_evaluating_repo import (
 
 from utils.crypto import Crypto
 from report.infra.event_bus import EventBus
+from report.infra.firebase import FirebasePushSender
+from report.application.push_dispatcher import create_push_dispatcher
+from report.application.outbox_relay import create_outbox_relay
+from report.infra.repository.postgres_outbox_repo import PostgresOutboxRepository
+from config import get_settings
+
+settings = get_settings()
 
 
 class Container(containers.DeclarativeContainer):
@@ -36,14 +52,79 @@ class Container(containers.DeclarativeContainer):
 
     user_repo = providers.Singleton(PostgresUserRepository)
     report_repo = providers.Singleton(PostgresReportRepository)
+    report_cluster_repo = providers.Singleton(PostgresReportClusterRepository)
     report_comment_repo = providers.Singleton(PostgresReportCommentRepository)
     report_not_there_repo = providers.Singleton(PostgresReportNotThereRepository)
     report_evaluating_repo = providers.Factory(PostgresReportEvaluatingRepository)
+    outbox_repo = providers.Singleton(PostgresOutboxRepository)
     route_repo = providers.Singleton(PostgresRouteRepository)
+    road_network = providers.Singleton(load_road_network)
+    hazard_overlay = providers.Singleton(
+        create_hazard_overlay,
+        road_network=road_network,
+        report_repo=report_repo,
+        resync_s=settings.hazard_overlay_resync_s,
+        min_risk_score=settings.hazard_min_risk_score,
+    )
+    feedback_buffer = providers.Singleton(
+        create_feedback_buffer,
+        enabled=settings.feedback_write_behind,
+        report_repo=report_repo,
+        flush_interval_s=settings.feedback_flush_interval_s,
+        max_pending=settings.feedback_flush_max_pending,
+        hazard_overlay=hazard_overlay,
+    )
+    tmap_route_cache = providers.Singleton(
+        InMemoryTMapRouteCache,
+        maxsize=settings.tmap_cache_maxsize,
+        ttl_s=settings.tmap_cache_ttl_s,
+    )
+    tmap_client = providers.Singleton(
+        TMapClient,
+        app_key=settings.tmap_app_key,
+        cache=tmap_route_cache,
+        cache_precision=settings.tmap_cache_precision,
+        base_url=settings.tmap_base_url,
+        connect_timeout_s=settings.tmap_connect_timeout_s,
+        read_timeout_s=settings.tmap_read_timeout_s,
+        max_connections=settings.tmap_max_connections,
+        max_concurrency=settings.tmap_max_concurrency,
+    )
 
     crypto = providers.Singleton(Crypto)
 
-    event_bus = providers.Singleton(EventBus)
+    event_bus = providers.Singleton(
+        EventBus,
+        amqp_url=settings.amqp_url,
+        codec=settings.event_bus_codec,
+        confirms=settings.event_bus_confirms,
+        channel_pool_size=settings.event_bus_channel_pool_size,
+        outbox_size=settings.event_bus_outbox_size,
+        batch_size=settings.event_bus_batch_size,
+    )
+
+    outbox_relay = providers.Singleton(
+        create_outbox_relay,
+        enabled=settings.event_outbox_enabled,
+        outbox_repo=outbox_repo,
+        event_bus=event_bus,
+        batch_size=settings.event_outbox_batch_size,
+        poll_interval_s=settings.event_outbox_poll_interval_s,
+        lease_s=settings.event_outbox_lease_s,
+        max_attempts=settings.event_outbox_max_attempts,
+    )
+
+    push_sender = providers.Singleton(FirebasePushSender)
+    push_dispatcher = providers.Singleton(
+        create_push_dispatcher,
+        enabled=settings.push_dispatcher_enabled,
+        sender=push_sender,
+        max_queue=settings.push_queue_size,
+        workers=settings.push_workers,
+        batch_wait_s=settings.push_batch_wait_s,
+        max_retries=settings.push_max_retries,
+        retry_backoff_s=settings.push_retry_backoff_s,
+    )
 
     user_service = providers.Factory(
         UserService,
@@ -51,12 +132,25 @@ class Container(containers.DeclarativeContainer):
         crypto=crypto,
     )
 
+    report_cluster_service = providers.Factory(
+        ReportClusterService,
+        repo=report_cluster_repo,
+        radius_m=settings.report_cluster_radius_m,
+        eps_m=settings.report_recluster_eps_m,
+        min_points=settings.report_recluster_min_points,
+    )
+
     report_service = providers.Factory(
         ReportService,
         repo=report_repo,
         user_repo=user_repo,
         event_bus=event_bus,
         evaluating_repo=report_evaluating_repo,
+        hazard_overlay=hazard_overlay,
+        cluster_service=report_cluster_service,
+        map_aggregate_max_zoom=settings.report_map_aggregate_max_zoom,
+        push_dispatcher=push_dispatcher,
+        outbox_relay=outbox_relay,
     )
 
     report_comment_service = providers.Factory(
@@ -68,16 +162,27 @@ class Container(containers.DeclarativeContainer):
         ReportNotThereService,
         repo=report_not_there_repo,
         report_repo=report_repo,
+        hazard_overlay=hazard_overlay,
+        cluster_service=report_cluster_service,
+        feedback_buffer=feedback_buffer,
     )
 
     report_evaluating_service = providers.Factory(
         ReportEvaluatingService,
         report_repo=report_repo,
         evaluating_repo=report_evaluating_repo,
+        hazard_overlay=hazard_overlay,
+        feedback_buffer=feedback_buffer,
     )
 
     route_service = providers.Factory(
         RouteService,
         repo=route_repo,
         report_repo=report_repo,
+        road_network=road_network,
+        tmap_client=tmap_client,
+        hazard_overlay=hazard_overlay,
+        corridor_m=settings.hazard_corridor_m,
+        od_corridor_m=settings.hazard_corridor_od_m,
+        min_risk_score=settings.hazard_min_risk_score,
     )
@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from fastapi.openapi.utils import get_openapi
+from config import get_settings
 from containers import Container
 from report.infra.firebase import init_firebase
 
@@ -23,6 +24,84 @@ app = FastAPI(title="NAVI Backend", version="0.1.0")
 app.container = Container()
 
 
+@app.on_event("startup")
+def load_road_network():
+    # 도로망 파일은 첫 경로 요청이 아니라 서버 시작 시 미리 읽어 둔다
+    app.container.road_network()
+
+    # 승인된 제보로 위험 페널티 오버레이 초기화 (실패하면 첫 경로 요청에서 재시도)
+    overlay = app.container.hazard_overlay()
+    if overlay is not None:
+        overlay.refresh()
+
+
+@app.on_event("startup")
+def start_feedback_buffer():
+    # 평가 카운트 write-behind 주기 flush 시작
+    buffer = app.container.feedback_buffer()
+    if buffer is not None:
+        buffer.start()
+
+
+@app.on_event("startup")
+async def start_push_dispatcher():
+    # 푸시 알림 워커 시작 (이벤트 루프 안에서)
+    dispatcher = app.container.push_dispatcher()
+    if dispatcher is not None:
+        dispatcher.start()
+
+
+@app.on_event("startup")
+async def start_event_publisher():
+    # 이벤트 발행을 outbox + 백그라운드 배치 발행으로 (요청은 브로커를 기다리지 않음)
+    if get_settings().event_bus_publisher_mode:
+        app.container.event_bus().start_publisher()
+
+
+@app.on_event("startup")
+async def start_outbox_relay():
+    # 재시작 전에 못 보낸 이벤트를 포함해 outbox 테이블 → RabbitMQ 발행 시작
+    relay = app.container.outbox_relay()
+    if relay is not None:
+        relay.start()
+
+
+@app.on_event("shutdown")
+async def close_tmap_client():
+    # 공유 TMap HTTP 연결 풀 정리
+    await app.container.tmap_client().aclose()
+
+
+@app.on_event("shutdown")
+def flush_feedback_buffer():
+    # 종료 전 남은 평가 카운트 증감분 반영
+    buffer = app.container.feedback_buffer()
+    if buffer is not None:
+        buffer.stop()
+
+
+@app.on_event("shutdown")
+async def drain_push_dispatcher():
+    # 종료 전 큐에 남은 푸시 알림 전송
+    dispatcher = app.container.push_dispatcher()
+    if dispatcher is not None:
+        await dispatcher.stop()
+
+
+@app.on_event("shutdown")
+async def stop_outbox_relay():
+    # 발행 중인 배치까지만 보내고 중지 (남은 이벤트는 outbox에 남음)
+    relay = app.container.outbox_relay()
+    if relay is not None:
+        await relay.stop()
+
+
+@app.on_event("shutdown")
+async def close_event_bus():
+    # 종료 전 outbox에 남은 이벤트 발행 후 연결 종료
+    await app.container.event_bus().stop()
+
+
 @app.get("/")
 def health():
     return {"ok": True}
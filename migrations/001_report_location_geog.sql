@@ -0,0 +1,16 @@
+-- report.location_geog: 위도/경도에서 자동 계산되는 geography 컬럼 + GiST 인덱스
+-- STORED 생성 컬럼이라 추가하는 순간 기존 행 전체가 다시 쓰이며 채워진다 (backfill).
+-- 테이블 재작성 동안 report 테이블 쓰기가 잠기므로 트래픽이 적을 때 적용.
+CREATE EXTENSION IF NOT EXISTS postgis;
+
+ALTER TABLE report
+    ADD COLUMN IF NOT EXISTS location_geog geography(Point, 4326)
+    GENERATED ALWAYS AS (
+        ST_SetSRID(ST_MakePoint(location_lng, location_lat), 4326)::geography
+    ) STORED;
+
+-- CONCURRENTLY: 인덱스 생성 중에도 제보 등록이 막히지 않도록 (트랜잭션 밖에서 실행)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_report_location_geog
+    ON report USING gist (location_geog);
+
+ANALYZE report;
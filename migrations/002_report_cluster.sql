@@ -0,0 +1,26 @@
+-- report_cluster: 클러스터 중심점/소속 제보 수 + 최근접 중심점 조회용 GiST 인덱스
+CREATE TABLE IF NOT EXISTS report_cluster (
+    cluster_id VARCHAR PRIMARY KEY,
+    center_lat FLOAT NOT NULL,
+    center_lng FLOAT NOT NULL,
+    center_geog geography(Point, 4326) GENERATED ALWAYS AS (
+        ST_SetSRID(ST_MakePoint(center_lng, center_lat), 4326)::geography
+    ) STORED,
+    member_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS ix_report_cluster_center_geog
+    ON report_cluster USING gist (center_geog);
+
+-- 기존 report.cluster_id 그대로 중심점 채우기 (이후 재클러스터링은 관리자 API로)
+INSERT INTO report_cluster (cluster_id, center_lat, center_lng, member_count, updated_at)
+SELECT cluster_id, avg(location_lat), avg(location_lng), count(*), now()
+FROM report
+WHERE cluster_id IS NOT NULL
+  AND location_lat IS NOT NULL
+  AND location_lng IS NOT NULL
+GROUP BY cluster_id
+ON CONFLICT (cluster_id) DO NOTHING;
+
+ANALYZE report_cluster;
@@ -0,0 +1,35 @@
+-- report_cluster_summary: 클러스터별 최신 승인 제보/승인 제보 수/평가 합계
+-- 지도(/reports/latest-by-cluster, /reports/)가 전체 제보 DISTINCT ON 대신 이 테이블을 읽는다.
+-- 제보 생성/승인/삭제/평가 시 같은 트랜잭션에서 해당 클러스터 행만 다시 계산된다.
+CREATE TABLE IF NOT EXISTS report_cluster_summary (
+    cluster_id VARCHAR PRIMARY KEY,
+    latest_report_id VARCHAR NOT NULL,
+    latest_created_at TIMESTAMP,
+    member_count INTEGER NOT NULL DEFAULT 0,
+    bad_count INTEGER NOT NULL DEFAULT 0,
+    total_feedbacks INTEGER NOT NULL DEFAULT 0,
+    score FLOAT,
+    updated_at TIMESTAMP
+);
+
+-- 클러스터 하나의 요약 재계산 / 클러스터별 제보 목록 조회용
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_report_cluster_created
+    ON report (cluster_id, created_at);
+
+INSERT INTO report_cluster_summary
+    (cluster_id, latest_report_id, latest_created_at, member_count,
+     bad_count, total_feedbacks, score, updated_at)
+SELECT cluster_id,
+    (array_agg(report_id ORDER BY created_at DESC, report_id DESC))[1],
+    max(created_at),
+    count(*),
+    coalesce(sum(bad_count), 0),
+    coalesce(sum(total_feedbacks), 0),
+    coalesce(sum(bad_count), 0)::float / nullif(sum(total_feedbacks), 0),
+    now()
+FROM report
+WHERE status = 'APPROVED' AND cluster_id IS NOT NULL
+GROUP BY cluster_id
+ON CONFLICT (cluster_id) DO NOTHING;
+
+ANALYZE report_cluster_summary;
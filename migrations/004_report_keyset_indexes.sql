@@ -0,0 +1,3 @@
+-- 목록 API 키셋 페이지네이션 (created_at, report_id) 용 인덱스
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_report_cluster_summary_latest
+    ON report_cluster_summary (latest_created_at, latest_report_id);
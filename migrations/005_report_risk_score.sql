@@ -0,0 +1,31 @@
+-- report.risk_score: 평가 수(good/normal/bad)에서 자동 계산되는 위험도 + 승인 제보 부분 인덱스
+-- 식은 report.domain.risk_score.risk_score() / RISK_SCORE_SQL과 같다 (바꿀 때 함께 바꿀 것).
+-- STORED 생성 컬럼이라 추가하는 순간 기존 행 전체가 다시 쓰이며 채워진다 (backfill).
+-- 테이블 재작성 동안 report 테이블 쓰기가 잠기므로 트래픽이 적을 때 적용.
+ALTER TABLE report
+    ADD COLUMN IF NOT EXISTS risk_score FLOAT
+    GENERATED ALWAYS AS (
+        CASE WHEN CAST(coalesce(good_count, 0) + coalesce(normal_count, 0) + coalesce(bad_count, 0) AS double precision) = 0 THEN 0.5
+        ELSE ((coalesce(bad_count, 0) + coalesce(normal_count, 0) * 0.5) / CAST(coalesce(good_count, 0) + coalesce(normal_count, 0) + coalesce(bad_count, 0) AS double precision)
+              * (1 - exp(-CAST(coalesce(good_count, 0) + coalesce(normal_count, 0) + coalesce(bad_count, 0) AS double precision) / 10))
+              + 0.5 * exp(-CAST(coalesce(good_count, 0) + coalesce(normal_count, 0) + coalesce(bad_count, 0) AS double precision) / 10))
+             * (0.5 + 0.5 * (1 - exp(-0.1 * CAST(coalesce(good_count, 0) + coalesce(normal_count, 0) + coalesce(bad_count, 0) AS double precision))))
+        END
+    ) STORED;
+
+-- 오버레이 초기화(승인 제보 중 위험도 임계값 이상) 조회용
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_report_approved_risk
+    ON report (risk_score) WHERE status = 'APPROVED';
+
+-- 클러스터 요약 점수를 아쉬움 비율에서 risk_score 평균으로
+UPDATE report_cluster_summary s
+SET score = a.score, updated_at = now()
+FROM (
+    SELECT cluster_id, avg(risk_score) AS score
+    FROM report
+    WHERE status = 'APPROVED' AND cluster_id IS NOT NULL
+    GROUP BY cluster_id
+) AS a
+WHERE s.cluster_id = a.cluster_id;
+
+ANALYZE report;
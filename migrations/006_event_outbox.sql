@@ -0,0 +1,11 @@
+-- 제보 도메인 이벤트 transactional outbox
+-- 제보 변경과 같은 트랜잭션에서 INSERT, OutboxRelay가 발행 확인 후 DELETE한다.
+-- 발행된 행은 바로 지워지므로 테이블은 발행 대기분만큼만 유지된다.
+CREATE TABLE IF NOT EXISTS event_outbox (
+    outbox_id BIGSERIAL PRIMARY KEY,
+    routing_key VARCHAR NOT NULL,
+    payload JSONB NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    locked_until TIMESTAMPTZ
+);
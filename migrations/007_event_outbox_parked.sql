@@ -0,0 +1,6 @@
+-- event_outbox.parked_at: 발행을 max_attempts번 실패해 릴레이가 포기한 이벤트 표시
+-- attempts는 같은 배치의 다른 이벤트는 나갔는데 이 이벤트만 실패했을 때만 센다 (브로커 장애는 세지 않음).
+-- 따로 빼 둔 행은 claim하지 않고 지우지도 않는다. 원인을 고친 뒤 다시 보내려면
+--   UPDATE event_outbox SET parked_at = NULL, attempts = 0 WHERE parked_at IS NOT NULL;
+ALTER TABLE event_outbox ADD COLUMN IF NOT EXISTS parked_at TIMESTAMPTZ;
+
@@ -0,0 +1,50 @@
+# SQL 마이그레이션 적용 스크립트
+# poetry run python -m migrations.apply
+# migrations/*.sql 파일을 이름순으로, 아직 적용되지 않은 것만 실행한다.
+from pathlib import Path
+
+from sqlalchemy import text
+
+from database import engine
+
+MIGRATIONS_DIR = Path(__file__).parent
+
+
+def split_statements(sql: str):
+    """주석 줄을 빼고 ';' 기준으로 문장 분리 (함수 본문 같은 $$ 블록은 쓰지 않는 전제)"""
+    lines = [l for l in sql.splitlines() if not l.strip().startswith("--")]
+    return [s.strip() for s in "\n".join(lines).split(";") if s.strip()]
+
+
+def main():
+    # CREATE INDEX CONCURRENTLY는 트랜잭션 안에서 실행할 수 없어 AUTOCOMMIT으로 실행
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(
+            text(
+                """
+                CREATE TABLE IF NOT EXISTS schema_migrations (
+                    name VARCHAR PRIMARY KEY,
+                    applied_at TIMESTAMP NOT NULL DEFAULT now()
+                )
+                """
+            )
+        )
+        applied = {
+            row.name for row in conn.execute(text("SELECT name FROM schema_migrations"))
+        }
+
+        for path in sorted(MIGRATIONS_DIR.glob("*.sql")):
+            if path.name in applied:
+                continue
+            print(f"Applying {path.name}...")
+            for statement in split_statements(path.read_text(encoding="utf-8")):
+                conn.execute(text(statement))
+            conn.execute(
+                text("INSERT INTO schema_migrations (name) VALUES (:name)"),
+                {"name": path.name},
+            )
+        print("Done.")
+
+
+if __name__ == "__main__":
+    main()
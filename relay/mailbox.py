@@ -0,0 +1,379 @@
+import asyncio
+import os
+import socket
+import time
+import uuid
+from functools import partial
+from typing import Awaitable, Callable, Dict
+
+import aio_pika
+
+from common.logger import logger
+from report.infra.event_codec import decode_event
+
+EVENTS_EXCHANGE = "navi.events"
+ONLINE_EXCHANGE = "navi.relay.online"
+MAILBOX_EXCHANGE = "navi.relay.mailbox"
+RETRY_EXCHANGE = "navi.relay.retry"
+RETRY_QUEUE = "relay.retry"
+ROUTING_KEYS = ["report.created", "report.reviewed", "report.updated", "report.deleted"]
+
+DEFAULT_MAILBOX_EXPIRES_S = 14 * 24 * 3600
+DEFAULT_INGRESS_PREFETCH = 200
+DEFAULT_DELIVERY_PREFETCH = 200
+DEFAULT_RETRY_BACKOFF_S = 0.5
+MAX_RETRY_BACKOFF_S = 30.0
+
+# 노드 사이에서 되돌려 보낸 횟수가 이만큼 되면 더 돌리지 않고 메일박스로
+MAX_FORWARD_HOPS = 3
+
+
+def ingress_queue_name(routing_key: str) -> str:
+    return f"relay.{routing_key}"
+
+
+def mailbox_queue_name(user_id: str) -> str:
+    return f"relay.mailbox.{user_id}"
+
+
+def node_queue_name(node_id: str) -> str:
+    return f"relay.node.{node_id}"
+
+
+def default_node_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+
+def target_user_id(event: dict) -> str | None:
+    """이벤트를 받을 사용자 (자녀 제보 이벤트는 보호자, 검토 결과는 자녀)"""
+    return event.get("parentId") or event.get("childId")
+
+
+class _Subscription:
+    """이 노드에 붙은 사용자 WebSocket 연결 하나"""
+
+    def __init__(self, user_id: str, send: Callable[[dict], Awaitable]):
+        self.user_id = user_id
+        self.send = send
+        self.closed = False
+        # 같은 소켓으로 보내는 순서 유지 (메일박스 flush가 끝난 뒤 실시간 이벤트)
+        self.lock = asyncio.Lock()
+
+
+class MailboxRelay:
+    """
+    navi.events 이벤트를 사용자 소켓을 가진 릴레이 노드로 바로 보내고, 아무 노드에도
+    접속하지 않은 사용자 이벤트는 사용자별 durable 메일박스 큐에 보관한다.
+    릴레이를 여러 대 띄워도 이벤트는 소켓을 가진 노드에만 간다.
+    - 고정 큐 relay.{routing_key}: 모든 노드가 나눠 소비하며 대상 사용자(parentId/childId)를
+      routing key로 navi.relay.online(direct)에 다시 발행하고 ack
+    - 노드 큐 relay.node.{node_id}: 노드마다 하나 (exclusive, 노드 연결이 끊기면 삭제).
+      사용자가 접속하면 그 user_id로 online exchange에 바인딩 → 바인딩이 곧 연결 레지스트리다.
+      같은 사용자가 여러 노드(여러 기기)에 접속해 있으면 각 노드가 한 부씩 받는다
+    - 메일박스 relay.mailbox.{user_id}: online exchange의 alternate exchange(navi.relay.mailbox)에
+      바인딩. 바인딩된 노드가 없어 라우팅되지 않는 이벤트만 여기로 간다.
+      큐는 인자 없이 선언하고 TTL/최대 길이/만료는 브로커 policy(relay.policy)로 건다.
+      만료(expires) 전에 mailbox_expires_s / 2마다 다시 선언해 쓰이는 메일박스는 유지한다
+    - attach(): 노드 큐 바인딩 후 메일박스를 비울 때까지 전달하고, 그다음 실시간 이벤트를 보낸다
+    - 노드에 도착했는데 소켓이 이미 끊긴 이벤트는 online exchange로 다시 보내
+      다른 노드나 메일박스로 간다 (MAX_FORWARD_HOPS 넘으면 메일박스로)
+    - 라우팅/전달 채널 모두 prefetch를 걸어 미확인 메시지를 무한정 받지 않는다
+    - 다시 발행하지 못한 이벤트는 지연 큐 relay.retry에 메시지별 TTL(expiration)을 걸어 넣고
+      원본은 ack한다. TTL은 연속 실패 수만큼 늘린다 (retry_backoff_s부터 두 배씩,
+      MAX_RETRY_BACKOFF_S까지). TTL이 지나면 브로커가 online exchange로 dead-letter해
+      다시 라우팅되므로 핸들러가 잠들어 prefetch 자리를 잡고 있지 않는다.
+      지연 큐 TTL은 큐 앞에서만 만료되므로 장애가 풀린 직후의 짧은 TTL도 앞선 긴 TTL만큼 늦을 수 있다
+    노드 프로세스가 죽으면 노드 큐에 도착해 아직 전달하지 못한 이벤트는 사라진다 (실시간 알림 용도).
+    """
+
+    def __init__(
+        self,
+        connection,
+        node_id: str | None = None,
+        mailbox_expires_s: float = DEFAULT_MAILBOX_EXPIRES_S,
+        ingress_prefetch: int = DEFAULT_INGRESS_PREFETCH,
+        delivery_prefetch: int = DEFAULT_DELIVERY_PREFETCH,
+        retry_backoff_s: float = DEFAULT_RETRY_BACKOFF_S,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.connection = connection
+        self.node_id = node_id or default_node_id()
+        self.mailbox_expires_s = mailbox_expires_s
+        self.ingress_prefetch = ingress_prefetch
+        self.delivery_prefetch = delivery_prefetch
+        self.retry_backoff_s = retry_backoff_s
+        self._clock = clock
+        self._route_channel = None
+        self._delivery_channel = None
+        self._online_exchange = None
+        self._mailbox_exchange = None
+        self._retry_exchange = None
+        self._node_queue = None
+        # user_id → 마지막으로 메일박스 큐를 선언한 시각 (x-expires 전에 다시 선언해 유지)
+        self._declared: Dict[str, float] = {}
+        self._subscriptions: Dict[str, _Subscription] = {}
+        self._publish_failures = 0  # 연속으로 다시 발행하지 못한 횟수 (지연 큐 TTL)
+        self.routed = 0
+        self.delivered = 0
+        self.forwarded = 0
+        self.unaddressed = 0
+        self.invalid = 0
+        self.delayed = 0
+        self.requeued = 0
+
+    async def start(self) -> None:
+        # 라우팅: 다음 단계 큐에 들어간 것이 확인된 뒤 원본을 ack (publisher confirm)
+        self._route_channel = await self.connection.channel(publisher_confirms=True)
+        await self._route_channel.set_qos(prefetch_count=self.ingress_prefetch)
+        events = await self._route_channel.declare_exchange(
+            EVENTS_EXCHANGE, aio_pika.ExchangeType.TOPIC, durable=True
+        )
+        self._mailbox_exchange = await self._route_channel.declare_exchange(
+            MAILBOX_EXCHANGE, aio_pika.ExchangeType.DIRECT, durable=True
+        )
+        self._online_exchange = await self._route_channel.declare_exchange(
+            ONLINE_EXCHANGE,
+            aio_pika.ExchangeType.DIRECT,
+            durable=True,
+            arguments={"alternate-exchange": MAILBOX_EXCHANGE},
+        )
+        # 지연 큐: 메시지별 TTL이 지나면 원래 routing key(user_id)로 online exchange에 돌아감.
+        # 인자는 설정과 무관한 고정값이라 노드마다 다시 선언해도 충돌하지 않는다
+        self._retry_exchange = await self._route_channel.declare_exchange(
+            RETRY_EXCHANGE, aio_pika.ExchangeType.FANOUT, durable=True
+        )
+        retry_queue = await self._route_channel.declare_queue(
+            RETRY_QUEUE,
+            durable=True,
+            arguments={"x-dead-letter-exchange": ONLINE_EXCHANGE},
+        )
+        await retry_queue.bind(self._retry_exchange)
+
+        # 전달: 이 노드 소켓으로 갈 이벤트만 받는 노드 큐
+        self._delivery_channel = await self.connection.channel()
+        await self._delivery_channel.set_qos(prefetch_count=self.delivery_prefetch)
+        self._node_queue = await self._delivery_channel.declare_queue(
+            node_queue_name(self.node_id), exclusive=True, auto_delete=True
+        )
+        await self._node_queue.consume(self._deliver)
+
+        for routing_key in ROUTING_KEYS:
+            queue = await self._route_channel.declare_queue(
+                ingress_queue_name(routing_key), durable=True
+            )
+            await queue.bind(events, routing_key)
+            await queue.consume(partial(self._route, routing_key))
+
+    async def stop(self) -> None:
+        for user_id in list(self._subscriptions):
+            await self.detach(user_id)
+        for channel in (self._delivery_channel, self._route_channel):
+            if channel is not None:
+                await channel.close()
+        self._route_channel = self._delivery_channel = None
+
+    # --- 이벤트 → 소켓을 가진 노드 (없으면 메일박스) ---
+    async def _declare_mailbox(self, channel, user_id: str):
+        # 보관 정책은 relay-mailbox policy로 (선언 인자가 다르면 재선언이 실패하므로 인자 없이)
+        queue = await channel.declare_queue(mailbox_queue_name(user_id), durable=True)
+        await queue.bind(MAILBOX_EXCHANGE, routing_key=user_id)
+        self._declared[user_id] = self._clock()
+        return queue
+
+    async def _ensure_mailbox(self, user_id: str) -> None:
+        declared_at = self._declared.get(user_id)
+        # 선언도 사용으로 쳐서 x-expires가 다시 시작됨 → 만료 전에 한 번씩 다시 선언
+        if declared_at is None or (
+            self._clock() - declared_at > self.mailbox_expires_s / 2
+        ):
+            await self._declare_mailbox(self._route_channel, user_id)
+
+    async def _publish(
+        self,
+        exchange,
+        message,
+        user_id: str,
+        headers: dict,
+        expiration: float | None = None,
+    ) -> None:
+        # 접속한 노드가 없으면 alternate exchange로 메일박스에 가므로 메일박스가 있어야 함
+        # (지연 큐를 거칠 때도 TTL이 지나면 online exchange로 가므로 미리 선언)
+        await self._ensure_mailbox(user_id)
+        await exchange.publish(
+            aio_pika.Message(
+                body=message.body,
+                content_type=message.content_type,
+                headers=headers,
+                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                expiration=expiration,
+            ),
+            routing_key=user_id,
+        )
+
+    async def _retry_later(self, message, user_id: str, headers: dict) -> None:
+        """
+        다시 발행하지 못한 이벤트를 연속 실패 수만큼 늘린 TTL로 지연 큐에 넣고 원본은 ack.
+        지연 큐 발행도 실패하면 원본을 바로 재큐잉한다
+        """
+        self._declared.pop(user_id, None)
+        self._publish_failures += 1
+        delay_s = min(
+            self.retry_backoff_s * 2 ** min(self._publish_failures - 1, 16),
+            MAX_RETRY_BACKOFF_S,
+        )
+        try:
+            await self._publish(
+                self._retry_exchange, message, user_id, headers, expiration=delay_s
+            )
+        except Exception as e:
+            logger.warning(f"Relay failed to delay event for {user_id}: {e}")
+            self._declared.pop(user_id, None)
+            self.requeued += 1
+            await message.nack(requeue=True)
+            return
+        self.delayed += 1
+        await message.ack()
+
+    async def _route(self, routing_key: str, message) -> None:
+        try:
+            event = decode_event(message.body, message.content_type)
+        except Exception as e:
+            self.invalid += 1
+            logger.warning(f"Relay dropped undecodable {routing_key} event: {e}")
+            await message.reject(requeue=False)
+            return
+
+        user_id = target_user_id(event)
+        if not user_id:
+            self.unaddressed += 1
+            await message.ack()
+            return
+
+        headers = {"eventType": routing_key, "userId": user_id}
+        try:
+            await self._publish(self._online_exchange, message, user_id, headers)
+        except Exception as e:
+            logger.warning(f"Relay failed to route {routing_key} to {user_id}: {e}")
+            await self._retry_later(message, user_id, headers)
+            return
+        self._publish_failures = 0
+        self.routed += 1
+        await message.ack()
+
+    # --- 연결 관리 ---
+    async def attach(
+        self, user_id: str, send: Callable[[dict], Awaitable]
+    ) -> _Subscription:
+        """
+        사용자 접속 → 이 노드로 이벤트가 오도록 바인딩하고, 메일박스에 쌓인 이벤트부터
+        send로 전달한다 (같은 노드의 이전 연결은 대체)
+        """
+        previous = self._subscriptions.get(user_id)
+        if previous is not None:
+            previous.closed = True
+        subscription = _Subscription(user_id, send)
+        self._subscriptions[user_id] = subscription
+        async with subscription.lock:
+            # 바인딩(BindOk) 이후 라우팅되는 이벤트는 이 노드로 오므로 그 뒤에 메일박스를 비우면
+            # 사이에 메일박스로 들어간 이벤트도 놓치지 않는다
+            await self._node_queue.bind(ONLINE_EXCHANGE, routing_key=user_id)
+            await self._flush_mailbox(subscription)
+        return subscription
+
+    async def detach(self, user_id: str, subscription: _Subscription | None = None):
+        """연결 종료 → 바인딩 해제. 이후 이벤트는 다른 노드(다른 기기)나 메일박스로 간다"""
+        current = self._subscriptions.get(user_id)
+        if current is None or (
+            subscription is not None and current is not subscription
+        ):
+            return
+        current.closed = True
+        del self._subscriptions[user_id]
+        try:
+            await self._node_queue.unbind(ONLINE_EXCHANGE, routing_key=user_id)
+        except Exception as e:
+            logger.warning(f"Relay failed to unbind {user_id}: {e}")
+        # 해제하는 사이에 같은 사용자가 이 노드에 다시 접속했으면 바인딩 복구
+        if user_id in self._subscriptions:
+            await self._node_queue.bind(ONLINE_EXCHANGE, routing_key=user_id)
+
+    # --- 전달 ---
+    async def _send(self, subscription: _Subscription, message) -> bool:
+        """소켓으로 전송. 소켓이 끊겼으면 False (디코딩 못 하는 이벤트는 버리고 True)"""
+        try:
+            event = decode_event(message.body, message.content_type)
+        except Exception as e:
+            self.invalid += 1
+            logger.warning(f"Relay dropped undecodable event: {e}")
+            return True
+        event["eventType"] = (message.headers or {}).get("eventType")
+        try:
+            await subscription.send(event)
+        except Exception:
+            return False
+        self.delivered += 1
+        return True
+
+    async def _flush_mailbox(self, subscription: _Subscription) -> None:
+        queue = await self._declare_mailbox(
+            self._delivery_channel, subscription.user_id
+        )
+        while not subscription.closed:
+            message = await queue.get(no_ack=False, fail=False)
+            if message is None:
+                return
+            if await self._send(subscription, message):
+                await message.ack()
+            else:
+                await message.nack(requeue=True)  # 메일박스 앞자리로 되돌림
+                await self.detach(subscription.user_id, subscription)
+                return
+
+    async def _deliver(self, message) -> None:
+        """노드 큐 consumer: 이 노드의 소켓으로 전달, 소켓이 없으면 다시 라우팅"""
+        user_id = (message.headers or {}).get("userId")
+        subscription = self._subscriptions.get(user_id)
+        if subscription is not None:
+            async with subscription.lock:
+                if not subscription.closed:
+                    if await self._send(subscription, message):
+                        await message.ack()
+                        return
+                    await self.detach(user_id, subscription)
+        await self._forward(message, user_id)
+
+    async def _forward(self, message, user_id: str | None) -> None:
+        if not user_id:
+            self.unaddressed += 1
+            await message.ack()
+            return
+        headers = dict(message.headers or {})
+        hops = int(headers.get("hops", 0)) + 1
+        headers["hops"] = hops
+        # 바인딩 해제가 늦어 같은 노드로 되돌아오는 경우가 반복되면 메일박스로
+        exchange = (
+            self._online_exchange if hops < MAX_FORWARD_HOPS else self._mailbox_exchange
+        )
+        try:
+            await self._publish(exchange, message, user_id, headers)
+        except Exception as e:
+            logger.warning(f"Relay failed to forward event for {user_id}: {e}")
+            await self._retry_later(message, user_id, headers)
+            return
+        self._publish_failures = 0
+        self.forwarded += 1
+        await message.ack()
+
+    def stats(self) -> dict:
+        return {
+            "node_id": self.node_id,
+            "online": len(self._subscriptions),
+            "mailboxes_declared": len(self._declared),
+            "routed": self.routed,
+            "delivered": self.delivered,
+            "forwarded": self.forwarded,
+            "unaddressed": self.unaddressed,
+            "invalid": self.invalid,
+            "delayed": self.delayed,
+            "requeued": self.requeued,
+        }
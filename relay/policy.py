@@ -0,0 +1,49 @@
+# 사용자 메일박스 큐(relay.mailbox.*)의 보관 정책을 RabbitMQ policy로 건다.
+# 큐 선언 인자(x-message-ttl 등)로 넣으면 설정을 바꾼 노드가 기존 큐를 다시 선언할 때
+# PRECONDITION_FAILED로 채널이 닫히므로, 큐는 인자 없이 선언하고 보관 정책은 브로커 policy로 둔다
+# (policy는 바꾸면 이미 있는 큐에도 바로 적용된다).
+# RELAY_MANAGEMENT_URL이 있으면 릴레이가 시작할 때 관리 API로 적용하고, 없으면 브로커에 직접:
+#   rabbitmqctl set_policy --apply-to queues relay-mailbox '^relay\.mailbox\.' \
+#     '{"message-ttl":259200000,"expires":1209600000,"max-length":1000,"overflow":"drop-head"}'
+from urllib.parse import quote, unquote, urlsplit
+
+import aiohttp
+
+MAILBOX_POLICY_NAME = "relay-mailbox"
+MAILBOX_POLICY_PATTERN = r"^relay\.mailbox\."
+
+
+def mailbox_policy(
+    message_ttl_s: float, mailbox_expires_s: float, mailbox_max_length: int
+) -> dict:
+    """
+    메일박스 큐 policy (관리 API PUT /api/policies/{vhost}/{name} 본문).
+    message_ttl_s 지난 이벤트는 버리고, mailbox_max_length를 넘으면 오래된 것부터 버리며,
+    mailbox_expires_s 동안 쓰이지 않은 메일박스는 브로커가 삭제한다
+    """
+    return {
+        "pattern": MAILBOX_POLICY_PATTERN,
+        "apply-to": "queues",
+        "definition": {
+            "message-ttl": int(message_ttl_s * 1000),
+            "expires": int(mailbox_expires_s * 1000),
+            "max-length": mailbox_max_length,
+            "overflow": "drop-head",
+        },
+    }
+
+
+def amqp_vhost(amqp_url: str) -> str:
+    """AMQP URL의 vhost (경로가 없으면 기본 vhost "/", %2F는 "/")"""
+    return unquote(urlsplit(amqp_url).path[1:]) or "/"
+
+
+async def apply_mailbox_policy(management_url: str, policy: dict, vhost: str = "/"):
+    """관리 API로 메일박스 policy를 만들거나 덮어씀 (management_url의 사용자 정보로 인증)"""
+    url = (
+        f"{management_url.rstrip('/')}/api/policies/"
+        f"{quote(vhost, safe='')}/{MAILBOX_POLICY_NAME}"
+    )
+    async with aiohttp.ClientSession() as session:
+        async with session.put(url, json=policy) as response:
+            response.raise_for_status()
@@ -0,0 +1,141 @@
+import threading
+import time
+from typing import Callable, Dict
+
+from common.logger import logger
+from report.domain.feedback_delta import FeedbackDelta
+from report.domain.repository.report_repo import ReportRepository
+
+DEFAULT_FLUSH_INTERVAL_S = 1.0
+DEFAULT_MAX_PENDING = 500
+
+
+class FeedbackCounterBuffer:
+    """
+    평가/'이제 없어요' 카운트 증감을 프로세스 메모리에 모았다가 제보별로 합쳐
+    한 번의 UPDATE로 반영한다 (write-behind). 인기 제보 하나에 탭이 몰려도
+    report 행 잠금은 flush당 한 번이다.
+    - flush_interval_s마다 백그라운드 스레드가 flush → DB 반영 지연은 최대 약 flush_interval_s
+    - 대기 중인 제보가 max_pending개를 넘으면 주기를 기다리지 않고 바로 flush
+    - stop()에서 남은 증감분을 마지막으로 flush (서버 종료 시)
+    flush가 실패하면 증감분을 버퍼에 되돌려 다음 주기에 다시 시도한다.
+    """
+
+    def __init__(
+        self,
+        report_repo: ReportRepository,
+        flush_interval_s: float = DEFAULT_FLUSH_INTERVAL_S,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        hazard_overlay=None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.report_repo = report_repo
+        self.flush_interval_s = flush_interval_s
+        self.max_pending = max_pending
+        self.hazard_overlay = hazard_overlay
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: Dict[str, FeedbackDelta] = {}
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.last_flush_at: float | None = None
+        self.flushed_reports = 0
+
+    # --- 증감 기록 ---
+    def add(self, report_id: str, delta: FeedbackDelta) -> None:
+        if delta.is_zero():
+            return
+        with self._lock:
+            pending = self._pending.setdefault(report_id, FeedbackDelta())
+            pending.merge(delta)
+            full = len(self._pending) >= self.max_pending
+        if full:
+            if self._thread is not None:
+                self._wakeup.set()
+            else:
+                self.flush()
+
+    def pending(self, report_id: str) -> FeedbackDelta:
+        """아직 DB에 반영되지 않은 증감분 (없으면 0)"""
+        with self._lock:
+            delta = self._pending.get(report_id)
+            return FeedbackDelta().merge(delta) if delta else FeedbackDelta()
+
+    def discard(self, report_id: str) -> None:
+        """삭제된 제보의 대기 증감분 버리기"""
+        with self._lock:
+            self._pending.pop(report_id, None)
+
+    # --- DB 반영 ---
+    def flush(self) -> int:
+        """대기 증감분을 한 번의 배치 UPDATE로 반영. 반영한 제보 수 반환"""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            batch = {k: v for k, v in batch.items() if not v.is_zero()}
+            if not batch:
+                self.last_flush_at = self._clock()
+                return 0
+
+            try:
+                updated = self.report_repo.apply_feedback_deltas(batch)
+            except Exception as e:
+                logger.warning(f"Feedback counter flush failed: {e}")
+                with self._lock:
+                    for report_id, delta in batch.items():
+                        self._pending.setdefault(report_id, FeedbackDelta()).merge(
+                            delta
+                        )
+                return 0
+
+            self.last_flush_at = self._clock()
+            self.flushed_reports += len(batch)
+
+        # 평가 수가 바뀌면 위험도도 바뀜 → 승인된 제보면 경로 페널티 갱신
+        if self.hazard_overlay:
+            for report in updated:
+                if report.status == "APPROVED":
+                    self.hazard_overlay.update_report(report)
+        return len(batch)
+
+    # --- 백그라운드 flush ---
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="feedback-counter-flush", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """백그라운드 flush 중지 후 남은 증감분 반영"""
+        if self._thread is not None:
+            self._stopped.set()
+            self._wakeup.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval_s)
+            self._wakeup.clear()
+            self.flush()
+
+
+def create_feedback_buffer(
+    enabled: bool,
+    report_repo: ReportRepository,
+    flush_interval_s: float = DEFAULT_FLUSH_INTERVAL_S,
+    max_pending: int = DEFAULT_MAX_PENDING,
+    hazard_overlay=None,
+) -> FeedbackCounterBuffer | None:
+    """write-behind 비활성화 시 None (평가마다 바로 DB 반영)"""
+    if not enabled:
+        return None
+    return FeedbackCounterBuffer(
+        report_repo, flush_interval_s, max_pending, hazard_overlay=hazard_overlay
+    )
@@ -0,0 +1,206 @@
+import asyncio
+from typing import List
+
+from common.logger import logger
+from report.domain.outbox import OutboxEvent
+from report.domain.repository.outbox_repo import OutboxRepository
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_POLL_INTERVAL_S = 1.0
+DEFAULT_LEASE_S = 30.0
+DEFAULT_RETRY_BACKOFF_S = 1.0
+DEFAULT_MAX_BACKOFF_S = 60.0
+DEFAULT_MAX_ATTEMPTS = 20
+
+
+class OutboxRelay:
+    """
+    event_outbox 테이블에 쌓인 제보 이벤트를 EventBus로 묶어 발행한다 (transactional outbox).
+    이벤트는 제보 변경과 같은 트랜잭션으로 기록되므로 요청은 브로커를 기다리지 않고,
+    발행 전에 프로세스가 죽어도 재시작 후 릴레이가 이어서 보낸다.
+    - batch_size개씩 claim → publish_batch(confirm 대기) → outbox에서 삭제
+    - 새 이벤트가 커밋되면 notify()로 바로 깨우고, 아니면 poll_interval_s마다 확인
+      (다른 프로세스가 쓴 이벤트나 재시작 전에 남은 이벤트도 이 주기로 나간다)
+    - 발행이 실패한 배치는 한 건씩 다시 보내 실패한 이벤트만 남긴다 (한 건 때문에 배치 전체가 막히지 않게).
+      한 건도 나가지 않으면(앞의 두 건과 마지막 건이 모두 실패하면) 브로커 문제로 보고 lease만 푼다.
+      실패가 이어지면 retry_backoff_s부터 두 배씩 max_backoff_s까지 늘려 가며 다시 시도
+    - 다른 이벤트는 나갔는데 혼자 실패한 경우만 attempts를 세고, max_attempts번이 되면 park
+      (outbox에 남기되 더 이상 가져가지 않음). 브로커 장애가 길어져도 이벤트는 park되지 않는다
+    at-least-once: 발행 후 삭제 전에 죽으면 lease_s 뒤 같은 이벤트가 다시 나갈 수 있다.
+    여러 프로세스가 함께 돌면 SKIP LOCKED로 배치를 나눠 가져가므로 프로세스 간 순서는 보장하지 않는다.
+    """
+
+    def __init__(
+        self,
+        outbox_repo: OutboxRepository,
+        event_bus,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        poll_interval_s: float = DEFAULT_POLL_INTERVAL_S,
+        lease_s: float = DEFAULT_LEASE_S,
+        retry_backoff_s: float = DEFAULT_RETRY_BACKOFF_S,
+        max_backoff_s: float = DEFAULT_MAX_BACKOFF_S,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ):
+        self.outbox_repo = outbox_repo
+        self.event_bus = event_bus
+        self.batch_size = batch_size
+        self.poll_interval_s = poll_interval_s
+        self.lease_s = lease_s
+        self.retry_backoff_s = retry_backoff_s
+        self.max_backoff_s = max_backoff_s
+        self.max_attempts = max_attempts
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._task: asyncio.Task | None = None
+        self.published = 0
+        self.batches = 0
+        self.failed_batches = 0
+        self.parked = 0
+
+    def notify(self) -> None:
+        """이벤트가 커밋됐음을 알림 (poll 주기를 기다리지 않고 발행)"""
+        self._wakeup.set()
+
+    async def relay_once(self) -> int:
+        """outbox에서 한 배치를 가져와 발행. 발행한 이벤트 수 반환"""
+        events: List[OutboxEvent] = await asyncio.to_thread(
+            self.outbox_repo.claim, self.batch_size, self.lease_s
+        )
+        if not events:
+            return 0
+        try:
+            await self._publish(events)
+        except Exception:
+            self.failed_batches += 1
+            published = 0
+            if len(events) > 1:
+                published = await self._publish_one_by_one(events)
+            if not published:
+                # 브로커 문제로 보고 attempts는 그대로 둔 채 lease만 풂
+                await asyncio.to_thread(
+                    self.outbox_repo.release, [event.outbox_id for event in events]
+                )
+                raise
+            return published
+        await asyncio.to_thread(
+            self.outbox_repo.mark_published, [event.outbox_id for event in events]
+        )
+        self.published += len(events)
+        self.batches += 1
+        return len(events)
+
+    async def _publish(self, events: List[OutboxEvent]) -> None:
+        await self.event_bus.publish_batch(
+            [(event.routing_key, event.payload) for event in events]
+        )
+
+    async def _publish_one_by_one(self, events: List[OutboxEvent]) -> int:
+        """
+        실패한 배치를 한 건씩 다시 보내 발행된 것은 지우고, 혼자 실패한 것만 실패로 센다.
+        한 건도 나가지 않으면 아무것도 건드리지 않고 0 반환 (호출한 쪽이 lease를 풂)
+        """
+        order = list(events)
+        if len(order) > 2:
+            # 앞의 두 건이 함께 나쁜 이벤트여도 브로커 상태를 알 수 있게 세 번째로 마지막 건을 보냄
+            order.insert(2, order.pop())
+        published: List[int] = []
+        failed: List[int] = []
+        for event in order:
+            try:
+                await self._publish([event])
+            except Exception as e:
+                logger.warning(f"Outbox event {event.outbox_id} failed to publish: {e}")
+                failed.append(event.outbox_id)
+                if len(failed) >= 3 and not published:
+                    return 0
+                continue
+            published.append(event.outbox_id)
+        if not published:
+            return 0
+        await asyncio.to_thread(self.outbox_repo.mark_published, published)
+        self.published += len(published)
+        self.batches += 1
+        parked = await asyncio.to_thread(
+            self.outbox_repo.record_failure, failed, self.max_attempts
+        )
+        if parked:
+            self.parked += len(parked)
+            logger.error(
+                f"Outbox events {parked} parked after {self.max_attempts} attempts"
+            )
+        return len(published)
+
+    # --- 백그라운드 발행 ---
+    def start(self) -> None:
+        """백그라운드 릴레이 태스크 시작 (이벤트 루프 안에서 호출)"""
+        if self._task is not None:
+            return
+        self._stopping = False
+        self._task = asyncio.create_task(self._run(), name="outbox-relay")
+
+    async def stop(self, timeout_s: float = 5.0) -> None:
+        """진행 중인 배치까지 보내고 중지 (남은 이벤트는 outbox에 남아 재시작 후 발행)"""
+        if self._task is None:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        done, _ = await asyncio.wait({self._task}, timeout=timeout_s)
+        if not done:
+            # EventBus가 곧 닫히므로 발행 중인 배치는 버리고 태스크를 끝낸다 (lease가 끝나면 다시 나감)
+            logger.warning("Outbox relay stopped before finishing its batch")
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def _run(self) -> None:
+        backoff_s = self.retry_backoff_s
+        while not self._stopping:
+            try:
+                relayed = await self.relay_once()
+            except Exception as e:
+                logger.warning(f"Outbox relay failed: {e}")
+                await self._wait(backoff_s)
+                backoff_s = min(backoff_s * 2, self.max_backoff_s)
+                continue
+            backoff_s = self.retry_backoff_s
+            # 배치가 가득 찼으면 더 남았을 수 있으니 바로 다음 배치
+            if relayed < self.batch_size:
+                await self._wait(self.poll_interval_s)
+
+    async def _wait(self, timeout_s: float) -> None:
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout_s)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    def stats(self) -> dict:
+        return {
+            "running": self._task is not None,
+            "published": self.published,
+            "batches": self.batches,
+            "failed_batches": self.failed_batches,
+            "parked": self.parked,
+        }
+
+
+def create_outbox_relay(
+    enabled: bool,
+    outbox_repo: OutboxRepository,
+    event_bus,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    poll_interval_s: float = DEFAULT_POLL_INTERVAL_S,
+    lease_s: float = DEFAULT_LEASE_S,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+) -> OutboxRelay | None:
+    """비활성화 시 None (서비스가 제보 변경 후 EventBus로 바로 발행)"""
+    if not enabled:
+        return None
+    return OutboxRelay(
+        outbox_repo,
+        event_bus,
+        batch_size=batch_size,
+        poll_interval_s=poll_interval_s,
+        lease_s=lease_s,
+        max_attempts=max_attempts,
+    )
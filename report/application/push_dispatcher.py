@@ -0,0 +1,211 @@
+import asyncio
+import statistics
+import time
+from collections import deque
+from typing import Callable, Dict, List, Tuple
+
+from common.logger import logger
+from report.domain.push import FAILED, RETRY, SENT, PushMessage, PushSender
+
+DEFAULT_MAX_QUEUE = 1000
+DEFAULT_WORKERS = 2
+DEFAULT_BATCH_SIZE = 500  # FCM send_each 요청 한 번의 메시지 한도
+DEFAULT_BATCH_WAIT_S = 0.05
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_BACKOFF_S = 0.5
+
+# 전송 지연 통계에 쓰는 최근 전송 횟수
+LATENCY_WINDOW = 1000
+
+
+class PushDispatcher:
+    """
+    푸시 알림을 요청 처리 흐름 밖에서 보낸다.
+    서비스는 enqueue()로 크기 제한 큐에 넣기만 하고(블로킹 없음), 워커들이 큐를 비우며
+    batch_wait_s 동안 모인 알림을 내용(제목/본문/data)이 서로 달라도 FCM send_each 요청 한 번에
+    batch_size개까지 보낸다 (제보마다 data의 reportId가 달라 내용별로 묶으면 거의 한 건씩 나가므로).
+    - 큐가 가득 차면 새 알림은 버리고 dropped로 센다 (요청 지연보다 알림 누락을 택함)
+    - 일시적 실패(RETRY)는 backoff_s * 2^시도횟수 뒤 다시 큐에 넣고, max_retries를 넘으면 failed
+    - stats()로 큐 길이/전송 지연/실패 수를 확인한다
+    """
+
+    def __init__(
+        self,
+        sender: PushSender,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        workers: int = DEFAULT_WORKERS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_wait_s: float = DEFAULT_BATCH_WAIT_S,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_backoff_s: float = DEFAULT_RETRY_BACKOFF_S,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.sender = sender
+        self.workers = workers
+        self.batch_size = batch_size
+        self.batch_wait_s = batch_wait_s
+        self.max_retries = max_retries
+        self.retry_backoff_s = retry_backoff_s
+        self._clock = clock
+        # (알림, 지금까지 시도 횟수)
+        self._queue: asyncio.Queue[Tuple[PushMessage, int]] = asyncio.Queue(max_queue)
+        self._tasks: List[asyncio.Task] = []
+        self._retries: set[asyncio.Task] = set()
+        self._latencies: deque = deque(maxlen=LATENCY_WINDOW)
+        self.enqueued = 0
+        self.sent = 0
+        self.failed = 0
+        self.retried = 0
+        self.dropped = 0
+        self.send_calls = 0
+
+    # --- 서비스에서 호출 ---
+    def enqueue(self, message: PushMessage) -> bool:
+        """알림을 큐에 넣기 (가득 차면 버리고 False)"""
+        if not message.token:
+            return False
+        try:
+            self._queue.put_nowait((message, 0))
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning(f"Push queue full — dropped push to {message.token[:8]}…")
+            return False
+        self.enqueued += 1
+        return True
+
+    # --- 워커 ---
+    def start(self) -> None:
+        """워커 시작 (이벤트 루프 안에서 호출)"""
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._work(), name=f"push-worker-{i}")
+            for i in range(self.workers)
+        ]
+
+    async def stop(self, timeout_s: float = 5.0) -> None:
+        """큐에 남은 알림을 timeout_s까지 보내고 워커/재시도 대기 중지"""
+        if self._tasks:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout_s)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Push dispatcher stopped with {self._queue.qsize()} queued"
+                )
+        for task in [*self._tasks, *self._retries]:
+            task.cancel()
+        await asyncio.gather(*self._tasks, *self._retries, return_exceptions=True)
+        self._tasks = []
+        self._retries.clear()
+
+    async def _work(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self.dispatch(batch)
+            except Exception as e:
+                logger.warning(f"Push dispatch failed: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _next_batch(self) -> List[Tuple[PushMessage, int]]:
+        """첫 알림이 오면 batch_wait_s 동안 더 모아서 최대 batch_size개"""
+        batch = [await self._queue.get()]
+        if self.batch_wait_s > 0:
+            await asyncio.sleep(self.batch_wait_s)
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    async def dispatch(self, batch: List[Tuple[PushMessage, int]]) -> None:
+        """batch_size개씩 send_each 한 번으로 전송 (같은 기기로 가는 같은 알림은 한 번만)"""
+        unique: Dict[Tuple, Tuple[PushMessage, int]] = {}
+        for message, attempt in batch:
+            unique.setdefault(message.dedupe_key(), (message, attempt))
+
+        pending = list(unique.values())
+        for i in range(0, len(pending), self.batch_size):
+            await self._send(pending[i : i + self.batch_size])
+
+    async def _send(self, items: List[Tuple[PushMessage, int]]) -> None:
+        messages = [message for message, _ in items]
+        t0 = self._clock()
+        try:
+            results = await asyncio.to_thread(self.sender.send_each, messages)
+        except Exception as e:
+            logger.warning(f"Push send failed ({len(messages)} messages): {e}")
+            results = [RETRY] * len(messages)
+        self._latencies.append(self._clock() - t0)
+        self.send_calls += 1
+
+        for (message, attempt), result in zip(items, results):
+            if result == SENT:
+                self.sent += 1
+            elif result == RETRY and attempt < self.max_retries:
+                self._schedule_retry(message, attempt + 1)
+            else:
+                self.failed += 1
+
+    def _schedule_retry(self, message: PushMessage, attempt: int) -> None:
+        self.retried += 1
+        delay = self.retry_backoff_s * 2 ** (attempt - 1)
+        task = asyncio.create_task(self._requeue(message, attempt, delay))
+        self._retries.add(task)
+        task.add_done_callback(self._retries.discard)
+
+    async def _requeue(self, message: PushMessage, attempt: int, delay: float):
+        await asyncio.sleep(delay)
+        try:
+            self._queue.put_nowait((message, attempt))
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    # --- 모니터링 ---
+    def stats(self) -> dict:
+        latencies = sorted(self._latencies)
+        return {
+            "queue_depth": self._queue.qsize(),
+            "retry_waiting": len(self._retries),
+            "enqueued": self.enqueued,
+            "sent": self.sent,
+            "failed": self.failed,
+            "retried": self.retried,
+            "dropped": self.dropped,
+            "send_calls": self.send_calls,
+            "send_p50_ms": (
+                round(statistics.median(latencies) * 1000, 1) if latencies else None
+            ),
+            "send_p99_ms": (
+                round(latencies[max(int(len(latencies) * 0.99) - 1, 0)] * 1000, 1)
+                if latencies
+                else None
+            ),
+        }
+
+
+def create_push_dispatcher(
+    enabled: bool,
+    sender: PushSender,
+    max_queue: int = DEFAULT_MAX_QUEUE,
+    workers: int = DEFAULT_WORKERS,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    batch_wait_s: float = DEFAULT_BATCH_WAIT_S,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    retry_backoff_s: float = DEFAULT_RETRY_BACKOFF_S,
+) -> PushDispatcher | None:
+    """비활성화 시 None (서비스가 스레드에서 바로 send_push)"""
+    if not enabled:
+        return None
+    return PushDispatcher(
+        sender,
+        max_queue=max_queue,
+        workers=workers,
+        batch_size=batch_size,
+        batch_wait_s=batch_wait_s,
+        max_retries=max_retries,
+        retry_backoff_s=retry_backoff_s,
+    )
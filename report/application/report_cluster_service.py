@@ -0,0 +1,112 @@
+from typing import Dict, List, Tuple
+from uuid import uuid4
+
+import numpy as np
+
+from common.logger import logger
+from report.domain.report_cluster import ReportCluster
+from report.domain.repository.report_cluster_repo import ReportClusterRepository
+from route.algorithms.vectorized import haversine_vec
+
+# 새 제보를 기존 클러스터에 넣는 중심점 거리 (m)
+CLUSTER_RADIUS = 500
+# 일괄 재클러스터링 DBSCAN 파라미터 (승인 제보 기준)
+RECLUSTER_EPS_M = 150
+RECLUSTER_MIN_POINTS = 2
+
+
+def build_clusters(
+    points: List[tuple], radius_m: float = CLUSTER_RADIUS
+) -> Tuple[List[ReportCluster], Dict[str, str]]:
+    """
+    재클러스터링이 읽은 제보 위치 [(report_id, lat, lng, status, label), ...] 로
+    클러스터 목록과 제보별 cluster_id 배정을 만든다.
+    - DBSCAN 라벨이 같은 승인 제보 → 한 클러스터, 노이즈 승인 제보 → 단독 클러스터
+    - 미승인 제보 → 승인 제보 클러스터 중심점 중 radius_m 이내 가장 가까운 곳,
+      없으면 단독 클러스터
+    중심점과 개수는 미승인 제보까지 포함한 전체 소속 제보 기준 (assign_cluster와 동일)
+    """
+    members: Dict[object, List[tuple]] = {}
+    others = []
+    for report_id, lat, lng, status, label in points:
+        if status != "APPROVED":
+            others.append((report_id, lat, lng))
+        elif label is None:
+            members[("noise", report_id)] = [(report_id, lat, lng)]
+        else:
+            members.setdefault(("label", label), []).append((report_id, lat, lng))
+
+    groups = list(members.values())
+    if others and groups:
+        centers = np.array(
+            [np.mean([(lat, lng) for _, lat, lng in g], axis=0) for g in groups]
+        )
+        for report_id, lat, lng in others:
+            dist = haversine_vec(lat, lng, centers[:, 0], centers[:, 1])
+            nearest = int(np.argmin(dist))
+            if dist[nearest] <= radius_m:
+                groups[nearest].append((report_id, lat, lng))
+            else:
+                groups.append([(report_id, lat, lng)])
+    else:
+        groups.extend([p] for p in others)
+
+    clusters = []
+    assignments = {}
+    for group in groups:
+        cluster_id = str(uuid4())
+        clusters.append(
+            ReportCluster(
+                cluster_id=cluster_id,
+                center_lat=sum(lat for _, lat, _ in group) / len(group),
+                center_lng=sum(lng for _, _, lng in group) / len(group),
+                member_count=len(group),
+            )
+        )
+        for report_id, _, _ in group:
+            assignments[report_id] = cluster_id
+    return clusters, assignments
+
+
+class ReportClusterService:
+    """
+    제보 클러스터 중심점/개수를 관리한다.
+    새 제보는 가장 가까운 중심점(radius_m 이내) 클러스터에 넣고 중심점을 증분 갱신하며,
+    제보가 쌓여 중심점이 밀리거나 이어 붙는 문제는 주기적인 DBSCAN 재클러스터링으로 정리한다.
+    """
+
+    def __init__(
+        self,
+        repo: ReportClusterRepository,
+        radius_m: float = CLUSTER_RADIUS,
+        eps_m: float = RECLUSTER_EPS_M,
+        min_points: int = RECLUSTER_MIN_POINTS,
+    ):
+        self.repo = repo
+        self.radius_m = radius_m
+        self.eps_m = eps_m
+        self.min_points = min_points
+
+    def release(self, report) -> None:
+        """제보 삭제 시 소속 클러스터 중심점/개수 되돌리기"""
+        if (
+            report.cluster_id is None
+            or report.location_lat is None
+            or report.location_lng is None
+        ):
+            return
+        self.repo.remove_member(
+            report.cluster_id, report.location_lat, report.location_lng
+        )
+
+    def recluster(self) -> dict:
+        """승인 제보 전체 DBSCAN 후 클러스터 테이블과 report.cluster_id 일괄 재작성"""
+        clusters, assignments = self.repo.recluster(
+            self.eps_m,
+            self.min_points,
+            lambda points: build_clusters(points, self.radius_m),
+        )
+        logger.info(
+            f"Reclustered {len(assignments)} reports into {len(clusters)} clusters"
+        )
+        return {"clusters": len(clusters), "reports": len(assignments)}
@@ -1,37 +1,46 @@
 from fastapi import HTTPException
 from datetime import datetime, timezone
+from report.domain.report_evaluating import EVALUATIONS
 
 
 class ReportEvaluatingService:
-    def __init__(self, report_repo, evaluating_repo):
+    def __init__(
+        self, report_repo, evaluating_repo, hazard_overlay=None, feedback_buffer=None
+    ):
         self.report_repo = report_repo
         self.evaluating_repo = evaluating_repo
+        self.hazard_overlay = hazard_overlay
+        self.feedback_buffer = feedback_buffer
 
     async def evaluate_report(self, report_id: str, user_id: str, evaluation: str):
-        report = self.report_repo.get(report_id)
-        if not report:
-            raise HTTPException(status_code=404, detail="Report not found")
-
-        existing = self.evaluating_repo.find_user_evaluating(report_id, user_id)
-
-        if existing and existing.evaluation == evaluation:
-            # 동일 이모지 → 취소
-            self.evaluating_repo.delete_evaluating(existing.id)
-            self.report_repo.decrement_feedback(report_id, evaluation)
-            action = "cancelled"
-
-        elif existing and existing.evaluation != evaluation:
-            # 다른 이모지로 변경
-            self.report_repo.decrement_feedback(report_id, existing.evaluation)
-            self.report_repo.increment_feedback(report_id, evaluation)
-            self.evaluating_repo.update_evaluating(existing.id, evaluation)
-            action = "changed"
-
+        if evaluation not in EVALUATIONS:
+            raise HTTPException(
+                status_code=400, detail="잘못된 평가 값입니다. (good/normal/bad)"
+            )
+
+        # 동일 이모지 → 취소, 다른 이모지 → 변경, 처음 → 등록
+        if self.feedback_buffer:
+            # 평가 행만 바로 반영, 제보 카운트 증감은 모아서 배치 UPDATE
+            # (위험도 페널티 갱신도 flush 시점에)
+            result = self.evaluating_repo.toggle_evaluation(
+                report_id, user_id, evaluation
+            )
+            if result is None:
+                raise HTTPException(status_code=404, detail="Report not found")
+            action, delta = result
+            self.feedback_buffer.add(report_id, delta)
         else:
-            # 첫 평가 등록
-            self.evaluating_repo.add_evaluating(report_id, user_id, evaluation)
-            self.report_repo.increment_feedback(report_id, evaluation)
-            action = "added"
+            # 평가 행과 제보 카운트를 한 트랜잭션에서 함께 바꿔 동시 평가에도 카운트가 맞는다
+            result = self.evaluating_repo.apply_evaluation(
+                report_id, user_id, evaluation
+            )
+            if result is None:
+                raise HTTPException(status_code=404, detail="Report not found")
+            action, report = result
+
+            # 평가 수가 바뀌면 위험도도 바뀜 → 승인된 제보면 경로 페널티 갱신
+            if self.hazard_overlay and report.status == "APPROVED":
+                self.hazard_overlay.update_report(report)
 
         return {
             "report_id": report_id,
@@ -2,14 +2,25 @@ from datetime import datetime, timezone
 import ulid
 from fastapi import HTTPException
 from report.domain.report_not_there import ReportNotThere
+from report.domain.feedback_delta import FeedbackDelta
 from report.domain.repository.report_not_there_repo import ReportNotThereRepository
 from report.domain.repository.report_repo import ReportRepository
 
 
 class ReportNotThereService:
-    def __init__(self, repo: ReportNotThereRepository, report_repo: ReportRepository):
+    def __init__(
+        self,
+        repo: ReportNotThereRepository,
+        report_repo: ReportRepository,
+        hazard_overlay=None,
+        cluster_service=None,
+        feedback_buffer=None,
+    ):
         self.repo = repo
         self.report_repo = report_repo
+        self.hazard_overlay = hazard_overlay
+        self.cluster_service = cluster_service
+        self.feedback_buffer = feedback_buffer
 
     def mark_not_there(self, report_id: str, user_id: str):
         if self.repo.has_user_marked(report_id, user_id):
@@ -25,21 +36,35 @@ class ReportNotThereService:
         )
         self.repo.save(record)
 
-        # 제보 조회
-        report = self.report_repo.get(report_id)
-        if not report:
-            raise HTTPException(status_code=404, detail="제보를 찾을 수 없습니다.")
-
-        # not_there 카운트 증가
-        report.not_there = (report.not_there or 0) + 1
+        if self.feedback_buffer:
+            # 아직 DB에 반영 안 된 버퍼 증감분까지 포함해 센다 (카운트는 나중에 한 번에 반영)
+            report = self.report_repo.get(report_id)
+            if not report:
+                raise HTTPException(status_code=404, detail="제보를 찾을 수 없습니다.")
+            pending = self.feedback_buffer.pending(report_id)
+            report.not_there = (report.not_there or 0) + 1 + pending.not_there
+        else:
+            # DB에서 +1 (읽은 값을 덮어쓰지 않아 그 사이 들어온 평가 카운트를 지우지 않음)
+            updated = self.report_repo.apply_feedback_deltas(
+                {report_id: FeedbackDelta(not_there=1)}
+            )
+            if not updated:
+                raise HTTPException(status_code=404, detail="제보를 찾을 수 없습니다.")
+            report = updated[0]
 
         # 3 초과 시 자동 삭제
         if report.not_there > 3:
+            if self.feedback_buffer:
+                self.feedback_buffer.discard(report_id)
             self.report_repo.delete(report_id)
+            if self.hazard_overlay:
+                self.hazard_overlay.remove_report(report_id)
+            if self.cluster_service:
+                self.cluster_service.release(report)
             return {"message": "이 제보는 '이제 없어요'가 3회 초과되어 삭제되었습니다."}
 
-        # 그렇지 않으면 카운트만 업데이트
-        self.report_repo.update_feedback_counts(report)
+        if self.feedback_buffer:
+            self.feedback_buffer.add(report_id, FeedbackDelta(not_there=1))
         return {
             "message": "'이제 없어요'가 반영되었습니다.",
             "notThere": report.not_there,
@@ -1,19 +1,40 @@
-from fastapi import HTTPException, status
+import asyncio
+
+from fastapi import BackgroundTasks, HTTPException, status
 from datetime import datetime, timezone
-from typing import List
+from typing import List, Sequence
 
 from uuid import uuid4
 import ulid
-import math
 
+from common.logger import logger
 from user.domain.repository.user_repo import UserRepository
+from user.domain.user import User
 from report.domain.report import Report
+from report.domain.map_tile import (
+    AGGREGATE_MAX_ZOOM,
+    MAX_ZOOM,
+    BBox,
+    cell_deg,
+    tile_bbox,
+)
 from report.domain.repository.report_repo import ReportRepository
+from report.domain.risk_score import risk_score
+from report.domain.pagination import (
+    DEFAULT_PAGE_SIZE,
+    Page,
+    decode_cursor,
+    make_page,
+    parse_fields,
+    project,
+)
+from report.domain.push import PushMessage
+from report.domain.outbox import OutboxEvent
+from report.application.push_dispatcher import PushDispatcher
+from report.application.outbox_relay import OutboxRelay
 from report.infra.firebase import init_firebase, send_push
 
 
-CLUSTER_RADIUS = 500
-
 init_firebase()  # 앱 시작 시 한 번만 초기화
 
 
@@ -24,11 +45,66 @@ class ReportService:
         user_repo: UserRepository,
         event_bus,
         evaluating_repo=None,
+        hazard_overlay=None,
+        cluster_service=None,
+        map_aggregate_max_zoom: int = AGGREGATE_MAX_ZOOM,
+        push_dispatcher: PushDispatcher | None = None,
+        outbox_relay: OutboxRelay | None = None,
     ):
         self.repo = repo
         self.user_repo = user_repo
         self.event_bus = event_bus
         self.evaluating_repo = evaluating_repo
+        self.hazard_overlay = hazard_overlay
+        self.cluster_service = cluster_service
+        self.map_aggregate_max_zoom = map_aggregate_max_zoom
+        self.push_dispatcher = push_dispatcher
+        self.outbox_relay = outbox_relay
+
+    async def _push(self, token: str, title: str, body: str, data: dict) -> None:
+        """
+        푸시 알림 전송. 디스패처가 있으면 큐에 넣기만 하고(워커가 묶어서 전송),
+        없으면 블로킹 FCM 호출을 이벤트 루프 밖 스레드에서 실행
+        """
+        if self.push_dispatcher is not None:
+            self.push_dispatcher.enqueue(PushMessage(token, title, body, data))
+        else:
+            await asyncio.to_thread(
+                send_push, token=token, title=title, body=body, data=data
+            )
+
+    def _tx_events(self, events: List[OutboxEvent]) -> Sequence[OutboxEvent]:
+        """outbox를 쓰면 제보 쓰기 트랜잭션에 같이 기록할 이벤트 (아니면 없음)"""
+        return events if self.outbox_relay is not None else ()
+
+    async def _emit(self, events: List[OutboxEvent]) -> None:
+        """
+        제보 변경 커밋 후 이벤트 발행. outbox를 쓰면 이미 같은 트랜잭션으로 기록됐으니
+        릴레이만 깨우고, 아니면 EventBus로 바로 발행 (실패해도 제보 변경은 유지)
+        """
+        if self.outbox_relay is not None:
+            if events:
+                self.outbox_relay.notify()
+            return
+        for event in events:
+            try:
+                await self.event_bus.publish(event.routing_key, event.payload)
+            except Exception as e:
+                logger.warning(f"{event.routing_key} publish failed: {e}")
+
+    @staticmethod
+    def _created_event(report: Report, child: User) -> OutboxEvent:
+        return OutboxEvent(
+            "report.created",
+            {
+                "reportId": report.report_id,
+                "parentId": child.parent_id,
+                "childId": child.user_id,
+                "category": report.category,
+                "description": report.description,
+                "imageUrl": report.image_url,
+            },
+        )
 
     async def create_report(
         self,
@@ -39,9 +115,13 @@ class ReportService:
         image_url: str | None = None,
         category: str | None = None,
         description: str | None = None,
+        background_tasks: BackgroundTasks | None = None,
     ) -> Report:
-
-        user = self.user_repo.get(reporter_id)
+        """
+        제보 생성. DB 왕복은 유저+보호자 조인 조회 1번, 클러스터 배정+INSERT(+outbox) 트랜잭션 1번.
+        background_tasks가 있으면 보호자 푸시/이벤트 발행은 응답을 보낸 뒤 실행한다
+        """
+        user, parent = self.user_repo.get_with_parent(reporter_id)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
@@ -56,18 +136,7 @@ class ReportService:
         now = datetime.now(timezone.utc)
 
         # 부모는 바로 승인 처리
-        status = "APPROVED" if user.user_type == "parent" else "PENDING"
-
-        # 반경 500m 이내 기존 제보 조회
-        nearby_reports = self.repo.find_nearby_reports(
-            lat=location_lat, lng=location_lng, radius_m=CLUSTER_RADIUS
-        )
-
-        # 기존 클러스터 존재하면 동일 cluster_id 부여, 없으면 새로 생성
-        if nearby_reports:
-            cluster_id = nearby_reports[0].cluster_id or nearby_reports[0].report_id
-        else:
-            cluster_id = str(uuid4())
+        report_status = "APPROVED" if user.user_type == "parent" else "PENDING"
 
         report = Report(
             report_id=str(ulid.new()),
@@ -75,11 +144,11 @@ class ReportService:
             reporter_type=reporter_type,
             location_lat=location_lat,
             location_lng=location_lng,
-            cluster_id=cluster_id,
+            cluster_id=str(uuid4()),  # 가까운 클러스터가 없을 때 쓸 새 cluster_id
             image_url=image_url,
             category=category,
             description=description,
-            status=status,
+            status=report_status,
             good_count=0,
             normal_count=0,
             bad_count=0,
@@ -89,32 +158,46 @@ class ReportService:
             updated_at=now,
         )
 
-        saved = self.repo.save(report)
+        # 자녀 제보 → 보호자에게 보낼 report.created (outbox면 제보와 같은 트랜잭션으로 기록)
+        notify_parent = user.user_type == "child" and bool(user.parent_id)
+        events = [self._created_event(report, user)] if notify_parent else []
+
+        # 가장 가까운 클러스터 중심점(기본 500m 이내)에 배정 + 저장을 한 트랜잭션으로
+        if self.cluster_service:
+            saved = self.repo.save_with_cluster(
+                report, self.cluster_service.radius_m, events=self._tx_events(events)
+            )
+        else:
+            saved = self.repo.save(report, events=self._tx_events(events))
+
+        # 부모 제보는 바로 승인 → 상주 경로 위험 페널티에 반영
+        if self.hazard_overlay and saved.status == "APPROVED":
+            self.hazard_overlay.update_report(saved)
 
         # 자녀가 제보 생성 → 부모에게 실시간 이벤트 발행 및 푸시 전송
-        if user.user_type == "child" and user.parent_id:
-            parent = self.user_repo.get(user.parent_id)
-            if parent and getattr(parent, "fcm_token", None):
-                send_push(
-                    token=parent.fcm_token,
-                    title="제보 등록 알림",
-                    body="자녀가 새로운 제보를 등록했어요. 확인해보세요.",
-                    data={"reportId": saved.report_id},
+        if notify_parent:
+            if background_tasks is not None:
+                background_tasks.add_task(
+                    self.notify_report_created, saved, user, parent
                 )
+            else:
+                await self.notify_report_created(saved, user, parent)
 
-            await self.event_bus.publish(
-                "report.created",
-                {
-                    "reportId": saved.report_id,
-                    "parentId": user.parent_id,
-                    "childId": user.user_id,
-                    "category": saved.category,
-                    "description": saved.description,
-                    "imageUrl": saved.image_url,
-                },
+        return saved
+
+    async def notify_report_created(
+        self, report: Report, child: User, parent: User | None
+    ) -> None:
+        """자녀 제보 등록 → 보호자 푸시 + report.created 이벤트 (실패해도 제보는 유지)"""
+        if parent and getattr(parent, "fcm_token", None):
+            await self._push(
+                token=parent.fcm_token,
+                title="제보 등록 알림",
+                body="자녀가 새로운 제보를 등록했어요. 확인해보세요.",
+                data={"reportId": report.report_id},
             )
 
-        return saved
+        await self._emit([self._created_event(report, child)])
 
     def get_report(self, report_id: str, user_id: str | None = None):
         report = self.repo.get(report_id)
@@ -130,8 +213,32 @@ class ReportService:
 
         return report
 
-    def list_reports(self) -> List[Report]:
-        return self.repo.find_all()
+    def _page(
+        self, fetch, cursor: str | None, limit: int, fields: str | None, **kwargs
+    ) -> Page:
+        """
+        키셋 페이지 조회 공통 처리. limit + 1개를 읽어 다음 커서를 만들고,
+        fields 지정 시 SQL에서도 해당 컬럼만 읽어 dict로 반환한다.
+        """
+        try:
+            columns = parse_fields(fields, summary=kwargs.pop("summary", False))
+            after = decode_cursor(cursor) if cursor else None
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        rows = fetch(**kwargs, after=after, limit=limit + 1, columns=columns)
+        if columns is None:
+            return make_page(rows, limit, lambda r: (r.created_at, r.report_id))
+        page = make_page(rows, limit, lambda r: (r["created_at"], r["report_id"]))
+        return Page([project(r, columns) for r in page.items], page.next_cursor)
+
+    def list_reports(
+        self,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        fields: str | None = None,
+    ) -> Page:
+        return self._page(self.repo.find_all, cursor, limit, fields, summary=True)
 
     async def review_report(self, report_id: str, reviewer_id: str, action: str):
         """
@@ -169,33 +276,39 @@ class ReportService:
             )
 
         report.updated_at = datetime.now(timezone.utc)
-        updated = self.repo.update_status(report)
+        events = [
+            OutboxEvent(
+                "report.reviewed",
+                {
+                    "reportId": report.report_id,
+                    "childId": child.user_id,
+                    "status": report.status,
+                },
+            )
+        ]
+        updated = self.repo.update_status(report, events=self._tx_events(events))
+
+        if self.hazard_overlay and updated.status == "APPROVED":
+            self.hazard_overlay.update_report(updated)
 
         # 부모가 승인/반려 → 자녀에게 실시간 이벤트 발행 및 푸시 전송
         if child and getattr(child, "fcm_token", None):
             if updated.status == "APPROVED":
-                send_push(
+                await self._push(
                     token=child.fcm_token,
                     title="제보 승인 알림",
                     body="부모님이 제보를 승인했어요. 등록된 제보는 안전한 경로에 반영될 거예요!",
                     data={"reportId": updated.report_id},
                 )
             elif updated.status == "REJECTED":
-                send_push(
+                await self._push(
                     token=child.fcm_token,
                     title="제보 승인 알림",
                     body="부모님이 제보를 반려했어요. 내용을 수정해보세요!",
                     data={"reportId": updated.report_id},
                 )
 
-        await self.event_bus.publish(
-            "report.reviewed",
-            {
-                "reportId": updated.report_id,
-                "childId": child.user_id,
-                "status": updated.status,
-            },
-        )
+        await self._emit(events)
 
         return updated
 
@@ -214,42 +327,74 @@ class ReportService:
         )
         report.bad_count = (report.bad_count or 0) + (1 if feedback == "bad" else 0)
 
-        # 위험도 재계산
-        n_good = report.good_count
-        n_mid = report.normal_count
-        n_bad = report.bad_count
-        n = n_good + n_mid + n_bad
-
-        def risk_score_simplified_scaled(n_good, n_mid, n_bad):
-            n = n_good + n_mid + n_bad
-            if n == 0:
-                return 0.5
-
-            # 기본 평균 위험도
-            avg = (n_bad * 1.0 + n_mid * 0.5 + n_good * 0.0) / n
-
-            # 제보 수 기반 신뢰도 (데이터 많을수록 확신 ↑)
-            reliability = 1 - math.exp(-n / 10)
-
-            # 가변 스케일링 (데이터 많을수록 민감도 ↑)
-            scale = 0.5 + 0.5 * (1 - math.exp(-0.1 * n))
-
-            # 최종 점수: 중립 보정 + 신뢰도 반영 + 스케일 조정
-            return (avg * reliability + 0.5 * (1 - reliability)) * scale
-
-        report.score = risk_score_simplified_scaled(n_good, n_mid, n_bad)
+        # 위험도 재계산 (저장 시 DB 생성 컬럼도 같은 식으로 다시 계산)
+        n = report.good_count + report.normal_count + report.bad_count
+        report.risk_score = risk_score(
+            report.good_count, report.normal_count, report.bad_count
+        )
         report.total_feedbacks = n
         report.updated_at = datetime.now(timezone.utc)
 
-        return self.repo.update_feedback_counts(report)
+        updated = self.repo.update_feedback_counts(report)
+
+        # 위험도 변경 → 반경 안 세그먼트 페널티만 다시 계산
+        if self.hazard_overlay and updated:
+            self.hazard_overlay.update_report(updated)
+
+        return updated
 
     def get_reports_by_cluster_and_category(
+        self,
+        cluster_id: str,
+        category: str | None = None,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        fields: str | None = None,
+    ) -> Page:
+        return self._page(
+            self.repo.find_by_cluster_and_category,
+            cursor,
+            limit,
+            fields,
+            cluster_id=cluster_id,
+            category=category,
+        )
+
+    def count_reports_by_cluster_and_category(
         self, cluster_id: str, category: str | None = None
-    ):
-        return self.repo.find_by_cluster_and_category(cluster_id, category)
+    ) -> int:
+        return self.repo.count_by_cluster_and_category(cluster_id, category)
 
-    def get_latest_reports_by_cluster(self):
-        return self.repo.find_latest_per_cluster()
+    def get_latest_reports_by_cluster(
+        self,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        fields: str | None = None,
+    ) -> Page:
+        return self._page(
+            self.repo.find_latest_per_cluster, cursor, limit, fields, summary=True
+        )
+
+    def get_map_viewport(self, bbox: BBox, zoom: int) -> dict:
+        """
+        지도 영역 안 클러스터만 반환.
+        map_aggregate_max_zoom 이하 저줌에서는 격자별 클러스터/제보 개수만 반환한다.
+        """
+        if bbox.min_lat >= bbox.max_lat or bbox.min_lng >= bbox.max_lng:
+            raise HTTPException(status_code=400, detail="잘못된 지도 영역입니다.")
+        if not 0 <= zoom <= MAX_ZOOM:
+            raise HTTPException(status_code=400, detail="잘못된 줌 레벨입니다.")
+
+        if zoom <= self.map_aggregate_max_zoom:
+            cells = self.repo.aggregate_clusters_in_bbox(bbox, cell_deg(zoom))
+            return {"zoom": zoom, "aggregated": True, "cells": cells}
+        reports = self.repo.find_latest_per_cluster_in_bbox(bbox)
+        return {"zoom": zoom, "aggregated": False, "reports": reports}
+
+    def get_map_tile(self, z: int, x: int, y: int) -> dict:
+        if not 0 <= z <= MAX_ZOOM or not (0 <= x < 2**z and 0 <= y < 2**z):
+            raise HTTPException(status_code=400, detail="잘못된 타일 좌표입니다.")
+        return self.get_map_viewport(tile_bbox(z, x, y), z)
 
     async def update_report(
         self,
@@ -281,31 +426,37 @@ class ReportService:
         report.status = "PENDING"
         report.updated_at = datetime.now(timezone.utc)
 
-        updated = self.repo.update(report)
-
         # 자녀가 반려된 제보를 수정 시 → 부모에게 실시간 이벤트 발행 및 푸시 전송
         child = self.user_repo.get(requester_id)
+        events = []
+        if child and child.parent_id:
+            events.append(
+                OutboxEvent(
+                    "report.updated",
+                    {
+                        "reportId": report.report_id,
+                        "parentId": child.parent_id,
+                        "childId": child.user_id,
+                        "category": report.category,
+                        "description": report.description,
+                        "imageUrl": report.image_url,
+                    },
+                )
+            )
+
+        updated = self.repo.update(report, events=self._tx_events(events))
+
         if child and child.parent_id:
             parent = self.user_repo.get(child.parent_id)
             if parent and getattr(parent, "fcm_token", None):
-                send_push(
+                await self._push(
                     token=parent.fcm_token,
                     title="제보 수정 알림",
                     body="자녀가 반려된 제보를 수정했어요. 다시 검토해보세요.",
                     data={"reportId": updated.report_id},
                 )
 
-            await self.event_bus.publish(
-                "report.updated",
-                {
-                    "reportId": updated.report_id,
-                    "parentId": child.parent_id,
-                    "childId": child.user_id,
-                    "category": updated.category,
-                    "description": updated.description,
-                    "imageUrl": updated.image_url,
-                },
-            )
+        await self._emit(events)
 
         return updated
 
@@ -317,27 +468,38 @@ class ReportService:
         if report.reporter_id != requester_id:
             raise HTTPException(status_code=403, detail="삭제 권한이 없습니다.")
 
-        deleted_id = self.repo.delete(report_id)
-
         # 자녀가 반려된 제보 삭제 시 → 부모에게 실시간 이벤트 발행 및 푸시 전송
         child = self.user_repo.get(requester_id)
+        events = []
+        if child and child.parent_id:
+            events.append(
+                OutboxEvent(
+                    "report.deleted",
+                    {
+                        "reportId": report.report_id,
+                        "parentId": child.parent_id,
+                        "childId": child.user_id,
+                    },
+                )
+            )
+
+        deleted_id = self.repo.delete(report_id, events=self._tx_events(events))
+
+        if self.hazard_overlay:
+            self.hazard_overlay.remove_report(report_id)
+        if self.cluster_service:
+            self.cluster_service.release(report)
+
         if child and child.parent_id:
             parent = self.user_repo.get(child.parent_id)
             if parent and getattr(parent, "fcm_token", None):
-                send_push(
+                await self._push(
                     token=parent.fcm_token,
                     title="제보 삭제 알림",
                     body="자녀가 제보를 삭제했어요. 새로운 제보를 위해 격려해주세요.",
                     data={"reportId": report_id},
                 )
 
-            await self.event_bus.publish(
-                "report.deleted",
-                {
-                    "reportId": report.report_id,
-                    "parentId": child.parent_id,
-                    "childId": child.user_id,
-                },
-            )
+        await self._emit(events)
 
         return {"deleted": True, "report_id": deleted_id}
@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class FeedbackDelta:
+    """제보 하나의 평가/'이제 없어요' 카운트 증감분"""
+
+    good: int = 0
+    normal: int = 0
+    bad: int = 0
+    total: int = 0
+    not_there: int = 0
+
+    @classmethod
+    def evaluation(cls, evaluation: str, sign: int) -> "FeedbackDelta":
+        """평가 하나 추가(sign=1)/취소(sign=-1)"""
+        delta = cls(total=sign)
+        setattr(delta, evaluation, sign)
+        return delta
+
+    def merge(self, other: "FeedbackDelta") -> "FeedbackDelta":
+        self.good += other.good
+        self.normal += other.normal
+        self.bad += other.bad
+        self.total += other.total
+        self.not_there += other.not_there
+        return self
+
+    def is_zero(self) -> bool:
+        return not (
+            self.good or self.normal or self.bad or self.total or self.not_there
+        )
@@ -0,0 +1,48 @@
+import math
+from typing import NamedTuple
+
+from pydantic import BaseModel, Field, ConfigDict
+
+# 이 줌 이하에서는 클러스터 대신 격자별 집계 개수를 내려준다
+AGGREGATE_MAX_ZOOM = 12
+# 타일 한 변을 나누는 집계 격자 수
+CELLS_PER_TILE = 8
+MAX_ZOOM = 22
+
+
+class BBox(NamedTuple):
+    min_lat: float
+    min_lng: float
+    max_lat: float
+    max_lng: float
+
+
+class ClusterCell(BaseModel):
+    """저줌 지도용 격자 집계 (격자 안 클러스터 중심점 평균 위치)"""
+
+    lat: float
+    lng: float
+    cluster_count: int = Field(..., alias="clusterCount")
+    report_count: int = Field(..., alias="reportCount")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+def tile_bbox(z: int, x: int, y: int) -> BBox:
+    """Web Mercator(XYZ) 타일 z/x/y → 위도/경도 영역"""
+    n = 2**z
+
+    def lat(ty):
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * ty / n))))
+
+    return BBox(
+        min_lat=lat(y + 1),
+        min_lng=x / n * 360.0 - 180.0,
+        max_lat=lat(y),
+        max_lng=(x + 1) / n * 360.0 - 180.0,
+    )
+
+
+def cell_deg(zoom: int) -> float:
+    """줌 레벨별 집계 격자 크기 (도) — 타일 하나가 CELLS_PER_TILE² 칸"""
+    return 360.0 / 2**zoom / CELLS_PER_TILE
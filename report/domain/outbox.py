@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from typing import Dict
+
+
+@dataclass(frozen=True)
+class OutboxEvent:
+    """
+    제보 변경과 같은 트랜잭션으로 event_outbox 테이블에 쓰는 도메인 이벤트.
+    outbox_id는 저장된 뒤(릴레이가 가져갈 때)에만 채워진다
+    """
+
+    routing_key: str
+    payload: Dict = field(default_factory=dict)
+    outbox_id: int | None = None
@@ -0,0 +1,103 @@
+import base64
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from report.domain.report import Report
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+# fields= 로 고를 수 있는 report 테이블 컬럼
+REPORT_COLUMNS = [
+    "report_id",
+    "reporter_id",
+    "reporter_type",
+    "location_lat",
+    "location_lng",
+    "cluster_id",
+    "image_url",
+    "category",
+    "description",
+    "status",
+    "good_count",
+    "normal_count",
+    "bad_count",
+    "total_feedbacks",
+    "risk_score",
+    "not_there",
+    "created_at",
+    "updated_at",
+]
+# 클러스터 요약 조회(latest-by-cluster)에서만 고를 수 있는 값
+SUMMARY_COLUMNS = ["member_count", "cluster_score"]
+
+# 커서 계산용으로 항상 조회하는 컬럼
+KEYSET_COLUMNS = ["created_at", "report_id"]
+
+
+def _alias(column: str) -> str:
+    return Report.model_fields[column].alias or column
+
+
+ALIASES = {_alias(c): c for c in REPORT_COLUMNS + SUMMARY_COLUMNS}
+
+
+class Page(NamedTuple):
+    items: List[Any]  # Report, 또는 fields 지정 시 alias → 값 dict
+    next_cursor: Optional[str]
+
+
+def parse_fields(fields: str | None, summary: bool = False) -> List[str] | None:
+    """
+    "reportId,category,locationLat" → 컬럼명 리스트 (snake_case도 허용).
+    모르는 필드면 ValueError
+    """
+    if not fields:
+        return None
+    allowed = set(REPORT_COLUMNS + (SUMMARY_COLUMNS if summary else []))
+    columns = []
+    for name in (f.strip() for f in fields.split(",")):
+        if not name:
+            continue
+        column = ALIASES.get(name, name)
+        if column not in allowed:
+            raise ValueError(f"지원하지 않는 필드입니다: {name}")
+        if column not in columns:
+            columns.append(column)
+    return columns or None
+
+
+def query_columns(columns: List[str]) -> List[str]:
+    """SQL에서 읽을 컬럼 (요청 필드 + 커서용 컬럼)"""
+    return columns + [c for c in KEYSET_COLUMNS if c not in columns]
+
+
+def project(row: Dict[str, Any], columns: List[str]) -> Dict[str, Any]:
+    """DB 행 → 요청한 필드만 담은 응답 dict (camelCase)"""
+    return {_alias(c): row[c] for c in columns}
+
+
+def encode_cursor(created_at: datetime, report_id: str) -> str:
+    raw = f"{created_at.isoformat()}|{report_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """잘못된 커서면 ValueError"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, report_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(created_at), report_id
+    except Exception as e:
+        raise ValueError("잘못된 커서입니다.") from e
+
+
+def make_page(rows: List[Any], limit: int, key) -> Page:
+    """
+    limit + 1개를 조회한 결과로 페이지 구성 (남는 1개로 다음 페이지 유무 판단).
+    key(row) → (created_at, report_id)
+    """
+    if len(rows) <= limit:
+        return Page(rows, None)
+    rows = rows[:limit]
+    return Page(rows, encode_cursor(*key(rows[-1])))
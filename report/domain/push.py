@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+# 토큰별 전송 결과
+SENT = "sent"
+RETRY = "retry"  # 일시적 실패 (FCM 과부하/타임아웃 등) → 백오프 후 재시도
+FAILED = "failed"  # 재시도해도 안 되는 실패 (만료/잘못된 토큰 등)
+
+
+@dataclass(frozen=True)
+class PushMessage:
+    """기기 하나로 보낼 푸시 알림"""
+
+    token: str
+    title: str
+    body: str
+    data: Dict[str, str] = field(default_factory=dict)
+
+    def dedupe_key(self) -> Tuple:
+        """같은 기기로 가는 같은 알림 (한 배치에 중복으로 들어오면 한 번만 보냄)"""
+        return (self.token, self.title, self.body, tuple(sorted(self.data.items())))
+
+
+class PushSender(ABC):
+    @abstractmethod
+    def send_each(self, messages: List[PushMessage]) -> List[str]:
+        """
+        내용이 서로 다른 알림 여러 개를 요청 한 번에 전송 (블로킹, 최대 500개).
+        messages와 같은 순서로 알림별 결과(SENT/RETRY/FAILED)를 반환
+        """
+        raise NotImplementedError
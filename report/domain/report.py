@@ -23,10 +23,15 @@ class Report(BaseModel):
     normal_count: Optional[int] = Field(0, alias="normalCount")  # 이모지는 '보통'
     bad_count: Optional[int] = Field(0, alias="badCount")  # 이모지는 '좋음'
     total_feedbacks: Optional[int] = Field(0, alias="totalFeedbacks")
+    risk_score: Optional[float] = Field(None, alias="riskScore")  # DB 생성 컬럼
 
     # 사용자의 평가 종류 (good/normal/bad/null)
     user_evaluation: Optional[str] = Field(None, alias="userEvaluation")
 
+    # 클러스터 요약 (클러스터별 최신 제보 조회 시에만 채워짐)
+    member_count: Optional[int] = Field(None, alias="memberCount")
+    cluster_score: Optional[float] = Field(None, alias="clusterScore")
+
     not_there: Optional[int] = Field(None, alias="notThere")
     created_at: Optional[datetime] = Field(None, alias="createdAt")
     updated_at: Optional[datetime] = Field(None, alias="updatedAt")
@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field, ConfigDict
+from datetime import datetime
+from typing import Optional
+
+
+class ReportCluster(BaseModel):
+    cluster_id: str = Field(..., alias="clusterId")
+
+    # 소속 제보 위치의 평균 (제보 추가/삭제 시 증분 갱신)
+    center_lat: float = Field(..., alias="centerLat")
+    center_lng: float = Field(..., alias="centerLng")
+    member_count: int = Field(0, alias="memberCount")
+
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
+
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
@@ -2,6 +2,8 @@ from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
 from typing import Optional
 
+EVALUATIONS = ("good", "normal", "bad")
+
 
 class ReportEvaluating(BaseModel):
     id: str
@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+from typing import List
+from report.domain.outbox import OutboxEvent
+
+
+class OutboxRepository(ABC):
+    @abstractmethod
+    def claim(self, limit: int, lease_s: float) -> List[OutboxEvent]:
+        """
+        아직 발행되지 않은 이벤트를 오래된 순으로 limit개 가져오고 lease_s 동안 다른
+        릴레이가 못 가져가게 잡아 둔다 (발행 중 프로세스가 죽으면 lease가 끝난 뒤 다시 나감)
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def mark_published(self, outbox_ids: List[int]) -> None:
+        """발행 확인된 이벤트를 outbox에서 제거"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def release(self, outbox_ids: List[int]) -> None:
+        """발행 실패한 이벤트의 lease를 풀어 다음 claim에서 다시 가져가게 함"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def record_failure(self, outbox_ids: List[int], max_attempts: int) -> List[int]:
+        """
+        다른 이벤트는 발행됐는데 이 이벤트만 실패했을 때: attempts를 늘리고 lease를 푼다.
+        attempts가 max_attempts에 닿은 이벤트는 따로 빼 두고(park, 더 이상 claim하지 않고
+        outbox에 남겨 운영자가 확인) 그 outbox_id 목록을 반환
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def count_pending(self) -> int:
+        """발행 대기 중인 이벤트 수 (따로 빼 둔 이벤트 제외)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def count_parked(self) -> int:
+        """발행을 포기하고 따로 빼 둔 이벤트 수"""
+        raise NotImplementedError
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Tuple
+from report.domain.report_cluster import ReportCluster
+
+
+class ReportClusterRepository(ABC):
+    @abstractmethod
+    def remove_member(self, cluster_id: str, lat: float, lng: float) -> None:
+        """제보 삭제 시 중심점/개수 되돌리기 (마지막 제보면 클러스터 삭제)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get(self, cluster_id: str) -> Optional[ReportCluster]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_all(self) -> List[ReportCluster]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def recluster(
+        self,
+        eps_m: float,
+        min_points: int,
+        build: Callable[[List[tuple]], Tuple[List[ReportCluster], Dict[str, str]]],
+    ) -> Tuple[List[ReportCluster], Dict[str, str]]:
+        """
+        한 트랜잭션에서: 새 제보 배정을 막고(클러스터 테이블 잠금) → 위치가 있는 전체 제보의
+        (report_id, lat, lng, status, label)을 읽어 build로 클러스터/배정을 만들고 →
+        클러스터 테이블 교체 + report.cluster_id 일괄 갱신 + 클러스터 요약 재작성.
+        label은 승인 제보끼리 DBSCAN(eps_m, min_points)을 돌린 결과 (노이즈/미승인은 None).
+        build 결과 (clusters, assignments)를 반환
+        """
+        raise NotImplementedError
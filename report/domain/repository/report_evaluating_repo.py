@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Tuple
+from report.domain.report import Report
 from report.domain.report_evaluating import ReportEvaluating
+from report.domain.feedback_delta import FeedbackDelta
 
 
 class ReportEvaluatingRepository(ABC):
@@ -21,3 +23,23 @@ class ReportEvaluatingRepository(ABC):
     @abstractmethod
     def delete_evaluating(self, evaluating_id: str) -> None:
         pass
+
+    @abstractmethod
+    def apply_evaluation(
+        self, report_id: str, user_id: str, evaluation: str
+    ) -> Optional[Tuple[str, Report]]:
+        """
+        사용자 평가 토글(추가/변경/취소)과 제보 평가 카운트 증감을 한 트랜잭션으로 처리.
+        (action, 갱신된 제보) 반환, 제보가 없으면 None
+        """
+        pass
+
+    @abstractmethod
+    def toggle_evaluation(
+        self, report_id: str, user_id: str, evaluation: str
+    ) -> Optional[Tuple[str, FeedbackDelta]]:
+        """
+        사용자 평가 행만 토글하고 제보 카운트 증감분을 반환 (카운트는 호출 측이 반영).
+        제보가 없으면 None
+        """
+        pass
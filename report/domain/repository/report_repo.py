@@ -1,12 +1,26 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from datetime import datetime
+from typing import Dict, Optional, List, Sequence, Tuple
 from report.domain.report import Report
+from report.domain.map_tile import BBox, ClusterCell
+from report.domain.feedback_delta import FeedbackDelta
+from report.domain.outbox import OutboxEvent
 
 
 class ReportRepository(ABC):
     @abstractmethod
-    def save(self, report: Report) -> Report:
-        """새로운 제보 저장"""
+    def save(self, report: Report, events: Sequence[OutboxEvent] = ()) -> Report:
+        """새로운 제보 저장 (events는 같은 트랜잭션으로 outbox에 기록)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_with_cluster(
+        self, report: Report, radius_m: float, events: Sequence[OutboxEvent] = ()
+    ) -> Report:
+        """
+        가장 가까운 클러스터(radius_m 이내) 배정 + 제보 저장 + outbox 기록을 한 트랜잭션으로.
+        가까운 클러스터가 없으면 report.cluster_id로 새 클러스터 생성
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -15,13 +29,21 @@ class ReportRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def delete(self, report_id: str) -> None:
-        """report_id로 제보 삭제"""
+    def delete(self, report_id: str, events: Sequence[OutboxEvent] = ()) -> None:
+        """report_id로 제보 삭제 (events는 같은 트랜잭션으로 outbox에 기록)"""
         raise NotImplementedError
 
     @abstractmethod
-    def find_all(self) -> List[Report]:
-        """cluster_id별 제보 조회 (최신순)"""
+    def find_all(
+        self,
+        after: Optional[Tuple[datetime, str]] = None,
+        limit: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+    ) -> list:
+        """
+        cluster_id별 최신 제보 조회 (최신순).
+        after: (created_at, report_id) 키셋 커서, columns: 프로젝션 (지정 시 dict 반환)
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -30,24 +52,50 @@ class ReportRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def find_nearby_reports(
-        self, lat: float, lng: float, radius_m: float
-    ) -> List[Report]:
-        """지정 반경 내 제보 리스트 반환"""
+    def find_along_route(
+        self, route: List[tuple], width_m: float, min_risk_score: float = 0.0
+    ) -> list:
+        """
+        경로 폴리라인 [(lat, lng), ...] 에서 width_m 이내, 위험도 min_risk_score 이상인
+        승인 제보를 Hazard로 반환
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_approved_hazards(self, min_risk_score: float = 0.0) -> list:
+        """위험도 min_risk_score 이상인 승인 제보 전체를 경로 탐색용 Hazard 리스트로 반환"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_latest_per_cluster_in_bbox(self, bbox: BBox) -> List[Report]:
+        """중심점이 영역 안인 클러스터의 최신 승인 제보 (클러스터 요약 포함)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def aggregate_clusters_in_bbox(
+        self, bbox: BBox, cell_deg: float
+    ) -> List[ClusterCell]:
+        """영역 안 클러스터를 cell_deg 격자로 묶은 개수 (저줌 지도용)"""
         raise NotImplementedError
 
     @abstractmethod
     def find_by_cluster_and_category(
-        self, cluster_id: str, category: str
-    ) -> List[Report]:
+        self,
+        cluster_id: str,
+        category: str,
+        after: Optional[Tuple[datetime, str]] = None,
+        limit: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+    ) -> list:
         raise NotImplementedError
 
     @abstractmethod
-    def increment_feedback(self, report_id: str, evaluation: str):
-        """평가 카운트 증가"""
+    def count_by_cluster_and_category(
+        self, cluster_id: str, category: str | None = None
+    ) -> int:
         raise NotImplementedError
 
     @abstractmethod
-    def decrement_feedback(self, report_id: str, evaluation: str):
-        """평가 카운트 감소"""
+    def apply_feedback_deltas(self, deltas: Dict[str, FeedbackDelta]) -> List[Report]:
+        """제보별 카운트 증감분을 한 번에 반영하고 갱신된 제보 반환"""
         raise NotImplementedError
@@ -0,0 +1,48 @@
+import math
+
+# 경로 탐색에서 무시할 만큼 낮은 위험도 (대부분 '아쉬움' 평가를 받은 제보)
+DEFAULT_MIN_RISK_SCORE = 0.1
+
+# 평가가 하나도 없을 때의 중립 점수
+NEUTRAL_RISK_SCORE = 0.5
+
+
+def risk_score(n_good: int | None, n_mid: int | None, n_bad: int | None) -> float:
+    """
+    평가 수 → 위험도 (0 ~ 1).
+    평가가 적을수록 중립(0.5) 쪽으로 당기고, 많을수록 평균 위험도를 그대로 믿는다.
+    DB의 report.risk_score 생성 컬럼(RISK_SCORE_SQL)과 같은 식이다.
+    """
+    n_good, n_mid, n_bad = n_good or 0, n_mid or 0, n_bad or 0
+    n = n_good + n_mid + n_bad
+    if n == 0:
+        return NEUTRAL_RISK_SCORE
+
+    # 기본 평균 위험도
+    avg = (n_bad * 1.0 + n_mid * 0.5 + n_good * 0.0) / n
+
+    # 제보 수 기반 신뢰도 (데이터 많을수록 확신 ↑)
+    reliability = 1 - math.exp(-n / 10)
+
+    # 가변 스케일링 (데이터 많을수록 민감도 ↑)
+    scale = 0.5 + 0.5 * (1 - math.exp(-0.1 * n))
+
+    # 최종 점수: 중립 보정 + 신뢰도 반영 + 스케일 조정
+    return (avg * reliability + 0.5 * (1 - reliability)) * scale
+
+
+_N = (
+    "CAST(coalesce(good_count, 0) + coalesce(normal_count, 0)"
+    " + coalesce(bad_count, 0) AS double precision)"
+)
+
+# risk_score()를 SQL로 옮긴 식 (report.risk_score STORED 생성 컬럼 정의).
+# 평가 수가 바뀌는 모든 UPDATE에서 DB가 다시 계산하므로 쓰기 경로마다 따로 맞출 필요가 없다.
+# 바꿀 때는 migrations의 생성 컬럼 정의도 함께 바꿀 것
+RISK_SCORE_SQL = (
+    f"CASE WHEN {_N} = 0 THEN {NEUTRAL_RISK_SCORE} ELSE "
+    f"((coalesce(bad_count, 0) + coalesce(normal_count, 0) * 0.5) / {_N}"
+    f" * (1 - exp(-{_N} / 10))"
+    f" + 0.5 * exp(-{_N} / 10))"
+    f" * (0.5 + 0.5 * (1 - exp(-0.1 * {_N}))) END"
+)
@@ -0,0 +1,24 @@
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from database import Base
+
+
+class EventOutbox(Base):
+    """
+    발행 전 도메인 이벤트 (transactional outbox).
+    제보 변경과 같은 트랜잭션에서 INSERT하고, 릴레이가 브로커 발행 확인 후 DELETE한다.
+    """
+
+    __tablename__ = "event_outbox"
+
+    outbox_id = Column(BigInteger, primary_key=True, autoincrement=True)
+    routing_key = Column(String, nullable=False)
+    payload = Column(JSONB, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    # 릴레이가 가져가 발행 중인 이벤트는 이 시각까지 다른 릴레이가 가져가지 않는다
+    locked_until = Column(DateTime(timezone=True), nullable=True)
+    # 발행을 max_attempts번 실패해 릴레이가 포기한 시각 (NULL이 아니면 다시 claim하지 않음)
+    parked_at = Column(DateTime(timezone=True), nullable=True)
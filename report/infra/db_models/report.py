@@ -1,6 +1,26 @@
-from sqlalchemy import Column, String, Float, Integer, DateTime
+from sqlalchemy import (
+    Column,
+    Computed,
+    String,
+    Float,
+    Integer,
+    DateTime,
+    Index,
+    text,
+)
+from sqlalchemy.types import UserDefinedType
 from datetime import datetime
 from database import Base
+from report.domain.risk_score import RISK_SCORE_SQL
+
+
+class GeographyPoint(UserDefinedType):
+    """PostGIS geography(Point, 4326) 컬럼 타입"""
+
+    cache_ok = True
+
+    def get_col_spec(self, **kw):
+        return "geography(Point, 4326)"
 
 
 class Report(Base):
@@ -11,6 +31,16 @@ class Report(Base):
     reporter_type = Column(String, nullable=False)
     location_lat = Column(Float, nullable=True)
     location_lng = Column(Float, nullable=True)
+
+    # 공간 쿼리용 위치 (위도/경도에서 DB가 자동 계산해 저장, GiST 인덱스)
+    location_geog = Column(
+        GeographyPoint(),
+        Computed(
+            "ST_SetSRID(ST_MakePoint(location_lng, location_lat), 4326)::geography",
+            persisted=True,
+        ),
+    )
+
     cluster_id = Column(String, nullable=True)
     image_url = Column(String, nullable=True)
     category = Column(String, nullable=True)
@@ -23,6 +53,19 @@ class Report(Base):
     bad_count = Column(Integer, nullable=True, default=0)
     total_feedbacks = Column(Integer, nullable=True, default=0)
 
+    # 평가 수에서 DB가 자동 계산해 저장하는 위험도 (경로 탐색 필터/페널티)
+    risk_score = Column(Float, Computed(RISK_SCORE_SQL, persisted=True))
+
     not_there = Column(Integer, nullable=True, default=0)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_report_location_geog", "location_geog", postgresql_using="gist"),
+        Index("ix_report_cluster_created", "cluster_id", "created_at"),
+        Index(
+            "ix_report_approved_risk",
+            "risk_score",
+            postgresql_where=text("status = 'APPROVED'"),
+        ),
+    )
@@ -0,0 +1,55 @@
+from sqlalchemy import Column, Computed, String, Float, Integer, DateTime, Index
+from datetime import datetime
+from database import Base
+from report.infra.db_models.report import GeographyPoint
+
+
+class ReportCluster(Base):
+    __tablename__ = "report_cluster"
+
+    cluster_id = Column(String, primary_key=True)
+    center_lat = Column(Float, nullable=False)
+    center_lng = Column(Float, nullable=False)
+
+    # 최근접 중심점 조회용 (GiST 인덱스 KNN)
+    center_geog = Column(
+        GeographyPoint(),
+        Computed(
+            "ST_SetSRID(ST_MakePoint(center_lng, center_lat), 4326)::geography",
+            persisted=True,
+        ),
+    )
+
+    member_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_report_cluster_center_geog", "center_geog", postgresql_using="gist"),
+    )
+
+
+class ReportClusterSummary(Base):
+    """
+    클러스터별 최신 승인 제보/승인 제보 수/평가 합계.
+    제보 쓰기와 같은 트랜잭션에서 해당 클러스터 행만 다시 계산한다.
+    """
+
+    __tablename__ = "report_cluster_summary"
+
+    cluster_id = Column(String, primary_key=True)
+    latest_report_id = Column(String, nullable=False)
+    latest_created_at = Column(DateTime, nullable=True)
+    member_count = Column(Integer, nullable=False, default=0)
+    bad_count = Column(Integer, nullable=False, default=0)
+    total_feedbacks = Column(Integer, nullable=False, default=0)
+    score = Column(Float, nullable=True)  # 승인 제보 risk_score 평균
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # 최신순 키셋 페이지네이션 (latest_created_at, latest_report_id)
+    __table_args__ = (
+        Index(
+            "ix_report_cluster_summary_latest",
+            "latest_created_at",
+            "latest_report_id",
+        ),
+    )
@@ -0,0 +1,64 @@
+import json
+from typing import Callable, Dict, NamedTuple
+
+
+class EventCodec(NamedTuple):
+    """이벤트 본문 직렬화 방식 (AMQP content_type으로 수신 측이 디코딩 방식을 고른다)"""
+
+    name: str
+    content_type: str
+    dumps: Callable[[dict], bytes]
+    loads: Callable[[bytes], dict]
+
+
+def _json_codec() -> EventCodec:
+    return EventCodec(
+        "json",
+        "application/json",
+        lambda message: json.dumps(message).encode("utf-8"),
+        json.loads,
+    )
+
+
+def _orjson_codec() -> EventCodec:
+    # JSON과 같은 형식이라 기존 소비자도 그대로 읽는다 (인코딩만 빠름)
+    import orjson
+
+    return EventCodec("orjson", "application/json", orjson.dumps, orjson.loads)
+
+
+def _msgpack_codec() -> EventCodec:
+    import msgpack
+
+    return EventCodec(
+        "msgpack",
+        "application/msgpack",
+        lambda message: msgpack.packb(message, use_bin_type=True),
+        lambda body: msgpack.unpackb(body, raw=False),
+    )
+
+
+_CODECS: Dict[str, Callable[[], EventCodec]] = {
+    "json": _json_codec,
+    "orjson": _orjson_codec,
+    "msgpack": _msgpack_codec,
+}
+
+
+def get_codec(name: str) -> EventCodec:
+    """이름으로 코덱 조회 (orjson/msgpack은 설치돼 있을 때만)"""
+    try:
+        factory = _CODECS[name]
+    except KeyError:
+        raise ValueError(f"Unknown event codec: {name}") from None
+    try:
+        return factory()
+    except ImportError as e:
+        raise ValueError(f"Event codec {name} is not installed: {e}") from None
+
+
+def decode_event(body: bytes, content_type: str | None) -> dict:
+    """수신 메시지 디코딩 (content_type이 없으면 기존 발행자처럼 JSON으로 간주)"""
+    if content_type == "application/msgpack":
+        return get_codec("msgpack").loads(body)
+    return json.loads(body)
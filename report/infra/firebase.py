@@ -1,6 +1,9 @@
+from typing import List
+
 import firebase_admin
-from firebase_admin import credentials, messaging
+from firebase_admin import credentials, exceptions, messaging
 from config import get_settings
+from report.domain.push import FAILED, RETRY, SENT, PushMessage, PushSender
 
 settings = get_settings()
 
@@ -33,3 +36,41 @@ def send_push(token: str, title: str, body: str, data: dict | None = None):
     except Exception as e:
         print(f"ush send failed: {e}")
         return None
+
+
+# 잠시 뒤 다시 보내면 성공할 수 있는 오류 (서버 과부하/할당량/타임아웃)
+TRANSIENT_ERRORS = (
+    exceptions.UnavailableError,
+    exceptions.InternalError,
+    exceptions.DeadlineExceededError,
+    exceptions.ResourceExhaustedError,
+)
+
+
+class FirebasePushSender(PushSender):
+    """firebase_admin 묶음 전송 (send_each, 요청 1번에 내용이 다른 메시지 최대 500개)"""
+
+    def send_each(self, messages: List[PushMessage]) -> List[str]:
+        try:
+            response = messaging.send_each(
+                [
+                    messaging.Message(
+                        token=message.token,
+                        notification=messaging.Notification(
+                            title=message.title, body=message.body
+                        ),
+                        data=dict(message.data),
+                    )
+                    for message in messages
+                ]
+            )
+        except TRANSIENT_ERRORS:
+            return [RETRY] * len(messages)
+        return [
+            (
+                SENT
+                if r.success
+                else RETRY if isinstance(r.exception, TRANSIENT_ERRORS) else FAILED
+            )
+            for r in response.responses
+        ]
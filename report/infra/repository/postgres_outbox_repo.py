@@ -0,0 +1,101 @@
+from typing import Iterable, List
+from sqlalchemy import text
+from database import SessionLocal
+from report.domain.outbox import OutboxEvent
+from report.domain.repository.outbox_repo import OutboxRepository
+from report.infra.db_models.event_outbox import EventOutbox as EventOutboxDB
+
+
+def add_outbox_events(db, events: Iterable[OutboxEvent]) -> None:
+    """제보 쓰기 트랜잭션에 outbox 이벤트 INSERT를 덧붙인다 (commit은 호출한 쪽에서)"""
+    db.add_all(
+        EventOutboxDB(routing_key=event.routing_key, payload=event.payload)
+        for event in events
+    )
+
+
+class PostgresOutboxRepository(OutboxRepository):
+    def claim(self, limit: int, lease_s: float) -> List[OutboxEvent]:
+        # SKIP LOCKED: 여러 프로세스의 릴레이가 같은 행을 두고 기다리지 않고 나눠 가져간다
+        with SessionLocal() as db:
+            rows = db.execute(
+                text(
+                    """
+                    UPDATE event_outbox o
+                    SET locked_until = now() + make_interval(secs => :lease_s)
+                    FROM (
+                        SELECT outbox_id
+                        FROM event_outbox
+                        WHERE parked_at IS NULL
+                          AND (locked_until IS NULL OR locked_until < now())
+                        ORDER BY outbox_id
+                        LIMIT :limit
+                        FOR UPDATE SKIP LOCKED
+                    ) AS c
+                    WHERE o.outbox_id = c.outbox_id
+                    RETURNING o.outbox_id, o.routing_key, o.payload
+                    """
+                ),
+                {"limit": limit, "lease_s": lease_s},
+            ).all()
+            db.commit()
+        rows.sort(key=lambda r: r.outbox_id)
+        return [
+            OutboxEvent(r.routing_key, r.payload, outbox_id=r.outbox_id) for r in rows
+        ]
+
+    def mark_published(self, outbox_ids: List[int]) -> None:
+        if not outbox_ids:
+            return
+        with SessionLocal() as db:
+            db.execute(
+                text("DELETE FROM event_outbox WHERE outbox_id = ANY(:ids)"),
+                {"ids": list(outbox_ids)},
+            )
+            db.commit()
+
+    def release(self, outbox_ids: List[int]) -> None:
+        if not outbox_ids:
+            return
+        with SessionLocal() as db:
+            db.execute(
+                text(
+                    "UPDATE event_outbox SET locked_until = NULL "
+                    "WHERE outbox_id = ANY(:ids)"
+                ),
+                {"ids": list(outbox_ids)},
+            )
+            db.commit()
+
+    def record_failure(self, outbox_ids: List[int], max_attempts: int) -> List[int]:
+        if not outbox_ids:
+            return []
+        with SessionLocal() as db:
+            parked = db.execute(
+                text(
+                    """
+                    UPDATE event_outbox
+                    SET attempts = attempts + 1,
+                        locked_until = NULL,
+                        parked_at = CASE WHEN attempts + 1 >= :max_attempts
+                                         THEN now() END
+                    WHERE outbox_id = ANY(:ids)
+                    RETURNING outbox_id, parked_at IS NOT NULL AS parked
+                    """
+                ),
+                {"ids": list(outbox_ids), "max_attempts": max_attempts},
+            ).all()
+            db.commit()
+        return sorted(r.outbox_id for r in parked if r.parked)
+
+    def count_pending(self) -> int:
+        with SessionLocal() as db:
+            return db.execute(
+                text("SELECT count(*) FROM event_outbox WHERE parked_at IS NULL")
+            ).scalar_one()
+
+    def count_parked(self) -> int:
+        with SessionLocal() as db:
+            return db.execute(
+                text("SELECT count(*) FROM event_outbox WHERE parked_at IS NOT NULL")
+            ).scalar_one()
@@ -0,0 +1,135 @@
+from typing import Callable, Dict, List, Tuple
+from sqlalchemy import text
+from database import SessionLocal
+from report.domain.report_cluster import ReportCluster as ReportClusterVO
+from report.domain.repository.report_cluster_repo import ReportClusterRepository
+from report.infra.db_models.report_cluster import ReportCluster as ReportClusterDB
+from report.infra.repository.postgres_report_repo import rebuild_cluster_summary
+
+# DBSCAN 거리(m) 계산용 평면 좌표계 (EPSG:5179, Korea 2000 / Unified CS)
+METRIC_SRID = 5179
+
+
+class PostgresReportClusterRepository(ReportClusterRepository):
+    def remove_member(self, cluster_id: str, lat: float, lng: float) -> None:
+        with SessionLocal() as db:
+            # c' = (c * n - p) / (n - 1), 마지막 제보면 행 삭제
+            db.execute(
+                text(
+                    """
+                    UPDATE report_cluster
+                    SET center_lat = CASE WHEN member_count > 1
+                            THEN (center_lat * member_count - :lat) / (member_count - 1)
+                            ELSE center_lat END,
+                        center_lng = CASE WHEN member_count > 1
+                            THEN (center_lng * member_count - :lng) / (member_count - 1)
+                            ELSE center_lng END,
+                        member_count = member_count - 1,
+                        updated_at = now()
+                    WHERE cluster_id = :cluster_id
+                    """
+                ),
+                {"cluster_id": cluster_id, "lat": lat, "lng": lng},
+            )
+            db.execute(
+                text(
+                    """
+                    DELETE FROM report_cluster
+                    WHERE cluster_id = :cluster_id AND member_count <= 0
+                    """
+                ),
+                {"cluster_id": cluster_id},
+            )
+            db.commit()
+
+    def get(self, cluster_id: str) -> ReportClusterVO | None:
+        with SessionLocal() as db:
+            cluster = db.get(ReportClusterDB, cluster_id)
+            return ReportClusterVO.model_validate(cluster) if cluster else None
+
+    def find_all(self) -> List[ReportClusterVO]:
+        with SessionLocal() as db:
+            clusters = db.query(ReportClusterDB).all()
+            return [ReportClusterVO.model_validate(c) for c in clusters]
+
+    def recluster(
+        self,
+        eps_m: float,
+        min_points: int,
+        build: Callable[[List[tuple]], Tuple[List[ReportClusterVO], Dict[str, str]]],
+    ) -> Tuple[List[ReportClusterVO], Dict[str, str]]:
+        with SessionLocal() as db:
+            # 먼저 잠가서 새 제보 배정(assign_cluster)이 커밋될 때까지 대기시키고, 그 뒤에 위치를 읽는다.
+            # 읽은 뒤에 잠그면 그 사이 커밋된 제보가 곧 지워질 클러스터를 가리킨 채 남는다
+            db.execute(text("LOCK TABLE report_cluster IN EXCLUSIVE MODE"))
+            clusters, assignments = build(
+                self._find_report_points(db, eps_m, min_points)
+            )
+            self._replace_all(db, clusters, assignments)
+            db.commit()
+        return clusters, assignments
+
+    @staticmethod
+    def _find_report_points(db, eps_m: float, min_points: int) -> List[tuple]:
+        query = text(
+            f"""
+            SELECT report_id, location_lat, location_lng, status,
+                CASE WHEN status = 'APPROVED' THEN
+                    ST_ClusterDBSCAN(
+                        ST_Transform(location_geog::geometry, {METRIC_SRID}),
+                        eps := :eps,
+                        minpoints := :min_points
+                    ) OVER (PARTITION BY status = 'APPROVED')
+                END AS label
+            FROM report
+            WHERE location_geog IS NOT NULL
+            """
+        )
+        rows = db.execute(query, {"eps": eps_m, "min_points": min_points}).fetchall()
+        return [tuple(r) for r in rows]
+
+    @staticmethod
+    def _replace_all(
+        db, clusters: List[ReportClusterVO], assignments: Dict[str, str]
+    ) -> None:
+        db.execute(text("DELETE FROM report_cluster"))
+        if clusters:
+            db.execute(
+                text(
+                    """
+                    INSERT INTO report_cluster
+                        (cluster_id, center_lat, center_lng, member_count, updated_at)
+                    VALUES (:cluster_id, :center_lat, :center_lng, :member_count, now())
+                    """
+                ),
+                [
+                    {
+                        "cluster_id": c.cluster_id,
+                        "center_lat": c.center_lat,
+                        "center_lng": c.center_lng,
+                        "member_count": c.member_count,
+                    }
+                    for c in clusters
+                ],
+            )
+
+        # 행마다 UPDATE 대신 배열 두 개를 unnest해 한 문장으로 일괄 갱신
+        db.execute(
+            text(
+                """
+                UPDATE report AS r
+                SET cluster_id = m.cluster_id
+                FROM unnest(
+                    CAST(:report_ids AS varchar[]),
+                    CAST(:cluster_ids AS varchar[])
+                ) AS m(report_id, cluster_id)
+                WHERE r.report_id = m.report_id
+                  AND r.cluster_id IS DISTINCT FROM m.cluster_id
+                """
+            ),
+            {
+                "report_ids": list(assignments.keys()),
+                "cluster_ids": list(assignments.values()),
+            },
+        )
+        rebuild_cluster_summary(db)
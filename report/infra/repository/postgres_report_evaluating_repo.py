@@ -1,10 +1,33 @@
 from report.domain.repository.report_evaluating_repo import ReportEvaluatingRepository
+from report.domain.report import Report as ReportVO
 from report.domain.report_evaluating import ReportEvaluating as ReportEvaluatingVO
+from report.domain.feedback_delta import FeedbackDelta
 from report.infra.db_models.report_evaluating import (
     ReportEvaluating as ReportEvaluatingDB,
 )
+from report.infra.repository.postgres_report_repo import refresh_cluster_summary
 from database import SessionLocal
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
 from uuid import uuid4
+from dataclasses import asdict
+
+_RETRY = object()
+
+# 평가 카운트를 DB에서 바로 증감 (읽고-고치고-쓰기 없이 행 잠금 한 번)
+APPLY_FEEDBACK_DELTA = text(
+    """
+    UPDATE report
+    SET good_count = GREATEST(coalesce(good_count, 0) + :good, 0),
+        normal_count = GREATEST(coalesce(normal_count, 0) + :normal, 0),
+        bad_count = GREATEST(coalesce(bad_count, 0) + :bad, 0),
+        total_feedbacks = GREATEST(coalesce(total_feedbacks, 0) + :total, 0),
+        not_there = GREATEST(coalesce(not_there, 0) + :not_there, 0),
+        updated_at = now()
+    WHERE report_id = :report_id
+    RETURNING *
+    """
+)
 
 
 class PostgresReportEvaluatingRepository(ReportEvaluatingRepository):
@@ -48,3 +71,105 @@ class PostgresReportEvaluatingRepository(ReportEvaluatingRepository):
                 ReportEvaluatingDB.id == evaluating_id
             ).delete()
             db.commit()
+
+    def apply_evaluation(self, report_id: str, user_id: str, evaluation: str):
+        def apply(db):
+            toggled = self._toggle_evaluation(db, report_id, user_id, evaluation)
+            if toggled is _RETRY:
+                return _RETRY
+            action, delta = toggled
+            row = (
+                db.execute(
+                    APPLY_FEEDBACK_DELTA, {**asdict(delta), "report_id": report_id}
+                )
+                .mappings()
+                .first()
+            )
+            if row is None:
+                return None
+            refresh_cluster_summary(db, row["cluster_id"])
+            return action, ReportVO(**dict(row))
+
+        return self._in_transaction(apply)
+
+    def toggle_evaluation(self, report_id: str, user_id: str, evaluation: str):
+        return self._in_transaction(
+            lambda db: self._toggle_evaluation(db, report_id, user_id, evaluation)
+        )
+
+    def _in_transaction(self, fn):
+        # 같은 사용자의 첫 평가가 동시에 들어오면 한쪽 INSERT가 밀림 → 한 번 더 시도
+        for _ in range(2):
+            with SessionLocal() as db:
+                try:
+                    result = fn(db)
+                except IntegrityError:
+                    # report_id FK 위반 = 없는 제보
+                    db.rollback()
+                    return None
+                if result is _RETRY:
+                    db.rollback()
+                    continue
+                if result is None:
+                    db.rollback()
+                    return None
+                db.commit()
+                return result
+        return None
+
+    def _toggle_evaluation(self, db, report_id: str, user_id: str, evaluation: str):
+        """평가 행 추가/변경/삭제 → (action, 카운트 증감분)"""
+        params = {"report_id": report_id, "user_id": user_id}
+        existing = db.execute(
+            text(
+                """
+                SELECT id, evaluation
+                FROM report_evaluating
+                WHERE report_id = :report_id AND user_id = :user_id
+                FOR UPDATE
+                """
+            ),
+            params,
+        ).first()
+
+        if existing is None:
+            # 첫 평가 등록
+            inserted = db.execute(
+                text(
+                    """
+                    INSERT INTO report_evaluating
+                        (id, report_id, user_id, evaluation, created_at, updated_at)
+                    VALUES
+                        (:id, :report_id, :user_id, :evaluation, now(), now())
+                    ON CONFLICT (report_id, user_id) DO NOTHING
+                    RETURNING id
+                    """
+                ),
+                {**params, "id": str(uuid4()), "evaluation": evaluation.upper()},
+            ).first()
+            if inserted is None:
+                return _RETRY
+            return "added", FeedbackDelta.evaluation(evaluation, 1)
+
+        previous = existing.evaluation.lower()
+        if previous == evaluation:
+            # 동일 이모지 → 취소
+            db.execute(
+                text("DELETE FROM report_evaluating WHERE id = :id"),
+                {"id": existing.id},
+            )
+            return "cancelled", FeedbackDelta.evaluation(evaluation, -1)
+
+        # 다른 이모지로 변경
+        db.execute(
+            text(
+                """
+                UPDATE report_evaluating
+                SET evaluation = :evaluation, updated_at = now()
+                WHERE id = :id
+                """
+            ),
+            {"id": existing.id, "evaluation": evaluation.upper()},
+        )
+        delta = FeedbackDelta.evaluation(previous, -1)
+        return "changed", delta.merge(FeedbackDelta.evaluation(evaluation, 1))
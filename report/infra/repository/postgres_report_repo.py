@@ -1,60 +1,274 @@
+from typing import Dict, List, Sequence, Tuple
 from report.domain.repository.report_repo import ReportRepository
 from report.domain.report import Report as ReportVO
+from report.domain.map_tile import BBox, ClusterCell
+from report.domain.pagination import query_columns
+from report.domain.feedback_delta import FeedbackDelta
+from report.domain.outbox import OutboxEvent
 from report.infra.db_models.report import Report as ReportDB
+from report.infra.repository.postgres_outbox_repo import add_outbox_events
 from database import SessionLocal
 from sqlalchemy import text
 from sqlalchemy.orm import aliased
-from route.algorithms.safe_path_finder import Hazard, HazardCategory
+from route.algorithms.safe_path_finder import Hazard, hazard_from_report
+
+
+# 클러스터 요약 집계 (승인 제보 기준). {where}에 클러스터 조건을 덧붙여 쓴다
+CLUSTER_SUMMARY_SELECT = """
+    SELECT cluster_id,
+        (array_agg(report_id ORDER BY created_at DESC, report_id DESC))[1],
+        max(created_at),
+        count(*),
+        coalesce(sum(bad_count), 0),
+        coalesce(sum(total_feedbacks), 0),
+        avg(risk_score),
+        now()
+    FROM report
+    WHERE status = 'APPROVED' AND cluster_id IS NOT NULL {where}
+    GROUP BY cluster_id
+"""
+
+CLUSTER_SUMMARY_COLUMNS = """
+    (cluster_id, latest_report_id, latest_created_at, member_count,
+     bad_count, total_feedbacks, score, updated_at)
+"""
+
+
+def refresh_cluster_summary(db, cluster_id: str | None) -> None:
+    """
+    클러스터 하나의 요약 행만 다시 계산 (제보 쓰기와 같은 트랜잭션에서 호출).
+    (cluster_id, created_at) 인덱스로 해당 클러스터 제보만 읽는다.
+    같은 클러스터의 다른 제보를 바꾸는 트랜잭션끼리는 클러스터 단위 advisory lock으로
+    직렬화한다. 잠금을 얻은 뒤 별도 문장으로 집계해야 먼저 커밋된 쪽 변경이 스냅샷에 보인다
+    (READ COMMITTED는 문장마다 스냅샷을 새로 잡음).
+    """
+    if cluster_id is None:
+        return
+    db.execute(
+        text("SELECT pg_advisory_xact_lock(hashtext(:cluster_id))"),
+        {"cluster_id": cluster_id},
+    )
+    db.execute(
+        text(
+            f"""
+            INSERT INTO report_cluster_summary {CLUSTER_SUMMARY_COLUMNS}
+            {CLUSTER_SUMMARY_SELECT.format(where="AND cluster_id = :cluster_id")}
+            ON CONFLICT (cluster_id) DO UPDATE SET
+                latest_report_id = EXCLUDED.latest_report_id,
+                latest_created_at = EXCLUDED.latest_created_at,
+                member_count = EXCLUDED.member_count,
+                bad_count = EXCLUDED.bad_count,
+                total_feedbacks = EXCLUDED.total_feedbacks,
+                score = EXCLUDED.score,
+                updated_at = EXCLUDED.updated_at
+            """
+        ),
+        {"cluster_id": cluster_id},
+    )
+    # 승인 제보가 하나도 남지 않은 클러스터는 요약에서 제거
+    db.execute(
+        text(
+            """
+            DELETE FROM report_cluster_summary s
+            WHERE s.cluster_id = :cluster_id
+              AND NOT EXISTS (
+                  SELECT 1 FROM report
+                  WHERE cluster_id = :cluster_id AND status = 'APPROVED'
+              )
+            """
+        ),
+        {"cluster_id": cluster_id},
+    )
+
+
+def rebuild_cluster_summary(db) -> None:
+    """요약 테이블 전체 재작성 (재클러스터링 직후)"""
+    db.execute(text("DELETE FROM report_cluster_summary"))
+    db.execute(
+        text(
+            f"""
+            INSERT INTO report_cluster_summary {CLUSTER_SUMMARY_COLUMNS}
+            {CLUSTER_SUMMARY_SELECT.format(where="")}
+            """
+        )
+    )
+
+
+def assign_cluster(
+    db, lat: float, lng: float, radius_m: float, new_cluster_id: str
+) -> str:
+    """
+    가장 가까운 클러스터 중심점(radius_m 이내)에 배정하고 중심점/개수를 갱신,
+    없으면 new_cluster_id로 새 클러스터 생성 (호출한 쪽 트랜잭션에서 실행, commit 안 함)
+    """
+    params = {"lat": lat, "lng": lng, "radius": radius_m}
+
+    # center_geog GiST 인덱스 KNN (<->) 으로 가장 가까운 중심점 1개만 조회
+    # FOR UPDATE: 같은 클러스터에 동시에 들어오는 제보끼리 중심점 갱신 직렬화
+    row = db.execute(
+        text(
+            """
+            SELECT cluster_id
+            FROM report_cluster
+            WHERE ST_DWithin(
+                center_geog,
+                ST_SetSRID(ST_MakePoint(:lng, :lat), 4326)::geography,
+                :radius
+            )
+            ORDER BY center_geog
+                <-> ST_SetSRID(ST_MakePoint(:lng, :lat), 4326)::geography
+            LIMIT 1
+            FOR UPDATE
+            """
+        ),
+        params,
+    ).first()
+
+    if row is None:
+        cluster_id = new_cluster_id
+        db.execute(
+            text(
+                """
+                INSERT INTO report_cluster
+                    (cluster_id, center_lat, center_lng, member_count, updated_at)
+                VALUES (:cluster_id, :lat, :lng, 1, now())
+                """
+            ),
+            {**params, "cluster_id": cluster_id},
+        )
+    else:
+        cluster_id = row.cluster_id
+        # 이동 평균: c' = c + (p - c) / (n + 1)
+        db.execute(
+            text(
+                """
+                UPDATE report_cluster
+                SET center_lat = center_lat
+                        + (:lat - center_lat) / (member_count + 1),
+                    center_lng = center_lng
+                        + (:lng - center_lng) / (member_count + 1),
+                    member_count = member_count + 1,
+                    updated_at = now()
+                WHERE cluster_id = :cluster_id
+                """
+            ),
+            {**params, "cluster_id": cluster_id},
+        )
+    return cluster_id
+
+
+def select_columns(columns: List[str] | None, summary: bool = False) -> str:
+    """
+    fields= 프로젝션을 SELECT 목록으로 (columns는 pagination에서 검증된 이름만).
+    None이면 전체 컬럼
+    """
+    if columns is None:
+        return "r.*, s.member_count, s.score AS cluster_score" if summary else "r.*"
+    exprs = []
+    for c in query_columns(columns):
+        if c == "member_count":
+            exprs.append("s.member_count")
+        elif c == "cluster_score":
+            exprs.append("s.score AS cluster_score")
+        else:
+            exprs.append(f"r.{c}")
+    return ", ".join(exprs)
+
+
+def page_rows(rows, columns: List[str] | None):
+    """전체 컬럼이면 Report VO, 프로젝션이면 컬럼 → 값 dict"""
+    if columns is None:
+        return [ReportVO(**dict(row)) for row in rows]
+    return [dict(row) for row in rows]
+
+
+def route_wkt(route: List[Tuple[float, float]]) -> str:
+    """[(lat, lng), ...] → WGS84 WKT (점 하나면 POINT, 그 외 LINESTRING)"""
+    coords = ", ".join(f"{lng} {lat}" for lat, lng in route)
+    return f"POINT({coords})" if len(route) == 1 else f"LINESTRING({coords})"
+
+
+def hazards_from_rows(rows) -> List[Hazard]:
+    """(report_id, location_lat, location_lng, category, risk_score) 행 → Hazard"""
+    hazards = []
+    for r in rows:
+        hz = hazard_from_report(
+            r.report_id, r.location_lat, r.location_lng, r.category, r.risk_score
+        )
+        if hz is not None:
+            hazards.append(hz)
+    return hazards
 
 
 class PostgresReportRepository(ReportRepository):
-    def save(self, report: ReportVO) -> ReportVO:
+    def save(self, report: ReportVO, events: Sequence[OutboxEvent] = ()) -> ReportVO:
+        with SessionLocal() as db:
+            return self._insert(db, report, events)
+
+    def save_with_cluster(
+        self, report: ReportVO, radius_m: float, events: Sequence[OutboxEvent] = ()
+    ) -> ReportVO:
+        """
+        클러스터 배정, 제보 INSERT, outbox 이벤트를 한 트랜잭션으로 (세션/커밋 1회).
+        가까운 클러스터가 없으면 report.cluster_id로 새 클러스터를 만든다
+        """
         with SessionLocal() as db:
-            db_report = ReportDB(
-                report_id=report.report_id,
-                reporter_id=report.reporter_id,
-                reporter_type=report.reporter_type,
-                location_lat=report.location_lat,
-                location_lng=report.location_lng,
-                cluster_id=report.cluster_id,
-                image_url=report.image_url,
-                category=report.category,
-                description=report.description,
-                status=report.status,
-                not_there=report.not_there,
-                created_at=report.created_at,
-                updated_at=report.updated_at,
+            cluster_id = assign_cluster(
+                db,
+                report.location_lat,
+                report.location_lng,
+                radius_m,
+                report.cluster_id,
+            )
+            return self._insert(
+                db, report.model_copy(update={"cluster_id": cluster_id}), events
             )
-            db.add(db_report)
-            db.commit()
-            db.refresh(db_report)
-            return ReportVO.from_orm(db_report)
+
+    def _insert(
+        self, db, report: ReportVO, events: Sequence[OutboxEvent] = ()
+    ) -> ReportVO:
+        db_report = ReportDB(
+            report_id=report.report_id,
+            reporter_id=report.reporter_id,
+            reporter_type=report.reporter_type,
+            location_lat=report.location_lat,
+            location_lng=report.location_lng,
+            cluster_id=report.cluster_id,
+            image_url=report.image_url,
+            category=report.category,
+            description=report.description,
+            status=report.status,
+            not_there=report.not_there,
+            created_at=report.created_at,
+            updated_at=report.updated_at,
+        )
+        db.add(db_report)
+        db.flush()
+        if db_report.status == "APPROVED":
+            refresh_cluster_summary(db, db_report.cluster_id)
+        add_outbox_events(db, events)
+        db.commit()
+        db.refresh(db_report)
+        return ReportVO.from_orm(db_report)
 
     def get(self, report_id: str) -> ReportVO | None:
         with SessionLocal() as db:
             report = db.query(ReportDB).filter(ReportDB.report_id == report_id).first()
         return ReportVO.from_orm(report) if report else None
 
-    def delete(self, report_id: str) -> None:
+    def delete(self, report_id: str, events: Sequence[OutboxEvent] = ()) -> None:
         with SessionLocal() as db:
             report = db.query(ReportDB).filter(ReportDB.report_id == report_id).first()
             if report:
                 db.delete(report)
+                db.flush()
+                refresh_cluster_summary(db, report.cluster_id)
+                add_outbox_events(db, events)
                 db.commit()
 
-    def find_all(self):
-        with SessionLocal() as db:
-            query = text(
-                """
-                SELECT DISTINCT ON (cluster_id) *
-                FROM report
-                WHERE cluster_id IS NOT NULL
-                AND status = 'APPROVED'
-                ORDER BY cluster_id, created_at DESC
-                """
-            )
-        result = db.execute(query).mappings().all()
-        return [ReportVO(**dict(row)) for row in result]
+    def find_all(self, after=None, limit=None, columns=None):
+        """클러스터별 최신 승인 제보 (요약 테이블 기준)"""
+        return self.find_latest_per_cluster(after, limit, columns)
 
     def update_feedback_counts(self, report: ReportVO) -> ReportVO:
         with SessionLocal() as db:
@@ -73,11 +287,13 @@ class PostgresReportRepository(ReportRepository):
             db_report.not_there = report.not_there
             db_report.updated_at = report.updated_at
 
+            db.flush()
+            refresh_cluster_summary(db, db_report.cluster_id)
             db.commit()
             db.refresh(db_report)
             return ReportVO.from_orm(db_report)
 
-    def update_status(self, report: ReportDB):
+    def update_status(self, report: ReportDB, events: Sequence[OutboxEvent] = ()):
         with SessionLocal() as db:
             db_report = (
                 db.query(ReportDB)
@@ -88,11 +304,14 @@ class PostgresReportRepository(ReportRepository):
                 return None
             db_report.status = report.status
             db_report.updated_at = report.updated_at
+            db.flush()
+            refresh_cluster_summary(db, db_report.cluster_id)
+            add_outbox_events(db, events)
             db.commit()
             db.refresh(db_report)
             return db_report
 
-    def update(self, report: ReportVO) -> ReportVO:
+    def update(self, report: ReportVO, events: Sequence[OutboxEvent] = ()) -> ReportVO:
         """제보 전체 정보 수정 (description, category, image_url 포함)"""
         with SessionLocal() as db:
             db_report = (
@@ -110,119 +329,100 @@ class PostgresReportRepository(ReportRepository):
             db_report.status = report.status
             db_report.updated_at = report.updated_at
 
+            db.flush()
+            refresh_cluster_summary(db, db_report.cluster_id)
+            add_outbox_events(db, events)
             db.commit()
             db.refresh(db_report)
             return ReportVO.from_orm(db_report)
 
-    # PostGIS 기반 공간쿼리
-    def find_nearby(self, origin_lat, origin_lng, dest_lat, dest_lng, buffer_m=2000):
-        """출발/도착 중심점을 기준으로 반경 buffer_m 내 제보만 가져옴"""
+    # PostGIS 기반 공간쿼리 (location_geog GiST 인덱스 사용)
+    def find_along_route(
+        self,
+        route: List[Tuple[float, float]],
+        width_m: float,
+        min_risk_score: float = 0.0,
+    ) -> List[Hazard]:
+        """
+        경로 폴리라인(또는 출발-도착 선분) [(lat, lng), ...] 에서 width_m 이내의
+        승인된 제보 중 위험도가 min_risk_score 이상인 것만 가져옴
+        """
         with SessionLocal() as db:
             query = text(
                 """
-                SELECT report_id, location_lat, location_lng, category,
-                    good_count, normal_count, bad_count, total_feedbacks
+                SELECT report_id, location_lat, location_lng, category, risk_score
                 FROM report
                 WHERE status = 'APPROVED'
-                  AND ST_DWithin(
-                      geography(ST_MakePoint(location_lng, location_lat)),
-                      geography(ST_MakePoint(:center_lng, :center_lat)),
-                      :buffer
-                  )
+                  AND risk_score >= :min_risk_score
+                  AND ST_DWithin(location_geog, ST_GeogFromText(:route), :width)
             """
             )
 
-            center_lat = (origin_lat + dest_lat) / 2
-            center_lng = (origin_lng + dest_lng) / 2
-
             rows = db.execute(
                 query,
                 {
-                    "center_lat": center_lat,
-                    "center_lng": center_lng,
-                    "buffer": buffer_m,
+                    "route": route_wkt(route),
+                    "width": width_m,
+                    "min_risk_score": min_risk_score,
                 },
             ).fetchall()
 
-            hazards = []
-            valid_categories = {c.value for c in HazardCategory}
-
-            for r in rows:
-                if not r.category or r.category not in valid_categories:
-                    continue
-
-                total = max(r.total_feedbacks or 1, 1)
-                score = (r.bad_count or 0) / total
-                score = round(score * 2, 2) or 0.5
-
-                try:
-                    category_enum = HazardCategory(r.category)
-                except ValueError:
-                    continue
+        return hazards_from_rows(rows)
 
-                hazards.append(
-                    Hazard(
-                        lat=r.location_lat,
-                        lon=r.location_lng,
-                        category=category_enum,
-                        score=score,
-                    )
-                )
-
-            return hazards
-
-    def find_nearby_reports(self, lat: float, lng: float, radius_m: float):
-        """특정 좌표 반경 내 기존 제보 조회 (cluster_id 판별용)"""
+    def find_approved_hazards(self, min_risk_score: float = 0.0):
+        """
+        위험도가 min_risk_score 이상인 승인 제보 전체를 Hazard로
+        (상주 위험 페널티 오버레이 초기화용, ix_report_approved_risk 부분 인덱스)
+        """
         with SessionLocal() as db:
             query = text(
                 """
-                SELECT *
+                SELECT report_id, location_lat, location_lng, category, risk_score
                 FROM report
-                WHERE status = 'APPROVED'
-                AND ST_DWithin(
-                    geography(ST_MakePoint(location_lng, location_lat)),
-                    geography(ST_MakePoint(:lng, :lat)),
-                    :radius
-                )
-                ORDER BY created_at DESC
-                """
+                WHERE status = 'APPROVED' AND risk_score >= :min_risk_score
+            """
             )
+            rows = db.execute(query, {"min_risk_score": min_risk_score}).fetchall()
 
-            rows = db.execute(
-                query,
-                {"lat": lat, "lng": lng, "radius": radius_m},
-            ).fetchall()
-
-            # SQLAlchemy Text query는 ORM 매핑이 아니므로 수동으로 VO 변환
-            nearby_reports = []
-            for row in rows:
-                nearby_reports.append(
-                    ReportVO(
-                        report_id=row.report_id,
-                        reporter_id=row.reporter_id,
-                        reporter_type=row.reporter_type,
-                        location_lat=row.location_lat,
-                        location_lng=row.location_lng,
-                        cluster_id=row.cluster_id,
-                        image_url=row.image_url,
-                        category=row.category,
-                        description=row.description,
-                        status=row.status,
-                        good_count=row.good_count,
-                        normal_count=row.normal_count,
-                        bad_count=row.bad_count,
-                        total_feedbacks=row.total_feedbacks,
-                        not_there=row.not_there,
-                        created_at=row.created_at,
-                        updated_at=row.updated_at,
-                    )
-                )
-
-            return nearby_reports
+        return hazards_from_rows(rows)
 
     def find_by_cluster_and_category(
-        self, cluster_id: str, category: str | None = None
+        self,
+        cluster_id: str,
+        category: str | None = None,
+        after=None,
+        limit=None,
+        columns=None,
     ):
+        """
+        클러스터 내 승인 제보 최신순. after=(created_at, report_id) 키셋 커서 다음부터
+        (cluster_id, created_at) 인덱스 범위 스캔으로 limit개만 읽는다.
+        """
+        conditions = ["r.cluster_id = :cluster_id", "r.status = 'APPROVED'"]
+        params = {"cluster_id": cluster_id, "limit": limit}
+        if category:
+            conditions.append("r.category = :category")
+            params["category"] = category
+        if after:
+            conditions.append("(r.created_at, r.report_id) < (:after_at, :after_id)")
+            params["after_at"], params["after_id"] = after
+
+        with SessionLocal() as db:
+            query = text(
+                f"""
+                SELECT {select_columns(columns)}
+                FROM report r
+                WHERE {" AND ".join(conditions)}
+                ORDER BY r.created_at DESC, r.report_id DESC
+                LIMIT :limit
+                """
+            )
+            rows = db.execute(query, params).mappings().all()
+            return page_rows(rows, columns)
+
+    def count_by_cluster_and_category(
+        self, cluster_id: str, category: str | None = None
+    ) -> int:
         with SessionLocal() as db:
             query = db.query(ReportDB).filter(
                 ReportDB.cluster_id == cluster_id,
@@ -230,62 +430,138 @@ class PostgresReportRepository(ReportRepository):
             )
             if category:
                 query = query.filter(ReportDB.category == category)
-            reports = query.order_by(ReportDB.created_at.desc()).all()
-            return [ReportVO.model_validate(r) for r in reports]
+            return query.count()
+
+    def find_latest_per_cluster(self, after=None, limit=None, columns=None):
+        """
+        클러스터별 최신 승인 제보 + 클러스터 승인 제보 수/점수 (최신 제보순).
+        전체 제보 DISTINCT ON 대신 요약 테이블(클러스터 수만큼)과 PK 조인.
+        정렬 키(최신 제보 시각)는 새 제보가 승인되면 바뀌므로 페이지 순회는 best-effort:
+        순회 중 새 승인 제보가 생긴 클러스터는 맨 앞으로 옮겨가 이번 순회에서 빠질 수 있다
+        (첫 페이지부터 다시 받으면 보임). 중복으로 나오지는 않는다.
+        """
+        where = ""
+        params = {"limit": limit}
+        if after:
+            where = """
+                WHERE (s.latest_created_at, s.latest_report_id)
+                    < (:after_at, :after_id)
+            """
+            params["after_at"], params["after_id"] = after
 
-    def find_latest_per_cluster(self):
         with SessionLocal() as db:
             query = text(
+                f"""
+                SELECT {select_columns(columns, summary=True)}
+                FROM report_cluster_summary s
+                JOIN report r ON r.report_id = s.latest_report_id
+                {where}
+                ORDER BY s.latest_created_at DESC, s.latest_report_id DESC
+                LIMIT :limit
                 """
-            SELECT DISTINCT ON (cluster_id) *
-            FROM report
-            WHERE cluster_id IS NOT NULL
-              AND status = 'APPROVED'
-            ORDER BY cluster_id, created_at DESC
-            """
             )
-            rows = db.execute(query).mappings().all()
-            return [ReportVO(**dict(row)) for row in rows]
+            rows = db.execute(query, params).mappings().all()
+            return page_rows(rows, columns)
 
-    def increment_feedback(self, report_id: str, evaluation: str):
-        """좋음/보통/아쉬움 평가 카운트 업데이트"""
+    def find_latest_per_cluster_in_bbox(self, bbox: BBox):
+        """클러스터 중심점(center_geog GiST)으로 영역 필터 후 요약/최신 제보 PK 조인"""
         with SessionLocal() as db:
-            report = db.query(ReportDB).filter(ReportDB.report_id == report_id).first()
-            if not report:
-                return
-
-            # 평가별 카운트 증가
-            if evaluation == "good":
-                report.good_count += 1
-            elif evaluation == "normal":
-                report.normal_count += 1
-            elif evaluation == "bad":
-                report.bad_count += 1
-
-            # 전체 피드백 수 증가
-            report.total_feedbacks += 1
-
-            db.commit()
-            db.refresh(report)
+            query = text(
+                """
+                SELECT r.*, s.member_count, s.score AS cluster_score
+                FROM report_cluster c
+                JOIN report_cluster_summary s ON s.cluster_id = c.cluster_id
+                JOIN report r ON r.report_id = s.latest_report_id
+                WHERE c.center_geog && ST_MakeEnvelope(
+                    :min_lng, :min_lat, :max_lng, :max_lat, 4326
+                )::geography
+                  -- &&는 지구중심 bbox 겹침만 보므로(인덱스 필터) 실제 범위로 다시 확인
+                  AND c.center_lat BETWEEN :min_lat AND :max_lat
+                  AND c.center_lng BETWEEN :min_lng AND :max_lng
+                ORDER BY s.cluster_id
+                """
+            )
+            rows = db.execute(query, bbox._asdict()).mappings().all()
+            return [ReportVO(**dict(row)) for row in rows]
 
-    def decrement_feedback(self, report_id: str, evaluation: str):
-        """좋음/보통/아쉬움 평가 카운트 감소"""
+    def aggregate_clusters_in_bbox(self, bbox: BBox, cell_deg: float):
         with SessionLocal() as db:
-            report = db.query(ReportDB).filter(ReportDB.report_id == report_id).first()
-            if not report:
-                return
-
-            # 평가별 카운트 감소
-            if evaluation == "good" and report.good_count > 0:
-                report.good_count -= 1
-            elif evaluation == "normal" and report.normal_count > 0:
-                report.normal_count -= 1
-            elif evaluation == "bad" and report.bad_count > 0:
-                report.bad_count -= 1
-
-            # 전체 피드백 수 감소
-            if report.total_feedbacks > 0:
-                report.total_feedbacks -= 1
+            query = text(
+                """
+                SELECT avg(c.center_lat) AS lat,
+                    avg(c.center_lng) AS lng,
+                    count(*) AS cluster_count,
+                    sum(s.member_count) AS report_count
+                FROM report_cluster c
+                JOIN report_cluster_summary s ON s.cluster_id = c.cluster_id
+                WHERE c.center_geog && ST_MakeEnvelope(
+                    :min_lng, :min_lat, :max_lng, :max_lat, 4326
+                )::geography
+                  -- &&는 지구중심 bbox 겹침만 보므로(인덱스 필터) 실제 범위로 다시 확인.
+                  -- 이웃 타일과 경계를 나눠 갖지 않도록 최대값 쪽은 제외
+                  AND c.center_lat >= :min_lat AND c.center_lat < :max_lat
+                  AND c.center_lng >= :min_lng AND c.center_lng < :max_lng
+                GROUP BY floor(c.center_lat / :cell), floor(c.center_lng / :cell)
+                ORDER BY 1, 2
+                """
+            )
+            rows = (
+                db.execute(query, {**bbox._asdict(), "cell": cell_deg}).mappings().all()
+            )
+            return [ClusterCell(**dict(row)) for row in rows]
+
+    def apply_feedback_deltas(self, deltas: Dict[str, FeedbackDelta]):
+        """
+        제보별 증감분을 배열로 넘겨 unnest한 값 목록과 조인하는 UPDATE 한 문장으로 반영
+        """
+        report_ids = sorted(deltas)
+        columns = ["good", "normal", "bad", "total", "not_there"]
+        params = {"report_ids": report_ids}
+        for c in columns:
+            params[c] = [getattr(deltas[r], c) for r in report_ids]
 
+        with SessionLocal() as db:
+            # 여러 프로세스의 flush가 겹쳐도 교착되지 않도록 report_id 순서로 먼저 잠금
+            db.execute(
+                text(
+                    """
+                    SELECT 1 FROM report
+                    WHERE report_id = ANY(CAST(:report_ids AS varchar[]))
+                    ORDER BY report_id
+                    FOR NO KEY UPDATE
+                    """
+                ),
+                {"report_ids": report_ids},
+            )
+            query = text(
+                """
+                UPDATE report AS r
+                SET good_count = GREATEST(coalesce(r.good_count, 0) + d.good, 0),
+                    normal_count = GREATEST(coalesce(r.normal_count, 0) + d.normal, 0),
+                    bad_count = GREATEST(coalesce(r.bad_count, 0) + d.bad, 0),
+                    total_feedbacks =
+                        GREATEST(coalesce(r.total_feedbacks, 0) + d.total, 0),
+                    not_there = GREATEST(coalesce(r.not_there, 0) + d.not_there, 0),
+                    updated_at = now()
+                FROM (
+                    SELECT * FROM unnest(
+                        CAST(:report_ids AS varchar[]),
+                        CAST(:good AS int[]),
+                        CAST(:normal AS int[]),
+                        CAST(:bad AS int[]),
+                        CAST(:total AS int[]),
+                        CAST(:not_there AS int[])
+                    ) AS t(report_id, good, normal, bad, total, not_there)
+                ) AS d
+                WHERE r.report_id = d.report_id
+                RETURNING r.*
+                """
+            )
+            rows = db.execute(query, params).mappings().all()
+            # 여러 클러스터 잠금은 항상 같은 순서로 (트랜잭션끼리 교착 방지)
+            for cluster_id in sorted(
+                {row["cluster_id"] for row in rows if row["cluster_id"]}
+            ):
+                refresh_cluster_summary(db, cluster_id)
             db.commit()
-            db.refresh(report)
+            return [ReportVO(**dict(row)) for row in rows]
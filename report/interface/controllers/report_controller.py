@@ -1,4 +1,16 @@
-from fastapi import APIRouter, Body, Depends, HTTPException, Query, Path
+import hashlib
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Body,
+    Depends,
+    HTTPException,
+    Query,
+    Path,
+    Request,
+)
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
 from dependency_injector.wiring import inject, Provide
 from pydantic import BaseModel
 from containers import Container
@@ -7,8 +19,18 @@ from aws import s3_client
 from config import get_settings
 from datetime import datetime
 from report.application.report_service import ReportService
+from report.application.report_cluster_service import ReportClusterService
+from report.application.push_dispatcher import PushDispatcher
+from report.application.outbox_relay import OutboxRelay
 from report.domain.report import Report
-from common.auth import CurrentUser, get_current_user, get_optional_user
+from report.domain.map_tile import BBox
+from report.domain.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page
+from common.auth import (
+    CurrentUser,
+    get_admin_user,
+    get_current_user,
+    get_optional_user,
+)
 from common.logger import logger
 
 router = APIRouter(
@@ -41,6 +63,48 @@ class ReportUpdateRequest(BaseModel):
 class FilterResponse(BaseModel):
     total_count: int
     reports: List[Report]
+    next_cursor: str | None = None
+
+
+# 목록 API 공통 페이지 파라미터
+CURSOR_QUERY = Query(None, description="이전 응답의 X-Next-Cursor 값")
+LIMIT_QUERY = Query(
+    DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"
+)
+FIELDS_QUERY = Query(
+    None, description="응답에 담을 필드 (쉼표 구분, 예: reportId,category,locationLat)"
+)
+
+
+def page_response(page: Page) -> JSONResponse:
+    """
+    페이지 본문은 기존처럼 리스트, 다음 페이지 커서는 X-Next-Cursor 헤더로.
+    fields 지정 시 항목이 Report 대신 dict라 response_model 검증 없이 바로 직렬화한다.
+    """
+    response = JSONResponse(content=jsonable_encoder(page.items))
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return response
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 약한 비교 (쉼표 목록, W/ 접두사 무시, * 는 항상 일치)"""
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+def etag_response(request: Request, payload) -> Response:
+    """
+    응답 본문 해시를 ETag로 붙이고, If-None-Match가 같으면 본문 없이 304 반환
+    (모바일 지도가 바뀌지 않은 타일을 다시 받지 않도록)
+    """
+    response = JSONResponse(content=jsonable_encoder(payload))
+    etag = f'"{hashlib.sha1(response.body).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return response
 
 
 @router.get("/presigned-url", response_model=PresignedResponse, dependencies=[])
@@ -73,12 +137,50 @@ def get_presigned_url(
 @router.get("/latest-by-cluster", response_model=List[Report])
 @inject
 def get_latest_reports_by_cluster(
+    cursor: str | None = CURSOR_QUERY,
+    limit: int = LIMIT_QUERY,
+    fields: str | None = FIELDS_QUERY,
+    service: ReportService = Depends(Provide[Container.report_service]),
+):
+    """
+    클러스터별로 최신 제보 1개씩만 반환 (최신순 페이지).
+    순회 중 새 제보가 승인된 클러스터는 맨 앞으로 옮겨가 이번 순회에서 빠질 수 있다
+    (best-effort — 첫 페이지부터 다시 받으면 보임).
+    """
+    return page_response(service.get_latest_reports_by_cluster(cursor, limit, fields))
+
+
+@router.get("/viewport")
+@inject
+def get_reports_in_viewport(
+    request: Request,
+    min_lat: float = Query(..., description="남쪽 위도"),
+    min_lng: float = Query(..., description="서쪽 경도"),
+    max_lat: float = Query(..., description="북쪽 위도"),
+    max_lng: float = Query(..., description="동쪽 경도"),
+    zoom: int = Query(..., description="지도 줌 레벨"),
     service: ReportService = Depends(Provide[Container.report_service]),
 ):
     """
-    클러스터별로 최신 제보 1개씩만 반환
+    지도 영역 안 클러스터별 최신 제보 (저줌이면 격자별 개수 집계)
     """
-    return service.get_latest_reports_by_cluster()
+    bbox = BBox(min_lat, min_lng, max_lat, max_lng)
+    return etag_response(request, service.get_map_viewport(bbox, zoom))
+
+
+@router.get("/tiles/{z}/{x}/{y}")
+@inject
+def get_reports_in_tile(
+    request: Request,
+    z: int = Path(...),
+    x: int = Path(...),
+    y: int = Path(...),
+    service: ReportService = Depends(Provide[Container.report_service]),
+):
+    """
+    XYZ 타일 안 클러스터별 최신 제보 (저줌이면 격자별 개수 집계)
+    """
+    return etag_response(request, service.get_map_tile(z, x, y))
 
 
 @router.get("/filter", response_model=FilterResponse)
@@ -86,31 +188,94 @@ def get_latest_reports_by_cluster(
 def filter_reports(
     cluster_id: str = Query(..., description="클러스터 ID"),
     category: str | None = Query(None, description="카테고리 (선택)"),
+    cursor: str | None = CURSOR_QUERY,
+    limit: int = LIMIT_QUERY,
+    fields: str | None = FIELDS_QUERY,
     service: ReportService = Depends(Provide[Container.report_service]),
 ):
     """
-    특정 클러스터 내 제보 리스트 조회
+    특정 클러스터 내 제보 리스트 조회 (최신순 페이지, total_count는 전체 개수)
+    """
+    page = service.get_reports_by_cluster_and_category(
+        cluster_id, category, cursor, limit, fields
+    )
+    total_count = service.count_reports_by_cluster_and_category(cluster_id, category)
+    response = JSONResponse(
+        content=jsonable_encoder(
+            {
+                "total_count": total_count,
+                "reports": page.items,
+                "next_cursor": page.next_cursor,
+            }
+        )
+    )
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return response
+
+
+# 푸시 알림 디스패처 큐 길이/전송 지연/실패 현황 (관리자)
+@router.get("/push/stats")
+@inject
+def get_push_stats(
+    dispatcher: PushDispatcher | None = Depends(Provide[Container.push_dispatcher]),
+    admin: CurrentUser = Depends(get_admin_user),
+):
+    if dispatcher is None:
+        return {"enabled": False}
+    return {"enabled": True, **dispatcher.stats()}
+
+
+# 이벤트 outbox 발행 대기 건수/릴레이 발행 현황 (관리자)
+@router.get("/outbox/stats")
+@inject
+def get_outbox_stats(
+    relay: OutboxRelay | None = Depends(Provide[Container.outbox_relay]),
+    admin: CurrentUser = Depends(get_admin_user),
+):
+    if relay is None:
+        return {"enabled": False}
+    return {
+        "enabled": True,
+        "pending": relay.outbox_repo.count_pending(),
+        "parked_total": relay.outbox_repo.count_parked(),
+        **relay.stats(),
+    }
+
+
+@router.post("/clusters/recluster")
+@inject
+def recluster_reports(
+    service: ReportClusterService = Depends(Provide[Container.report_cluster_service]),
+    admin: CurrentUser = Depends(get_admin_user),
+):
+    """
+    승인 제보 전체를 DBSCAN으로 다시 묶어 클러스터와 cluster_id를 일괄 재작성 (관리자)
     """
-    reports = service.get_reports_by_cluster_and_category(cluster_id, category)
-    return {"total_count": len(reports), "reports": reports}
+    return service.recluster()
 
 
 @router.get("/", response_model=List[Report])
 @inject
 def list_reports(
+    cursor: str | None = CURSOR_QUERY,
+    limit: int = LIMIT_QUERY,
+    fields: str | None = FIELDS_QUERY,
     service: ReportService = Depends(Provide[Container.report_service]),
 ):
-    return service.list_reports()
+    return page_response(service.list_reports(cursor, limit, fields))
 
 
 @router.post("/", response_model=Report)
 @inject
 async def create_report(
+    background_tasks: BackgroundTasks,
     req: ReportCreateRequest = Body(...),
     service: ReportService = Depends(Provide[Container.report_service]),
     current: CurrentUser = Depends(get_current_user),
 ):
     logger.info(f"신고 생성 요청 uid={current.uid}")
+    # 보호자 푸시/이벤트 발행은 응답 후 background_tasks에서
     report = await service.create_report(
         reporter_id=current.uid,
         reporter_type=current.user_type,
@@ -119,6 +284,7 @@ async def create_report(
         image_url=req.image_url,
         category=req.category,
         description=req.description,
+        background_tasks=background_tasks,
     )
     return report
 
@@ -0,0 +1,124 @@
+from typing import Dict, List, Tuple
+import numpy as np
+from route.algorithms.vectorized import haversine_vec
+
+
+class CompactGraph:
+    """
+    CSR(Compressed Sparse Row) 형태의 도로 그래프.
+    노드는 정수 ID, 좌표/간선은 NumPy 배열로 보관한다.
+      - coords:  (N, 2) float64, node_id → (lat, lon)
+      - offsets: (N + 1,) int64, node_id의 간선은 targets[offsets[i]:offsets[i+1]]
+      - targets: (E,) int32, 간선의 도착 노드 ID
+      - weights: (E,) float64, 간선 가중치 (거리 + 위험 페널티)
+    (lat, lon) → ID 매핑은 출발/도착 지정처럼 경계에서만 사용한다.
+    """
+
+    def __init__(
+        self,
+        coords: np.ndarray,
+        offsets: np.ndarray,
+        targets: np.ndarray,
+        weights: np.ndarray,
+        node_ids: Dict[Tuple[float, float], int],
+    ):
+        self.coords = coords
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.node_ids = node_ids
+
+    # --- 생성 ---
+    @classmethod
+    def from_edges(
+        cls,
+        nodes: List[Tuple[float, float]],
+        src: np.ndarray,
+        dst: np.ndarray,
+        weight: np.ndarray,
+    ) -> "CompactGraph":
+        """
+        방향 간선 목록으로 CSR 그래프 생성.
+        같은 (src, dst) 간선이 여러 번 들어오면 가장 작은 가중치 하나만 남긴다.
+        """
+        n = len(nodes)
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        weight = np.asarray(weight, dtype=np.float64)
+
+        if len(src):
+            # (src, dst, weight) 순 정렬 후 (src, dst) 첫 항목만 남겨 중복 간선 제거
+            order = np.lexsort((weight, dst, src))
+            src, dst, weight = src[order], dst[order], weight[order]
+            keep = np.ones(len(src), dtype=bool)
+            keep[1:] = (src[1:] != src[:-1]) | (dst[1:] != dst[:-1])
+            src, dst, weight = src[keep], dst[keep], weight[keep]
+
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=offsets[1:])
+
+        coords = np.array(nodes, dtype=np.float64).reshape(n, 2)
+        node_ids = {node: i for i, node in enumerate(nodes)}
+        return cls(coords, offsets, dst.astype(np.int32), weight, node_ids)
+
+    @classmethod
+    def from_adjacency(cls, graph: dict) -> "CompactGraph":
+        """기존 dict 그래프({(lat, lon): [((lat, lon), weight), ...]}) 변환"""
+        node_ids: Dict[Tuple[float, float], int] = {}
+        nodes: List[Tuple[float, float]] = []
+
+        def node_id(p):
+            i = node_ids.get(p)
+            if i is None:
+                i = node_ids[p] = len(nodes)
+                nodes.append(p)
+            return i
+
+        src, dst, weight = [], [], []
+        for p1, edges in graph.items():
+            u = node_id(p1)
+            for p2, w in edges:
+                src.append(u)
+                dst.append(node_id(p2))
+                weight.append(w)
+        return cls.from_edges(nodes, src, dst, weight)
+
+    # --- 조회 ---
+    def __len__(self):
+        return len(self.coords)
+
+    @property
+    def n_edges(self) -> int:
+        return len(self.targets)
+
+    def keys(self) -> List[Tuple[float, float]]:
+        """노드 좌표 목록 (ID 순서) — dict 그래프와 같은 방식으로 스냅/인덱싱에 사용"""
+        return list(self.node_ids)
+
+    def node_id(self, coord: Tuple[float, float]) -> int | None:
+        return self.node_ids.get(coord)
+
+    def coord(self, node_id: int) -> Tuple[float, float]:
+        lat, lon = self.coords[node_id]
+        return (float(lat), float(lon))
+
+    def neighbors(self, node_id: int):
+        """
+        node_id에서 나가는 간선의 (도착 노드 리스트, 가중치 리스트).
+        A* 내부 루프에서 NumPy 스칼라 인덱싱 비용을 피하려고 슬라이스를 리스트로 돌려준다.
+        """
+        s, e = self.offsets[node_id], self.offsets[node_id + 1]
+        return self.targets[s:e].tolist(), self.weights[s:e].tolist()
+
+    def distances_to(self, point: Tuple[float, float]) -> np.ndarray:
+        """모든 노드에서 point까지의 haversine 거리 (m) — A* 휴리스틱 사전 계산용"""
+        return haversine_vec(self.coords[:, 0], self.coords[:, 1], point[0], point[1])
+
+    def nbytes(self) -> int:
+        """좌표/간선 배열이 차지하는 메모리 (bytes)"""
+        return (
+            self.coords.nbytes
+            + self.offsets.nbytes
+            + self.targets.nbytes
+            + self.weights.nbytes
+        )
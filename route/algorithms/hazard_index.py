@@ -0,0 +1,99 @@
+import numpy as np
+
+# segment_circle_intersect와 동일하게 위경도 모두 1도 ≈ 111km로 환산
+DEG_PER_M = 1 / 111000
+
+# 기본 격자 크기 (약 220m) — 카테고리 반경(50~200m)과 비슷한 크기
+DEFAULT_CELL_DEG = 0.002
+
+# 경계값 부동소수점 오차 보정용 여유
+_EPS = 1e-9
+
+# 격자 셀 (i, j) → 정수 키 변환용 오프셋 (위경도 전 범위를 음수 없이 담을 수 있는 크기)
+_KEY_OFFSET = 1 << 24
+
+
+def expand_cells(min_lat, min_lon, max_lat, max_lon, cell_deg: float):
+    """bbox 배열이 덮는 격자 셀을 펼쳐 (bbox 인덱스 배열, 셀 키 배열) 반환"""
+    c = cell_deg
+    i0 = np.floor(np.asarray(min_lat) / c).astype(np.int64)
+    i1 = np.floor(np.asarray(max_lat) / c).astype(np.int64)
+    j0 = np.floor(np.asarray(min_lon) / c).astype(np.int64)
+    j1 = np.floor(np.asarray(max_lon) / c).astype(np.int64)
+    n_i, n_j = i1 - i0 + 1, j1 - j0 + 1
+    counts = n_i * n_j
+
+    owners = np.repeat(np.arange(len(counts)), counts)
+    # bbox 안에서 몇 번째 셀인지 → (di, dj)
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    di = local // n_j[owners]
+    dj = local % n_j[owners]
+    keys = (i0[owners] + di + _KEY_OFFSET) * (2 * _KEY_OFFSET) + (
+        j0[owners] + dj + _KEY_OFFSET
+    )
+    return owners, keys
+
+
+class HazardGridIndex:
+    """
+    위험구역을 반경만큼 확장한 bounding box 기준으로 격자 셀에 미리 배치해 두고,
+    세그먼트가 겹치는 셀의 위험구역만 후보로 돌려주는 공간 인덱스.
+    요청마다 한 번 만들거나, 같은 위험구역 목록이면 여러 요청에서 재사용 가능.
+    """
+
+    def __init__(self, hazards, cell_deg: float = DEFAULT_CELL_DEG):
+        self.hazards = list(hazards)
+        self.cell_deg = cell_deg
+
+        # 위험구역을 반경만큼 확장한 bbox (min_lat, min_lon, max_lat, max_lon)
+        lat = np.array([hz.lat for hz in self.hazards], dtype=np.float64)
+        lon = np.array([hz.lon for hz in self.hazards], dtype=np.float64)
+        r = np.array([hz.radius for hz in self.hazards], dtype=np.float64)
+        r = r * DEG_PER_M + _EPS
+        self._bbox_arr = np.stack([lat - r, lon - r, lat + r, lon + r], axis=1)
+
+        # 셀 키 오름차순으로 정렬된 (셀 키, 위험구역) 목록
+        owners, keys = expand_cells(*self._bbox_arr.T, self.cell_deg)
+        order = np.argsort(keys, kind="stable")
+        self._cell_keys = keys[order]
+        self._cell_owners = owners[order]
+
+    def __len__(self):
+        return len(self.hazards)
+
+    def candidate_pairs(self, p1_lat, p1_lon, p2_lat, p2_lon):
+        """
+        세그먼트 배열 전체에 대해 bbox가 겹치는 (세그먼트 인덱스, 위험구역 인덱스) 쌍을
+        벡터 연산으로 한 번에 구한다. 세그먼트 → 위험구역 입력 순서로 정렬되어 있다.
+        """
+        empty = np.empty(0, dtype=np.int64)
+        if not self.hazards or len(p1_lat) == 0:
+            return empty, empty
+
+        min_lat, max_lat = np.minimum(p1_lat, p2_lat), np.maximum(p1_lat, p2_lat)
+        min_lon, max_lon = np.minimum(p1_lon, p2_lon), np.maximum(p1_lon, p2_lon)
+
+        seg_owners, seg_keys = expand_cells(
+            min_lat, min_lon, max_lat, max_lon, self.cell_deg
+        )
+
+        # 같은 셀 키를 가진 위험구역 범위를 찾아 (세그먼트, 위험구역) 쌍으로 펼침
+        lo = np.searchsorted(self._cell_keys, seg_keys, side="left")
+        hi = np.searchsorted(self._cell_keys, seg_keys, side="right")
+        n = hi - lo
+        seg = np.repeat(seg_owners, n)
+        pos = np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n) + np.repeat(lo, n)
+        hz = self._cell_owners[pos]
+
+        # 여러 셀에서 중복된 쌍 제거 + 정렬
+        pair = np.unique(seg * len(self.hazards) + hz)
+        seg, hz = pair // len(self.hazards), pair % len(self.hazards)
+
+        b = self._bbox_arr[hz]
+        overlap = (
+            (b[:, 0] <= max_lat[seg])
+            & (b[:, 2] >= min_lat[seg])
+            & (b[:, 1] <= max_lon[seg])
+            & (b[:, 3] >= min_lon[seg])
+        )
+        return seg[overlap], hz[overlap]
@@ -0,0 +1,107 @@
+from typing import List, Tuple
+import math
+import numpy as np
+from route.algorithms.safe_path_finder import haversine
+
+# 단위 구 위 현 길이(chord) 비교 시 부동소수점 오차 여유 (지표면 기준 약 6mm)
+_CHORD_TOL = 1e-9
+
+
+def _to_unit_xyz(lat: float, lon: float) -> Tuple[float, float, float]:
+    """위도/경도 → 단위 구 위의 3차원 좌표"""
+    phi, lam = math.radians(lat), math.radians(lon)
+    cos_phi = math.cos(phi)
+    return (cos_phi * math.cos(lam), cos_phi * math.sin(lam), math.sin(phi))
+
+
+def _to_unit_xyz_batch(nodes) -> List[Tuple[float, float, float]]:
+    """_to_unit_xyz의 배열 버전 (인덱스 생성 시 한 번에 투영)"""
+    if not nodes:
+        return []
+    coords = np.radians(np.asarray(nodes, dtype=np.float64))
+    phi, lam = coords[:, 0], coords[:, 1]
+    cos_phi = np.cos(phi)
+    xyz = np.stack([cos_phi * np.cos(lam), cos_phi * np.sin(lam), np.sin(phi)], axis=1)
+    return [tuple(p) for p in xyz.tolist()]
+
+
+class NodeIndex:
+    """
+    그래프 노드 최근접 탐색용 KD-tree.
+    노드를 단위 구 위 3차원 좌표로 투영하면 직선(현) 거리가 haversine 거리와
+    단조 관계이므로, 현 거리로 후보를 좁힌 뒤 haversine으로 최종 선택한다.
+    동점이면 입력 순서가 빠른 노드를 골라 선형 탐색(min)과 같은 결과를 낸다.
+    """
+
+    def __init__(self, nodes):
+        self.nodes: List[Tuple[float, float]] = list(nodes)
+        self._xyz = _to_unit_xyz_batch(self.nodes)
+        self._root = self._build(list(range(len(self.nodes))), 0)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def _build(self, indices: List[int], depth: int):
+        """(노드 인덱스, 분할 축, 왼쪽, 오른쪽) 튜플로 된 균형 KD-tree 생성"""
+        if not indices:
+            return None
+        axis = depth % 3
+        indices.sort(key=lambda i: self._xyz[i][axis])
+        mid = len(indices) // 2
+        return (
+            indices[mid],
+            axis,
+            self._build(indices[:mid], depth + 1),
+            self._build(indices[mid + 1 :], depth + 1),
+        )
+
+    def _search(self, target, bound: float, collect: List[int] | None):
+        """
+        bound(현 거리) 안의 노드를 탐색.
+        collect가 None이면 최근접 거리로 bound를 줄여가며 최소 현 거리를 반환하고,
+        리스트면 bound 안의 모든 노드 인덱스를 모은다.
+        """
+        best = bound
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            idx, axis, left, right = node
+            p = self._xyz[idx]
+            d = math.dist(p, target)
+
+            if collect is not None:
+                if d <= bound:
+                    collect.append(idx)
+            elif d < best:
+                best = d
+
+            diff = target[axis] - p[axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            limit = bound if collect is not None else best
+            if abs(diff) <= limit:
+                stack.append(far)
+            stack.append(near)
+        return best
+
+    def nearest(self, point):
+        """point와 haversine 거리가 가장 가까운 노드 반환 (노드가 없으면 None)"""
+        if not self.nodes:
+            return None
+
+        target = _to_unit_xyz(point[0], point[1])
+        best = self._search(target, math.inf, None)
+
+        # 현 거리와 haversine의 반올림 차이로 순위가 뒤집히지 않도록 여유를 두고 후보 수집
+        candidates: List[int] = []
+        self._search(target, best + _CHORD_TOL, candidates)
+
+        nearest_idx = min(
+            candidates,
+            key=lambda i: (
+                haversine(point[0], point[1], self.nodes[i][0], self.nodes[i][1]),
+                i,
+            ),
+        )
+        return self.nodes[nearest_idx]
@@ -0,0 +1,243 @@
+from typing import Dict, List, Tuple
+import threading
+import numpy as np
+
+from route.algorithms.safe_path_finder import (
+    Hazard,
+    astar_graph,
+    build_graph,
+)
+from route.algorithms.hazard_index import (
+    DEFAULT_CELL_DEG,
+    DEG_PER_M,
+    expand_cells,
+)
+from route.algorithms.node_index import NodeIndex
+from route.algorithms.vectorized import (
+    haversine_vec,
+    segment_circle_intersect_vec,
+    within_corridor,
+)
+
+# 출발/도착 지점이 도로망 노드에서 이 거리보다 멀면 도로망 밖으로 판단
+DEFAULT_MAX_SNAP_M = 200
+
+_EPS = 1e-9
+
+
+def hazard_key(hz: Hazard):
+    """위험구역 식별 키 (제보 ID가 없으면 위치 + 카테고리)"""
+    return hz.report_id or (hz.lat, hz.lon, hz.category)
+
+
+class RoadNetwork:
+    """
+    서비스 지역 보행자 도로망을 메모리에 상주시키고 A* 질의를 처리한다.
+    도로망 기본 가중치(거리)는 한 번만 계산하고, 위험구역 페널티는
+    반경 안 세그먼트에만 더하고 빼는 방식으로 증분 반영한다.
+    """
+
+    def __init__(
+        self,
+        lines: List[List[Tuple[float, float]]],
+        max_snap_m: float = DEFAULT_MAX_SNAP_M,
+        cell_deg: float = DEFAULT_CELL_DEG,
+        bidirectional: bool = False,
+    ):
+        self.graph = build_graph(lines, [])
+        self.node_index = NodeIndex(self.graph.keys())
+        self.max_snap_m = max_snap_m
+        self.bidirectional = bidirectional
+        self.cell_deg = cell_deg
+        self._lock = threading.Lock()
+
+        g = self.graph
+        n = len(g)
+        src = np.repeat(np.arange(n, dtype=np.int64), np.diff(g.offsets))
+        dst = g.targets.astype(np.int64)
+
+        # 양방향 간선 쌍을 하나의 세그먼트로 묶음 (u < v 인 간선 기준)
+        forward = src < dst
+        self.seg_u, self.seg_v = src[forward], dst[forward]
+        seg_keys = self.seg_u * n + self.seg_v
+        order = np.argsort(seg_keys)
+        self.seg_u, self.seg_v, seg_keys = (
+            self.seg_u[order],
+            self.seg_v[order],
+            seg_keys[order],
+        )
+        n_seg = len(seg_keys)
+
+        # 방향 간선 → 세그먼트 ID (길이 0 자기 간선은 페널티가 항상 0인 n_seg)
+        edge_keys = np.minimum(src, dst) * n + np.maximum(src, dst)
+        pos = np.searchsorted(seg_keys, edge_keys)
+        found = (pos < n_seg) & (seg_keys[np.minimum(pos, n_seg - 1)] == edge_keys)
+        self.edge_segment = (
+            np.where(found, pos, n_seg) if n_seg else np.full(len(edge_keys), n_seg)
+        )
+
+        # 세그먼트별 방향 간선 2개의 위치 (페널티 갱신 시 weights 배열에 바로 반영)
+        by_segment = np.argsort(self.edge_segment, kind="stable")
+        self._segment_edges = by_segment[: 2 * n_seg].reshape(n_seg, 2)
+
+        self.base_weights = g.weights.copy()
+        self.penalty = np.zeros(n_seg + 1)
+
+        # 세그먼트 격자 인덱스 (위험구역 bbox가 덮는 셀의 세그먼트만 교차 판정)
+        u_lat, u_lon = g.coords[self.seg_u, 0], g.coords[self.seg_u, 1]
+        v_lat, v_lon = g.coords[self.seg_v, 0], g.coords[self.seg_v, 1]
+        self._seg_coords = np.stack([u_lat, u_lon, v_lat, v_lon], axis=1)
+        owners, keys = expand_cells(
+            np.minimum(u_lat, v_lat),
+            np.minimum(u_lon, v_lon),
+            np.maximum(u_lat, v_lat),
+            np.maximum(u_lon, v_lon),
+            cell_deg,
+        )
+        cell_order = np.argsort(keys, kind="stable")
+        self._cell_keys = keys[cell_order]
+        self._cell_owners = owners[cell_order]
+
+        # 현재 반영된 위험구역: key → (Hazard, 세그먼트 ID 배열, 세그먼트당 페널티)
+        self._applied: Dict[object, Tuple[Hazard, np.ndarray, float]] = {}
+
+    @property
+    def n_segments(self) -> int:
+        return len(self.seg_u)
+
+    # --- 위험구역 페널티 ---
+    def segments_within(self, hz: Hazard) -> np.ndarray:
+        """위험구역 원과 교차하는 세그먼트 ID 배열"""
+        r = hz.radius * DEG_PER_M + _EPS
+        _, keys = expand_cells(
+            [hz.lat - r], [hz.lon - r], [hz.lat + r], [hz.lon + r], self.cell_deg
+        )
+        lo = np.searchsorted(self._cell_keys, keys, side="left")
+        hi = np.searchsorted(self._cell_keys, keys, side="right")
+        if not (hi - lo).any():
+            return np.empty(0, dtype=np.int64)
+
+        candidates = np.unique(
+            np.concatenate([self._cell_owners[a:b] for a, b in zip(lo, hi)])
+        )
+        c = self._seg_coords[candidates]
+        hit = segment_circle_intersect_vec(
+            c[:, 0], c[:, 1], c[:, 2], c[:, 3], hz.lat, hz.lon, hz.radius
+        )
+        return candidates[hit]
+
+    def _add_penalty(self, weights: np.ndarray, segments: np.ndarray, amount: float):
+        if not len(segments):
+            return
+        # 부동소수점 누적 오차로 생기는 아주 작은 음수는 0으로
+        self.penalty[segments] = np.maximum(self.penalty[segments] + amount, 0.0)
+        edges = self._segment_edges[segments].reshape(-1)
+        weights[edges] = (
+            self.base_weights[edges] + self.penalty[self.edge_segment[edges]]
+        )
+
+    def _publish(self, weights: np.ndarray):
+        # 탐색 중인 A*는 이전 배열을 그대로 보고, 다음 탐색부터 새 배열을 봄
+        # (교체 중간 상태 — 제거만 되고 다시 더해지기 전 — 는 보이지 않음)
+        self.graph.weights = weights
+
+    def apply_hazard(self, hz: Hazard):
+        """위험구역 하나를 반영 (같은 키가 이미 있으면 교체)"""
+        with self._lock:
+            weights = self.graph.weights.copy()
+            self._apply(weights, hz)
+            self._publish(weights)
+
+    def remove_hazard(self, key) -> bool:
+        with self._lock:
+            weights = self.graph.weights.copy()
+            removed = self._remove(weights, key)
+            if removed:
+                self._publish(weights)
+            return removed
+
+    def _apply(self, weights: np.ndarray, hz: Hazard):
+        self._remove(weights, hazard_key(hz))
+        segments = self.segments_within(hz)
+        amount = hz.score * 300  # build_graph와 같은 페널티
+        self._add_penalty(weights, segments, amount)
+        self._applied[hazard_key(hz)] = (hz, segments, amount)
+
+    def _remove(self, weights: np.ndarray, key) -> bool:
+        applied = self._applied.pop(key, None)
+        if applied is None:
+            return False
+        _, segments, amount = applied
+        self._add_penalty(weights, segments, -amount)
+        return True
+
+    def sync_hazards(
+        self,
+        hazards: List[Hazard],
+        corridor: List[Tuple[float, float]] | None = None,
+        width_m: float | None = None,
+    ):
+        """
+        조회된 위험구역 목록과 현재 반영 상태를 비교해 바뀐 것만 반영.
+        corridor/width_m(조회한 경로 폭)을 주면 그 범위 안에서만 사라진 위험구역을 제거한다.
+        비교와 반영은 한 번의 잠금 안에서 하고, 가중치는 끝난 뒤 한 번에 교체한다.
+        """
+        incoming = {hazard_key(hz): hz for hz in hazards}
+
+        with self._lock:
+            missing = [
+                (key, hz)
+                for key, (hz, _, _) in self._applied.items()
+                if key not in incoming
+            ]
+            if missing and corridor is not None:
+                inside = within_corridor(
+                    [hz.lat for _, hz in missing],
+                    [hz.lon for _, hz in missing],
+                    corridor,
+                    width_m,
+                )
+                missing = [m for m, keep in zip(missing, inside) if keep]
+            changed = [
+                hz
+                for key, hz in incoming.items()
+                if key not in self._applied
+                or not _same_hazard(self._applied[key][0], hz)
+            ]
+            if not missing and not changed:
+                return
+
+            weights = self.graph.weights.copy()
+            for key, _ in missing:
+                self._remove(weights, key)
+            for hz in changed:
+                self._apply(weights, hz)
+            self._publish(weights)
+
+    # --- 경로 탐색 ---
+    def find_path(
+        self, origin: Tuple[float, float], dest: Tuple[float, float]
+    ) -> List[Dict[str, float]] | None:
+        """
+        도로망 위 A* 경로. 출발/도착이 도로망 밖이거나 경로가 없으면 None.
+        """
+        start = self.node_index.nearest(origin)
+        end = self.node_index.nearest(dest)
+        if start is None or end is None:
+            return None
+
+        snap = haversine_vec(
+            [origin[0], dest[0]],
+            [origin[1], dest[1]],
+            [start[0], end[0]],
+            [start[1], end[1]],
+        )
+        if (snap > self.max_snap_m).any():
+            return None
+
+        # astar_graph는 시작할 때 graph.weights 참조를 한 번 잡으므로 탐색 중 교체돼도 일관됨
+        return astar_graph(self.graph, start, end, self.bidirectional) or None
+
+
+def _same_hazard(a: Hazard, b: Hazard) -> bool:
+    return (a.lat, a.lon, a.radius, a.score) == (b.lat, b.lon, b.radius, b.score)
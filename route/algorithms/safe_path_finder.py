@@ -2,7 +2,11 @@ from typing import List, Dict, Tuple
 from enum import Enum
 import heapq
 import math
+import numpy as np
 from common.logger import logger
+from route.algorithms.hazard_index import HazardGridIndex
+from route.algorithms.compact_graph import CompactGraph
+from route.algorithms.vectorized import haversine_vec, segment_circle_intersect_vec
 
 
 # --- 데이터 모델 ---
@@ -27,12 +31,45 @@ CATEGORY_RADIUS = {
 
 
 class Hazard:
-    def __init__(self, lat: float, lon: float, category: HazardCategory, score: float):
+    def __init__(
+        self,
+        lat: float,
+        lon: float,
+        category: HazardCategory,
+        score: float,
+        report_id: str | None = None,
+    ):
         self.lat = lat
         self.lon = lon
         self.category = category
         self.radius = CATEGORY_RADIUS.get(category, 100)
         self.score = score
+        self.report_id = report_id
+
+
+def hazard_from_report(
+    report_id: str,
+    lat: float | None,
+    lng: float | None,
+    category: str | None,
+    risk_score: float | None,
+) -> Hazard | None:
+    """
+    승인된 제보 → Hazard (위치나 카테고리가 경로 탐색 대상이 아니면 None).
+    점수는 DB에 저장된 report.risk_score를 그대로 쓴다 (없으면 중립 0.5)
+    """
+    if lat is None or lng is None:
+        return None
+    try:
+        category_enum = HazardCategory(category)
+    except ValueError:
+        return None
+
+    score = 0.5 if risk_score is None else round(risk_score, 3)
+
+    return Hazard(
+        lat=lat, lon=lng, category=category_enum, score=score, report_id=report_id
+    )
 
 
 # --- 유틸 함수 ---
@@ -50,13 +87,24 @@ def haversine(lat1, lon1, lat2, lon2):
     return 2 * R * math.atan2(math.sqrt(a), math.sqrt(1 - a))
 
 
-def snap_to_nearest_node(graph, point):
-    """그래프의 노드 중 point와 가장 가까운 노드를 반환"""
+def snap_to_nearest_node(graph, point, index=None):
+    """
+    그래프의 노드 중 point와 가장 가까운 노드를 반환.
+    그래프로 만든 NodeIndex를 넘기면 KD-tree로 찾는다 (상주 RoadNetwork처럼 여러 번 쓰는 그래프용).
+    요청마다 만드는 그래프는 인덱스 구성 비용이 조회 두 번보다 커서 벡터화 선형 탐색을 쓴다.
+    """
     if not graph:
         return point
+    if index is not None:
+        return index.nearest(point)
+    if isinstance(graph, CompactGraph):
+        # 좌표 배열이 이미 있으므로 노드 목록을 다시 만들지 않고 거리 한 번에 계산
+        return graph.coord(int(np.argmin(graph.distances_to(point))))
     nodes = list(graph.keys())
-    nearest = min(nodes, key=lambda n: haversine(point[0], point[1], n[0], n[1]))
-    return nearest
+    coords = np.asarray(nodes, dtype=np.float64)
+    # argmin은 동점일 때 앞쪽 노드를 골라 min()과 같은 결과
+    dists = haversine_vec(point[0], point[1], coords[:, 0], coords[:, 1])
+    return nodes[int(np.argmin(dists))]
 
 
 def segment_circle_intersect(p1, p2, center, radius):
@@ -83,69 +131,243 @@ def segment_circle_intersect(p1, p2, center, radius):
 
 
 # --- 세그먼트 그래프 생성 ---
-def build_graph(lines: List[List[Tuple[float, float]]], hazards: List[Hazard]):
+def build_graph(
+    lines: List[List[Tuple[float, float]]],
+    hazards: List[Hazard],
+    hazard_index: HazardGridIndex | None = None,
+) -> CompactGraph:
     """
-    TMap LineString 데이터를 기반으로 도로 그래프를 구성.
+    TMap LineString 데이터를 기반으로 도로 그래프(CSR)를 구성.
     각 세그먼트에 위험도 가중치를 추가함.
+    hazard_index를 넘기면 재사용하고, 없으면 hazards로 새로 만든다.
+    여러 LineString이 공유하는 꼭짓점은 같은 노드 ID로 합쳐지고 중복 간선은 제거된다.
+    거리/교차 판정은 전체 세그먼트 배열에 대해 벡터 연산으로 한 번에 계산한다.
     """
-    graph = {}
+    if hazard_index is None:
+        hazard_index = HazardGridIndex(hazards)
 
+    # 모든 LineString의 세그먼트를 (S, 2) 배열 두 개로 펼침
+    p1_parts, p2_parts = [], []
     for line in lines:
-        for i in range(len(line) - 1):
-            p1 = line[i]
-            p2 = line[i + 1]
-            dist = haversine(p1[0], p1[1], p2[0], p2[1])
-            weight = dist  # 기본 거리 기반 가중치
-
-            # 위험 구역과 교차하면 페널티 부여
-            for hz in hazards:
-                if segment_circle_intersect(p1, p2, (hz.lat, hz.lon), hz.radius):
-                    weight += hz.score * 300  # 위험도 높은 세그먼트는 회피
+        if len(line) < 2:
+            continue
+        arr = np.asarray(line, dtype=np.float64)
+        p1_parts.append(arr[:-1])
+        p2_parts.append(arr[1:])
+
+    if not p1_parts:
+        return CompactGraph.from_edges([], [], [], [])
+
+    p1 = np.concatenate(p1_parts)
+    p2 = np.concatenate(p2_parts)
+
+    # 기본 거리 기반 가중치
+    weight = haversine_vec(p1[:, 0], p1[:, 1], p2[:, 0], p2[:, 1])
+
+    # 위험 구역과 교차하면 페널티 부여 (bbox가 겹치는 후보 쌍만 검사)
+    seg, hz = hazard_index.candidate_pairs(p1[:, 0], p1[:, 1], p2[:, 0], p2[:, 1])
+    if len(seg):
+        hz_lat = np.array([h.lat for h in hazard_index.hazards])
+        hz_lon = np.array([h.lon for h in hazard_index.hazards])
+        hz_radius = np.array([h.radius for h in hazard_index.hazards], dtype=float)
+        hz_score = np.array([h.score for h in hazard_index.hazards], dtype=float)
+
+        hit = segment_circle_intersect_vec(
+            p1[seg, 0],
+            p1[seg, 1],
+            p2[seg, 0],
+            p2[seg, 1],
+            hz_lat[hz],
+            hz_lon[hz],
+            hz_radius[hz],
+        )
+        penalty = np.zeros(len(p1))
+        np.add.at(
+            penalty, seg[hit], hz_score[hz[hit]] * 300
+        )  # 위험도 높은 세그먼트는 회피
+        weight = weight + penalty
+
+    # 꼭짓점 → 노드 ID (처음 등장한 순서대로 번호 부여)
+    points = np.stack([p1, p2], axis=1).reshape(-1, 2)
+    uniq, first, inverse = np.unique(
+        points, axis=0, return_index=True, return_inverse=True
+    )
+    order = np.argsort(first)
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    ids = rank[inverse.reshape(-1)].reshape(-1, 2)
+    nodes = [tuple(p) for p in uniq[order].tolist()]
+
+    # 양방향 그래프 구성
+    u, v = ids[:, 0], ids[:, 1]
+    return CompactGraph.from_edges(
+        nodes,
+        np.concatenate([u, v]),
+        np.concatenate([v, u]),
+        np.concatenate([weight, weight]),
+    )
 
-            # 양방향 그래프 구성
-            graph.setdefault(p1, []).append((p2, weight))
-            graph.setdefault(p2, []).append((p1, weight))
 
-    return graph
+# --- A* 그래프 탐색 ---
+# 목적지 도착 판정 반경 (m)
+GOAL_RADIUS_M = 100
 
 
-# --- A* 그래프 탐색 ---
-def astar_graph(graph, start: Tuple[float, float], goal: Tuple[float, float]):
+def astar_graph(
+    graph,
+    start: Tuple[float, float],
+    goal: Tuple[float, float],
+    bidirectional: bool = False,
+    stats: Dict[str, int] | None = None,
+):
     """
-    세그먼트 그래프 기반 A* 탐색
+    세그먼트 그래프 기반 A* 탐색.
+    좌표 → 노드 ID 변환은 시작점에서 한 번만 하고, 탐색은 정수 ID로 진행한다.
+    bidirectional=True면 출발/도착 양쪽에서 동시에 탐색한다 (도착점이 그래프 노드일 때).
+    stats를 넘기면 확장한 노드 수를 stats["expanded"]에 기록한다.
     """
-    open_set = []
-    heapq.heappush(open_set, (0, start))
+    if not isinstance(graph, CompactGraph):
+        graph = CompactGraph.from_adjacency(graph)
+
+    start_id = graph.node_id(start)
+    if start_id is None:
+        # 그래프에 없는 출발점은 이웃이 없으므로 출발점 자체만 도착 판정
+        if haversine(start[0], start[1], goal[0], goal[1]) < GOAL_RADIUS_M:
+            return reconstruct_path(graph, {}, None, start, goal)
+        logger.info("A* failed: start node is not in graph")
+        return []
+
+    if bidirectional:
+        goal_id = graph.node_id(goal)
+        if goal_id is not None:
+            return _bidirectional_astar(graph, start_id, goal_id, start, goal, stats)
+
+    # 휴리스틱(노드 → 목적지 거리)과 도착 판정은 탐색 전에 벡터 연산으로 한 번에 계산
+    distances = graph.distances_to(goal)
+    in_goal = (distances < GOAL_RADIUS_M).tolist()
+    heuristic = distances.tolist()
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+
+    n = len(graph)
+    g_score = [math.inf] * n
+    closed = bytearray(n)
     came_from = {}
-    g_score = {start: 0}
+    g_score[start_id] = 0.0
+    open_set = [(heuristic[start_id], start_id)]
+    expanded = 0
 
     while open_set:
         _, current = heapq.heappop(open_set)
 
-        # 도착 기준: 100m 이내
-        if haversine(current[0], current[1], goal[0], goal[1]) < 100:
-            return reconstruct_path(came_from, current, start, goal)
-
-        for neighbor, weight in graph.get(current, []):
-            tentative_g = g_score[current] + weight
-
-            if neighbor not in g_score or tentative_g < g_score[neighbor]:
+        # 더 좋은 g로 이미 확정된 노드의 오래된 힙 항목은 건너뜀
+        if closed[current]:
+            continue
+        closed[current] = 1
+        expanded += 1
+
+        if in_goal[current]:
+            if stats is not None:
+                stats["expanded"] = expanded
+            return reconstruct_path(graph, came_from, current, start, goal)
+
+        current_g = g_score[current]
+        s, e = offsets[current], offsets[current + 1]
+        for neighbor, weight in zip(targets[s:e].tolist(), weights[s:e].tolist()):
+            if closed[neighbor]:
+                continue
+            tentative_g = current_g + weight
+            if tentative_g < g_score[neighbor]:
                 g_score[neighbor] = tentative_g
-                f_score = tentative_g + haversine(
-                    neighbor[0], neighbor[1], goal[0], goal[1]
-                )
-                heapq.heappush(open_set, (f_score, neighbor))
+                heapq.heappush(open_set, (tentative_g + heuristic[neighbor], neighbor))
                 came_from[neighbor] = current
 
-    logger.info(f"A* failed: explored {len(g_score)} nodes but no path reached goal")
+    if stats is not None:
+        stats["expanded"] = expanded
+    logger.info(f"A* failed: explored {expanded} nodes but no path reached goal")
     return []
 
 
-def reconstruct_path(came_from, current, start, goal):
-    """경로 역추적"""
+def _bidirectional_astar(graph: CompactGraph, start_id, goal_id, start, goal, stats):
+    """
+    양방향 A* (평균 포텐셜 p(v) = (h_goal(v) - h_start(v)) / 2).
+    정방향은 p, 역방향은 -p를 쓰면 양쪽이 같은 축소 가중치 그래프 위의 Dijkstra가 되어
+    두 힙의 최소 키 합이 지금까지 찾은 최단 경로 길이 이상이 될 때 멈출 수 있다.
+    build_graph / RoadNetwork 그래프는 양방향 간선이라 역방향 탐색에 같은 CSR을 쓴다.
+    """
+    potential = ((graph.distances_to(goal) - graph.distances_to(start)) * 0.5).tolist()
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+
+    n = len(graph)
+    g = ([math.inf] * n, [math.inf] * n)
+    closed = (bytearray(n), bytearray(n))
+    came = ({}, {})
+    heaps = ([(potential[start_id], start_id)], [(-potential[goal_id], goal_id)])
+    sign = (1.0, -1.0)
+    g[0][start_id] = 0.0
+    g[1][goal_id] = 0.0
+
+    best, meet = (0.0, start_id) if start_id == goal_id else (math.inf, None)
+    expanded = 0
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+
+        # 열린 집합이 작은 쪽을 확장
+        side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+        g_side, g_other = g[side], g[1 - side]
+        closed_side, came_side = closed[side], came[side]
+
+        _, current = heapq.heappop(heaps[side])
+        if closed_side[current]:
+            continue
+        closed_side[current] = 1
+        expanded += 1
+
+        current_g = g_side[current]
+        s, e = offsets[current], offsets[current + 1]
+        for neighbor, weight in zip(targets[s:e].tolist(), weights[s:e].tolist()):
+            if closed_side[neighbor]:
+                continue
+            tentative_g = current_g + weight
+            if tentative_g < g_side[neighbor]:
+                g_side[neighbor] = tentative_g
+                came_side[neighbor] = current
+                heapq.heappush(
+                    heaps[side],
+                    (tentative_g + sign[side] * potential[neighbor], neighbor),
+                )
+                # 반대쪽 탐색이 이미 도달한 노드면 만나는 경로 후보
+                total = tentative_g + g_other[neighbor]
+                if total < best:
+                    best, meet = total, neighbor
+
+    if stats is not None:
+        stats["expanded"] = expanded
+
+    if meet is None:
+        logger.info(
+            f"Bidirectional A* failed: explored {expanded} nodes but searches never met"
+        )
+        return []
+
+    # 출발 → 만난 노드 (정방향 트리), 만난 노드 → 도착 (역방향 트리)
+    nodes = [meet]
+    while nodes[-1] in came[0]:
+        nodes.append(came[0][nodes[-1]])
+    nodes.reverse()
+    while nodes[-1] in came[1]:
+        nodes.append(came[1][nodes[-1]])
+
+    path = [start] + [graph.coord(i) for i in nodes[1:]] + [goal]
+    return [{"lat": lat, "lon": lon} for lat, lon in path]
+
+
+def reconstruct_path(graph: CompactGraph, came_from, current, start, goal):
+    """경로 역추적 (노드 ID → 좌표 변환은 마지막에 한 번)"""
     path = [goal]
     while current in came_from:
-        path.append(current)
+        path.append(graph.coord(current))
         current = came_from[current]
     path.append(start)
     path.reverse()
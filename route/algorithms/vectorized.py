@@ -0,0 +1,78 @@
+import numpy as np
+
+# safe_path_finder의 스칼라 함수(haversine, segment_circle_intersect)와 같은 식을
+# NumPy 배열 단위로 계산하는 배치 버전. 인자는 서로 브로드캐스트 가능한 배열/스칼라.
+
+EARTH_RADIUS_M = 6371000
+
+
+def haversine_vec(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """위도/경도 배열 간 거리 계산 (m 단위)"""
+    phi1, phi2 = np.radians(lat1), np.radians(lat2)
+    dphi = np.radians(np.subtract(lat2, lat1))
+    dlambda = np.radians(np.subtract(lon2, lon1))
+
+    a = np.sin(dphi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def segment_circle_intersect_vec(
+    p1_lat, p1_lon, p2_lat, p2_lon, c_lat, c_lon, radius
+) -> np.ndarray:
+    """
+    선분(p1-p2)과 원(center, radius)의 교차 여부 배열.
+    길이 0인 선분은 스칼라 버전처럼 0으로 나누지 않고 False로 처리한다.
+    """
+    x1, y1 = np.asarray(p1_lon, dtype=np.float64), np.asarray(p1_lat, dtype=np.float64)
+    x2, y2 = np.asarray(p2_lon, dtype=np.float64), np.asarray(p2_lat, dtype=np.float64)
+    cx, cy = np.asarray(c_lon, dtype=np.float64), np.asarray(c_lat, dtype=np.float64)
+
+    dx, dy = x2 - x1, y2 - y1
+    fx, fy = x1 - cx, y1 - cy
+
+    a = dx * dx + dy * dy
+    b = 2 * (fx * dx + fy * dy)
+    r = np.asarray(radius, dtype=np.float64) / 111000
+    c = (fx * fx + fy * fy) - r * r
+
+    discriminant = b * b - 4 * a * c
+    valid = (discriminant >= 0) & (a > 0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        root = np.sqrt(np.where(valid, discriminant, 0.0))
+        t1 = (-b - root) / (2 * a)
+        t2 = (-b + root) / (2 * a)
+
+    hit = ((0 <= t1) & (t1 <= 1)) | ((0 <= t2) & (t2 <= 1))
+    return valid & hit
+
+
+def within_corridor(lat, lon, corridor, width_m) -> np.ndarray:
+    """
+    점들이 폴리라인(corridor: [(lat, lon), ...]) 으로부터 width_m 이내인지 여부 배열.
+    폴리라인 평균 위도 기준 평면(m) 근사로 점-선분 최단 거리를 계산한다.
+    점이 하나뿐인 폴리라인은 원(반경 width_m)으로 취급한다.
+    """
+    line = np.asarray(corridor, dtype=np.float64).reshape(-1, 2)
+    lat = np.atleast_1d(np.asarray(lat, dtype=np.float64))
+    lon = np.atleast_1d(np.asarray(lon, dtype=np.float64))
+    if not len(line) or not len(lat):
+        return np.zeros(len(lat), dtype=bool)
+
+    kx = 111000 * np.cos(np.radians(line[:, 0].mean()))
+    ky = 111000
+    if len(line) == 1:
+        line = np.vstack([line, line])
+
+    ax, ay = line[:-1, 1] * kx, line[:-1, 0] * ky
+    dx, dy = line[1:, 1] * kx - ax, line[1:, 0] * ky - ay
+    px, py = lon[:, None] * kx, lat[:, None] * ky
+
+    # (점 수, 선분 수) 행렬로 선분 위 최근접점 t ∈ [0, 1]
+    seg_len2 = dx * dx + dy * dy
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t = ((px - ax) * dx + (py - ay) * dy) / seg_len2
+    t = np.clip(np.nan_to_num(t), 0.0, 1.0)
+
+    dist2 = (px - (ax + t * dx)) ** 2 + (py - (ay + t * dy)) ** 2
+    return (dist2 <= width_m * width_m).any(axis=1)
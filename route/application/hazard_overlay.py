@@ -0,0 +1,108 @@
+import threading
+import time
+from typing import Callable
+
+from common.logger import logger
+from report.domain.repository.report_repo import ReportRepository
+from report.domain.risk_score import DEFAULT_MIN_RISK_SCORE
+from route.algorithms.road_network import RoadNetwork
+from route.algorithms.safe_path_finder import hazard_from_report
+
+# 다른 워커 프로세스에서 바뀐 제보까지 맞추기 위한 전체 재동기화 주기 (초)
+DEFAULT_RESYNC_S = 300
+
+
+class HazardOverlay:
+    """
+    상주 도로망(RoadNetwork)의 세그먼트별 위험 페널티를 요청 사이에 유지한다.
+    서버 시작 시 승인된 전체 제보로 채우고(warm), 이후에는 제보 승인/삭제/점수 변경
+    시점에 해당 위험구역 반경 안 세그먼트만 갱신한다.
+    경로 요청마다 위험 제보를 조회해 다시 맞추던 작업은 resync_s 주기의 전체
+    재동기화로 대체된다 (다른 프로세스에서 처리된 변경 반영용).
+    위험도(risk_score)가 min_risk_score 미만인 제보는 페널티를 두지 않는다.
+    """
+
+    def __init__(
+        self,
+        road_network: RoadNetwork,
+        report_repo: ReportRepository,
+        resync_s: float = DEFAULT_RESYNC_S,
+        clock: Callable[[], float] = time.monotonic,
+        min_risk_score: float = DEFAULT_MIN_RISK_SCORE,
+    ):
+        self.road_network = road_network
+        self.report_repo = report_repo
+        self.resync_s = resync_s
+        self.min_risk_score = min_risk_score
+        self._clock = clock
+        self._refresh_lock = threading.Lock()
+        self.synced_at: float | None = None
+
+    def warm(self):
+        """승인된 전체 제보와 현재 페널티를 비교해 바뀐 위험구역만 반영"""
+        hazards = self.report_repo.find_approved_hazards(self.min_risk_score)
+        self.road_network.sync_hazards(hazards)
+        self.synced_at = self._clock()
+        logger.info(f"Hazard overlay synced: {len(hazards)} hazards")
+
+    def is_fresh(self) -> bool:
+        return (
+            self.synced_at is not None
+            and self._clock() - self.synced_at < self.resync_s
+        )
+
+    def refresh(self) -> bool:
+        """
+        재동기화 주기가 지났으면 다시 맞춘다. 반환값은 오버레이를 경로 탐색에
+        바로 써도 되는지 여부 (다른 요청이 갱신 중이면 기존 상태를 그대로 사용).
+        """
+        if not self._refresh_lock.acquire(blocking=False):
+            return self.synced_at is not None
+        try:
+            if not self.is_fresh():
+                self.warm()
+            return True
+        except Exception as e:
+            logger.warning(f"Hazard overlay sync failed: {e}")
+            return False
+        finally:
+            self._refresh_lock.release()
+
+    # --- 제보 변경 반영 ---
+    def update_report(self, report):
+        """
+        제보 상태/점수 변경 반영 (승인 상태가 아니거나 위험도가 임계값 미만이면
+        페널티 제거). 점수는 DB가 계산해 돌려준 report.risk_score를 쓴다
+        """
+        hz = None
+        if report.status == "APPROVED" and (
+            report.risk_score is None or report.risk_score >= self.min_risk_score
+        ):
+            hz = hazard_from_report(
+                report.report_id,
+                report.location_lat,
+                report.location_lng,
+                report.category,
+                report.risk_score,
+            )
+        if hz is None:
+            self.road_network.remove_hazard(report.report_id)
+        else:
+            self.road_network.apply_hazard(hz)
+
+    def remove_report(self, report_id: str):
+        self.road_network.remove_hazard(report_id)
+
+
+def create_hazard_overlay(
+    road_network: RoadNetwork | None,
+    report_repo: ReportRepository,
+    resync_s: float = DEFAULT_RESYNC_S,
+    min_risk_score: float = DEFAULT_MIN_RISK_SCORE,
+) -> HazardOverlay | None:
+    """상주 도로망이 있을 때만 오버레이 생성"""
+    if road_network is None:
+        return None
+    return HazardOverlay(
+        road_network, report_repo, resync_s, min_risk_score=min_risk_score
+    )
@@ -1,27 +1,61 @@
+import asyncio
+import time
 import ulid
-import requests
 from datetime import datetime, timezone
 from typing import List, Dict, Optional
 from route.domain.route import Route
 from route.domain.repository.route_repo import RouteRepository
 from report.domain.repository.report_repo import ReportRepository
+from report.domain.risk_score import DEFAULT_MIN_RISK_SCORE
 from route.algorithms.safe_path_finder import (
     build_graph,
     astar_graph,
     Hazard,
     snap_to_nearest_node,
 )
+from route.algorithms.road_network import RoadNetwork
+from route.application.hazard_overlay import HazardOverlay
+from route.infra.tmap_client import TMapClient
 from config import get_settings
+from common.logger import logger
+
+# 위험 제보 조회 회랑 폭 (m). 경로 폴리라인을 알면 좁게, 출발-도착 직선만 알면 넓게
+HAZARD_CORRIDOR_M = 300
+HAZARD_OD_CORRIDOR_M = 1000
+
+
+async def _timed(timings: Dict[str, float], stage: str, awaitable):
+    """awaitable 실행 시간(ms)을 timings[stage]에 기록"""
+    t0 = time.perf_counter()
+    try:
+        return await awaitable
+    finally:
+        timings[stage] = (time.perf_counter() - t0) * 1000
 
 
 class RouteService:
-    def __init__(self, repo: RouteRepository, report_repo: ReportRepository):
+    def __init__(
+        self,
+        repo: RouteRepository,
+        report_repo: ReportRepository,
+        road_network: RoadNetwork | None = None,
+        tmap_client: TMapClient | None = None,
+        hazard_overlay: HazardOverlay | None = None,
+        corridor_m: float = HAZARD_CORRIDOR_M,
+        od_corridor_m: float = HAZARD_OD_CORRIDOR_M,
+        min_risk_score: float = DEFAULT_MIN_RISK_SCORE,
+    ):
         self.repo = repo
         self.report_repo = report_repo
-        self.settings = get_settings()
+        self.road_network = road_network
+        self.hazard_overlay = hazard_overlay
+        self.corridor_m = corridor_m
+        self.od_corridor_m = od_corridor_m
+        self.min_risk_score = min_risk_score
+        self.tmap_client = tmap_client or TMapClient(get_settings().tmap_app_key)
 
     # 미리보기 (경로 생성만, 저장 X)
-    def generate_safe_route(
+    async def generate_safe_route(
         self,
         origin_lat: float,
         origin_lng: float,
@@ -29,69 +63,134 @@ class RouteService:
         dest_lng: float,
     ) -> List[Dict[str, float]]:
         """
-        1. TMap 보행자 경로를 요청해 기본 좌표 경로를 받는다.
-        2. PostGIS를 이용해 근처 위험 제보만 불러와 Hazard 리스트를 만든다.
-        3. 위험도 기반으로 A* 알고리즘을 돌려 안전한 경로를 반환한다.
+        1. PostGIS를 이용해 경로 회랑 안의 위험 제보만 불러와 Hazard 리스트를 만든다.
+           TMap 경로가 캐시에 있으면 그 폴리라인 기준(corridor_m),
+           아니면 출발-도착 선분 기준(od_corridor_m)으로 조회한다.
+        2. 메모리에 올려둔 도로망이 있으면 위험 페널티를 증분 반영하고 바로 A*를 돌린다.
+           상주 위험 페널티 오버레이가 최신이면 위험 제보 조회 없이 바로 탐색한다.
+        3. 도로망이 없거나 범위 밖이면 TMap 보행자 경로로 그래프를 만들어 A*를 돌린다.
+        DB 조회와 그래프 탐색은 스레드에서 돌려 이벤트 루프를 막지 않는다.
+        위험 제보 조회와 TMap 호출은 서로 독립이라 둘 다 필요하면 동시에 실행한다.
         """
-        # PostGIS로 반경 내 위험 제보 조회
-        hazards = self.report_repo.find_nearby(
-            origin_lat, origin_lng, dest_lat, dest_lng, buffer_m=2000
+        origin = (origin_lat, origin_lng)
+        dest = (dest_lat, dest_lng)
+        timings: Dict[str, float] = {}
+        t0 = time.perf_counter()
+
+        od_segment = [origin, dest]
+
+        # PostGIS로 경로 회랑(폭 width_m) 안의 위험 제보 조회
+        def fetch_hazards(corridor, width_m):
+            return _timed(
+                timings,
+                "hazards",
+                asyncio.to_thread(
+                    self.report_repo.find_along_route,
+                    corridor,
+                    width_m,
+                    self.min_risk_score,
+                ),
+            )
+
+        def fetch_tmap():
+            # 캐시 miss를 확인한 뒤에만 호출되므로 캐시 조회는 건너뛴다
+            return _timed(
+                timings,
+                "tmap",
+                self.tmap_client.get_pedestrian_route(
+                    origin_lat, origin_lng, dest_lat, dest_lng, check_cache=False
+                ),
+            )
+
+        try:
+            hazards = None
+
+            # 상주 도로망 A* (외부 HTTP 호출 없음)
+            if self.road_network is not None:
+                if await self._overlay_ready():
+                    search = asyncio.to_thread(
+                        self.road_network.find_path, origin, dest
+                    )
+                else:
+                    hazards = await fetch_hazards(od_segment, self.od_corridor_m)
+                    search = asyncio.to_thread(
+                        self._find_on_road_network, hazards, origin, dest
+                    )
+                path = await _timed(timings, "road_network", search)
+                if path is not None:
+                    return path
+                logger.info("Road network miss — falling back to TMap route.")
+
+            base_lines = self.tmap_client.cached_route(
+                origin_lat, origin_lng, dest_lat, dest_lng
+            )
+            if base_lines is not None:
+                # 캐시된 경로 폴리라인을 따라 좁은 회랑으로 조회
+                if hazards is None:
+                    polyline = [pt for line in base_lines for pt in line]
+                    hazards = await fetch_hazards(polyline, self.corridor_m)
+            elif hazards is None:
+                # 위험 제보 조회와 TMap 호출 동시 실행 → 지연 ≈ max(둘)
+                hazards, base_lines = await asyncio.gather(
+                    fetch_hazards(od_segment, self.od_corridor_m), fetch_tmap()
+                )
+            else:
+                base_lines = await fetch_tmap()
+
+            # 위험구역이 없으면 기본 경로 반환
+            if not hazards:
+                print("No hazards nearby — returning base route directly.")
+                flat_path = [
+                    {"lat": lat, "lon": lon} for line in base_lines for lat, lon in line
+                ]
+                return flat_path
+
+            return await _timed(
+                timings,
+                "astar",
+                asyncio.to_thread(
+                    self._find_on_lines, base_lines, hazards, origin, dest
+                ),
+            )
+        finally:
+            timings["total"] = (time.perf_counter() - t0) * 1000
+            logger.info(
+                "Route preview timings (ms): "
+                + " ".join(f"{k}={v:.1f}" for k, v in timings.items())
+            )
+
+    async def _overlay_ready(self) -> bool:
+        """상주 위험 페널티 오버레이를 그대로 써도 되는지 (주기가 지났으면 재동기화)"""
+        overlay = self.hazard_overlay
+        if overlay is None:
+            return False
+        if overlay.is_fresh():
+            return True
+        return await asyncio.to_thread(overlay.refresh)
+
+    def _find_on_road_network(
+        self, hazards: List[Hazard], origin: tuple, dest: tuple
+    ) -> Optional[List[Dict[str, float]]]:
+        # 조회한 회랑 밖의 기존 페널티는 건드리지 않는다
+        self.road_network.sync_hazards(
+            hazards, corridor=[origin, dest], width_m=self.od_corridor_m
         )
+        return self.road_network.find_path(origin, dest)
 
-        # TMap 보행자 경로 API 호출
-        url = "https://apis.openapi.sk.com/tmap/routes/pedestrian?version=1&format=json"
-
-        headers = {
-            "appKey": self.settings.tmap_app_key,
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
-
-        data = {
-            "startX": origin_lng,
-            "startY": origin_lat,
-            "endX": dest_lng,
-            "endY": dest_lat,
-            "reqCoordType": "WGS84GEO",
-            "resCoordType": "WGS84GEO",
-            "startName": "출발지",
-            "endName": "도착지",
-        }
-
-        response = requests.post(url, headers=headers, data=data)
-
-        response.raise_for_status()
-        features = response.json().get("features", [])
-
-        # LineString 좌표 추출 (기본 경로)
-        base_lines = []
-        for f in features:
-            geom = f.get("geometry")
-            if geom and geom.get("type") == "LineString":
-                coords = geom["coordinates"]
-                # [lon, lat] → (lat, lon)
-                line = [(c[1], c[0]) for c in coords]
-                base_lines.append(line)
-
-        # 위험구역이 없으면 기본 경로 반환
-        if not hazards:
-            print("No hazards nearby — returning base route directly.")
-            flat_path = [
-                {"lat": lat, "lon": lon} for line in base_lines for lat, lon in line
-            ]
-            return flat_path
-
-        # 위험구역 객체 변환
-        hazard_objs = hazards
-
+    def _find_on_lines(
+        self, base_lines: list, hazards: List[Hazard], origin: tuple, dest: tuple
+    ) -> List[Dict[str, float]]:
         # 그래프 구성
-        graph = build_graph(base_lines, hazard_objs)
+        graph = build_graph(base_lines, hazards)
 
-        # A* 기반 위험 회피 경로 생성
-        start = snap_to_nearest_node(graph, (origin_lat, origin_lng))
-        end = snap_to_nearest_node(graph, (dest_lat, dest_lng))
-        safe_path = astar_graph(graph, start, end)
+        # A* 기반 위험 회피 경로 생성 (요청마다 만드는 그래프라 KD-tree 없이 벡터화 스냅)
+        start = snap_to_nearest_node(graph, origin)
+        end = snap_to_nearest_node(graph, dest)
+        return astar_graph(graph, start, end)
 
-        return safe_path
+    def get_tmap_cache_stats(self) -> dict | None:
+        """TMap 경로 캐시 hit/miss 카운터 (캐시 미사용 시 None)"""
+        return self.tmap_client.cache_stats()
 
     # 실제 이동 시 DB 저장
     def save_route_if_traveled(
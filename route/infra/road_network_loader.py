@@ -0,0 +1,59 @@
+import json
+from typing import List, Tuple
+
+from config import get_settings
+from common.logger import logger
+from route.algorithms.road_network import RoadNetwork
+
+# OSM 추출본에서 보행이 불가능한 도로 종류
+NON_PEDESTRIAN_HIGHWAYS = {"motorway", "motorway_link", "trunk", "trunk_link"}
+
+
+def load_road_lines(path: str) -> List[List[Tuple[float, float]]]:
+    """
+    GeoJSON FeatureCollection에서 보행자 도로 LineString 목록을 읽는다.
+    OSM 추출본(osmium export 등)과 캐시해 둔 TMap 응답(features) 모두 같은 형식.
+    좌표는 GeoJSON의 [lon, lat] → (lat, lon)으로 변환.
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    lines = []
+    for feature in data.get("features", []):
+        props = feature.get("properties") or {}
+        if props.get("highway") in NON_PEDESTRIAN_HIGHWAYS:
+            continue
+
+        geom = feature.get("geometry") or {}
+        if geom.get("type") == "LineString":
+            parts = [geom["coordinates"]]
+        elif geom.get("type") == "MultiLineString":
+            parts = geom["coordinates"]
+        else:
+            continue
+
+        for coords in parts:
+            line = [(c[1], c[0]) for c in coords]
+            if len(line) >= 2:
+                lines.append(line)
+
+    return lines
+
+
+def load_road_network() -> RoadNetwork | None:
+    """설정된 도로망 파일을 읽어 RoadNetwork 생성 (설정이 없으면 None)"""
+    settings = get_settings()
+    if not settings.road_network_path:
+        return None
+
+    lines = load_road_lines(settings.road_network_path)
+    network = RoadNetwork(
+        lines,
+        max_snap_m=settings.road_network_max_snap_m,
+        bidirectional=settings.road_network_bidirectional_astar,
+    )
+    logger.info(
+        f"Road network loaded: {len(network.graph)} nodes, "
+        f"{network.n_segments} segments from {settings.road_network_path}"
+    )
+    return network
@@ -0,0 +1,103 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, List, Tuple
+import threading
+import time
+
+# 캐시 값: TMap 응답에서 추출한 LineString 목록 [(lat, lon), ...]
+RouteLines = List[List[Tuple[float, float]]]
+
+
+def route_cache_key(
+    origin_lat: float,
+    origin_lng: float,
+    dest_lat: float,
+    dest_lng: float,
+    precision: int,
+) -> str:
+    """출발/도착 좌표를 소수점 precision 자리 격자로 맞춘 캐시 키 (4자리 ≈ 11m)"""
+    return ":".join(
+        f"{round(v, precision):.{precision}f}"
+        for v in (origin_lat, origin_lng, dest_lat, dest_lng)
+    )
+
+
+class TMapRouteCache(ABC):
+    """
+    TMap 보행자 경로 캐시 인터페이스.
+    프로세스 내 캐시(InMemoryTMapRouteCache) 외에 Redis 같은 공유 캐시도 같은 형태로 구현.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> RouteLines | None:
+        """키에 해당하는 경로 (없거나 만료됐으면 None)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, lines: RouteLines) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """hit/miss 등 카운터"""
+        raise NotImplementedError
+
+
+class InMemoryTMapRouteCache(TMapRouteCache):
+    """TTL + 최대 개수 제한 LRU 캐시 (프로세스 내, thread-safe)"""
+
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        ttl_s: float = 86400,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl_s = ttl_s
+        self._clock = clock
+        self._data: OrderedDict[str, Tuple[float, RouteLines]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> RouteLines | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, lines = entry
+            if expires_at <= self._clock():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return lines
+
+    def set(self, key: str, lines: RouteLines) -> None:
+        with self._lock:
+            self._data[key] = (self._clock() + self.ttl_s, lines)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "backend": "memory",
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRatio": round(self.hits / total, 4) if total else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
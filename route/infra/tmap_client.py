@@ -0,0 +1,128 @@
+import asyncio
+
+import aiohttp
+
+from route.infra.tmap_cache import RouteLines, TMapRouteCache, route_cache_key
+
+TMAP_BASE_URL = "https://apis.openapi.sk.com"
+TMAP_PEDESTRIAN_PATH = "/tmap/routes/pedestrian?version=1&format=json"
+
+
+def parse_route_lines(features: list) -> RouteLines:
+    """TMap 응답 features에서 LineString 좌표 추출 ([lon, lat] → (lat, lon))"""
+    lines = []
+    for f in features:
+        geom = f.get("geometry")
+        if geom and geom.get("type") == "LineString":
+            coords = geom["coordinates"]
+            lines.append([(c[1], c[0]) for c in coords])
+    return lines
+
+
+class TMapClient:
+    """
+    TMap 보행자 경로 API 비동기 클라이언트 (출발/도착 격자 기준 캐시).
+    프로세스당 하나의 aiohttp.ClientSession을 공유해 keep-alive 연결을 재사용하고,
+    동시에 나가는 TMap 요청 수는 max_concurrency로 제한한다.
+    """
+
+    def __init__(
+        self,
+        app_key: str,
+        cache: TMapRouteCache | None = None,
+        cache_precision: int = 4,
+        base_url: str = TMAP_BASE_URL,
+        connect_timeout_s: float = 3.0,
+        read_timeout_s: float = 10.0,
+        max_connections: int = 20,
+        max_concurrency: int = 20,
+    ):
+        self.app_key = app_key
+        self.cache = cache
+        self.cache_precision = cache_precision
+        self.base_url = base_url
+        self.timeout = aiohttp.ClientTimeout(
+            sock_connect=connect_timeout_s, sock_read=read_timeout_s
+        )
+        self.max_connections = max_connections
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._session: aiohttp.ClientSession | None = None
+
+    def _client(self) -> aiohttp.ClientSession:
+        # 이벤트 루프 안에서 처음 쓸 때 생성 (서버 시작 전 import 시점에는 루프가 없음)
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def get_pedestrian_route(
+        self,
+        origin_lat: float,
+        origin_lng: float,
+        dest_lat: float,
+        dest_lng: float,
+        check_cache: bool = True,
+    ) -> RouteLines:
+        """check_cache=False면 캐시 조회를 건너뛴다 (cached_route로 이미 miss 확인한 경우)"""
+        key = route_cache_key(
+            origin_lat, origin_lng, dest_lat, dest_lng, self.cache_precision
+        )
+        if check_cache and self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        headers = {
+            "appKey": self.app_key,
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
+
+        data = {
+            "startX": origin_lng,
+            "startY": origin_lat,
+            "endX": dest_lng,
+            "endY": dest_lat,
+            "reqCoordType": "WGS84GEO",
+            "resCoordType": "WGS84GEO",
+            "startName": "출발지",
+            "endName": "도착지",
+        }
+
+        async with self._semaphore:
+            async with self._client().post(
+                TMAP_PEDESTRIAN_PATH, headers=headers, data=data
+            ) as response:
+                response.raise_for_status()
+                body = await response.json(content_type=None)
+        lines = parse_route_lines(body.get("features", []))
+
+        if self.cache is not None and lines:
+            self.cache.set(key, lines)
+        return lines
+
+    def cached_route(
+        self,
+        origin_lat: float,
+        origin_lng: float,
+        dest_lat: float,
+        dest_lng: float,
+    ) -> RouteLines | None:
+        """TMap 호출 없이 캐시에 있는 경로만 조회"""
+        if self.cache is None:
+            return None
+        return self.cache.get(
+            route_cache_key(
+                origin_lat, origin_lng, dest_lat, dest_lng, self.cache_precision
+            )
+        )
+
+    def cache_stats(self) -> dict | None:
+        return self.cache.stats() if self.cache is not None else None
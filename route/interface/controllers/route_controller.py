@@ -4,7 +4,7 @@ from pydantic import BaseModel, Field
 from typing import List, Dict, Optional
 from containers import Container
 from route.application.route_service import RouteService
-from common.auth import get_current_user, CurrentUser
+from common.auth import get_admin_user, get_current_user, CurrentUser
 
 router = APIRouter(prefix="/routes", tags=["routes"])
 
@@ -37,11 +37,11 @@ class RouteEvaluationRequest(BaseModel):
 # 경로 미리보기 (저장 안 함)
 @router.post("/preview", response_model=PreviewResponse)
 @inject
-def preview_route(
+async def preview_route(
     req: RoutePreviewRequest = Body(...),
     service: RouteService = Depends(Provide[Container.route_service]),
 ):
-    path = service.generate_safe_route(
+    path = await service.generate_safe_route(
         origin_lat=req.origin_lat,
         origin_lng=req.origin_lng,
         dest_lat=req.dest_lat,
@@ -50,6 +50,19 @@ def preview_route(
     return PreviewResponse(path=path)
 
 
+# TMap 경로 캐시 hit/miss 현황 (절약된 TMap 호출량 확인용, 관리자)
+@router.get("/tmap-cache/stats")
+@inject
+def get_tmap_cache_stats(
+    service: RouteService = Depends(Provide[Container.route_service]),
+    admin: CurrentUser = Depends(get_admin_user),
+):
+    stats = service.get_tmap_cache_stats()
+    if stats is None:
+        return {"enabled": False}
+    return {"enabled": True, **stats}
+
+
 # 실제 이동 후 저장
 @router.post("/", response_model=SaveResponse)
 @inject
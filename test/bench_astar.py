@@ -0,0 +1,215 @@
+# A* 그래프 표현 벤치마크 (dict 그래프 vs CSR CompactGraph)
+# + 탐색 방식 비교 (기존 CSR A* vs 중복 확장 제거 A* vs 양방향 A*)
+# poetry run python -m test.bench_astar
+import heapq
+import random
+import time
+import tracemalloc
+
+from route.algorithms.compact_graph import CompactGraph
+from route.algorithms.safe_path_finder import astar_graph, haversine, reconstruct_path
+
+LAT0, LON0 = 37.5665, 126.9780
+GRID_SIZES = [30, 60, 120]
+SEARCH_GRID_SIZES = [60, 120, 250]
+STEP = 0.0005  # 약 55m 간격 격자
+
+
+def make_grid_dict(size, rng):
+    """size × size 격자 도로망 dict 그래프 (간선마다 무작위 위험 페널티)"""
+    graph = {}
+    for i in range(size):
+        for j in range(size):
+            p1 = (round(LAT0 + i * STEP, 6), round(LON0 + j * STEP, 6))
+            for di, dj in ((1, 0), (0, 1)):
+                if i + di >= size or j + dj >= size:
+                    continue
+                p2 = (
+                    round(LAT0 + (i + di) * STEP, 6),
+                    round(LON0 + (j + dj) * STEP, 6),
+                )
+                w = haversine(*p1, *p2)
+                if rng.random() < 0.1:
+                    w += rng.uniform(0.1, 2.0) * 300
+                graph.setdefault(p1, []).append((p2, w))
+                graph.setdefault(p2, []).append((p1, w))
+    return graph
+
+
+def astar_dict(graph, start, goal):
+    """CSR 도입 전 dict 기반 A*"""
+    open_set = [(0, start)]
+    came_from = {}
+    g_score = {start: 0}
+    while open_set:
+        _, current = heapq.heappop(open_set)
+        if haversine(current[0], current[1], goal[0], goal[1]) < 100:
+            return current
+        for neighbor, weight in graph.get(current, []):
+            tentative_g = g_score[current] + weight
+            if neighbor not in g_score or tentative_g < g_score[neighbor]:
+                g_score[neighbor] = tentative_g
+                f = tentative_g + haversine(neighbor[0], neighbor[1], goal[0], goal[1])
+                heapq.heappush(open_set, (f, neighbor))
+                came_from[neighbor] = current
+    return None
+
+
+def make_walled_grid(size):
+    """
+    목적지를 ㄷ자 도로폐쇄 구역(큰 페널티)이 둘러싼 격자. 출발지 쪽은 막혀 있어
+    단방향 A*는 벽 앞을 넓게 훑고, 역방향 탐색은 열린 면으로 바로 빠져나온다.
+    """
+    center, half = size // 2, size // 6
+
+    def inside(i, j):
+        return abs(i - center) <= half and abs(j - center) <= half
+
+    graph = {}
+    for i in range(size):
+        for j in range(size):
+            p1 = (round(LAT0 + i * STEP, 6), round(LON0 + j * STEP, 6))
+            for di, dj in ((1, 0), (0, 1)):
+                i2, j2 = i + di, j + dj
+                if i2 >= size or j2 >= size:
+                    continue
+                p2 = (round(LAT0 + i2 * STEP, 6), round(LON0 + j2 * STEP, 6))
+                w = haversine(*p1, *p2)
+                if inside(i, j) != inside(i2, j2) and i2 <= center + half:
+                    w += 100000
+                graph.setdefault(p1, []).append((p2, w))
+                graph.setdefault(p2, []).append((p1, w))
+
+    start = (round(LAT0, 6), round(LON0 + center * STEP, 6))
+    goal = (round(LAT0 + center * STEP, 6), round(LON0 + center * STEP, 6))
+    return graph, start, goal
+
+
+def astar_csr_legacy(graph, start, goal, stats):
+    """closed set / 오래된 힙 항목 검사 도입 전 CSR A* (확장 노드 수 집계용)"""
+    start_id = graph.node_id(start)
+    heuristic = graph.distances_to(goal).tolist()
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    open_set = [(0, start_id)]
+    came_from = {}
+    g_score = {start_id: 0}
+    expanded = 0
+    while open_set:
+        _, current = heapq.heappop(open_set)
+        expanded += 1
+        if heuristic[current] < 100:
+            stats["expanded"] = expanded
+            return reconstruct_path(graph, came_from, current, start, goal)
+        current_g = g_score[current]
+        s, e = offsets[current], offsets[current + 1]
+        for neighbor, weight in zip(targets[s:e].tolist(), weights[s:e].tolist()):
+            tentative_g = current_g + weight
+            if neighbor not in g_score or tentative_g < g_score[neighbor]:
+                g_score[neighbor] = tentative_g
+                heapq.heappush(open_set, (tentative_g + heuristic[neighbor], neighbor))
+                came_from[neighbor] = current
+    stats["expanded"] = expanded
+    return []
+
+
+def measure_memory(build):
+    tracemalloc.start()
+    obj = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, size
+
+
+def timed(fn, *args, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+SEARCH_MODES = [
+    ("legacy", lambda g, s, t, st: astar_csr_legacy(g, s, t, st)),
+    ("closed", lambda g, s, t, st: astar_graph(g, s, t, stats=st)),
+    ("bidir", lambda g, s, t, st: astar_graph(g, s, t, True, st)),
+]
+
+
+def search_benchmark(rng, pairs=20):
+    """
+    격자 크기별 평균 확장 노드 수와 시간.
+    random: 무작위 출발/도착 쌍, walled: 목적지가 도로폐쇄 구역에 둘러싸인 장거리 경로.
+    cost ratio는 legacy 대비 경로 비용 (양방향은 100m 반경이 아니라 도착 노드까지 탐색).
+    """
+    print(
+        f"\n{'grid':>8} {'scenario':>8} {'mode':>8} {'expanded':>9} "
+        f"{'ms/query':>9} {'cost ratio':>11}"
+    )
+    for size in SEARCH_GRID_SIZES:
+        compact = CompactGraph.from_adjacency(make_grid_dict(size, rng))
+        nodes = compact.keys()
+        queries = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(pairs)]
+        run_search_modes(size, "random", compact, queries)
+
+    for size in SEARCH_GRID_SIZES:
+        graph, start, goal = make_walled_grid(size)
+        run_search_modes(
+            size, "walled", CompactGraph.from_adjacency(graph), [(start, goal)]
+        )
+
+
+def run_search_modes(size, scenario, compact, queries):
+    baseline_cost = None
+    for name, fn in SEARCH_MODES:
+        expanded, elapsed, cost = 0, 0.0, 0.0
+        for start, goal in queries:
+            stats = {}
+            t0 = time.perf_counter()
+            path = fn(compact, start, goal, stats)
+            elapsed += time.perf_counter() - t0
+            expanded += stats["expanded"]
+            cost += path_cost(compact, path)
+        baseline_cost = baseline_cost or cost
+        print(
+            f"{size}x{size:<5} {scenario:>8} {name:>8} {expanded / len(queries):>9.0f} "
+            f"{elapsed / len(queries) * 1000:>9.1f} {cost / baseline_cost:>11.4f}"
+        )
+
+
+def path_cost(graph, path):
+    """경로 가중치 합 (마지막 도착 좌표 제외)"""
+    ids = [graph.node_id((p["lat"], p["lon"])) for p in path[:-1]]
+    cost = 0.0
+    for u, v in zip(ids, ids[1:]):
+        if u == v:
+            continue
+        targets, weights = graph.neighbors(u)
+        cost += weights[targets.index(v)]
+    return cost
+
+
+def main():
+    rng = random.Random(7)
+    print(
+        f"{'grid':>8} {'nodes':>7} {'dict(KB)':>9} {'csr(KB)':>8} "
+        f"{'dict A*(ms)':>12} {'csr A*(ms)':>11}"
+    )
+    for size in GRID_SIZES:
+        graph, dict_mem = measure_memory(lambda: make_grid_dict(size, rng))
+        compact, csr_mem = measure_memory(lambda: CompactGraph.from_adjacency(graph))
+        nodes = compact.keys()
+        start, goal = nodes[0], nodes[-1]
+
+        t_dict = timed(astar_dict, graph, start, goal)
+        t_csr = timed(astar_graph, compact, start, goal)
+        print(
+            f"{size}x{size:<5} {len(compact):>7} {dict_mem / 1024:>9.0f} "
+            f"{csr_mem / 1024:>8.0f} {t_dict * 1000:>12.1f} {t_csr * 1000:>11.1f}"
+        )
+
+    search_benchmark(rng)
+
+
+if __name__ == "__main__":
+    main()
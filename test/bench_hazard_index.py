@@ -0,0 +1,110 @@
+# build_graph 벤치마크 (전체 비교 스칼라 루프 vs 격자 인덱스 + 벡터 연산)
+# poetry run python -m test.bench_hazard_index
+import math
+import random
+import time
+
+from route.algorithms.compact_graph import CompactGraph
+from route.algorithms.safe_path_finder import (
+    Hazard,
+    HazardCategory,
+    build_graph,
+    haversine,
+    segment_circle_intersect,
+)
+
+CENTER = (37.5665, 126.9780)  # 서울시청
+N_SEGMENTS = 2000
+HAZARD_COUNTS = [10, 100, 1000]
+
+
+def make_line(n_segments, rng):
+    """도심 보행 경로를 흉내낸 랜덤 워크 (세그먼트당 약 5~20m)"""
+    lat, lon = CENTER
+    line = [(lat, lon)]
+    for _ in range(n_segments):
+        lat += rng.uniform(-0.00015, 0.00015)
+        lon += rng.uniform(-0.00015, 0.00015)
+        line.append((lat, lon))
+    return line
+
+
+def make_hazards(n, rng):
+    """중심점 2km 버퍼 안에 무작위 위험구역 생성 (find_nearby와 같은 범위)"""
+    categories = list(HazardCategory)
+    return [
+        Hazard(
+            lat=CENTER[0] + rng.uniform(-0.018, 0.018),
+            lon=CENTER[1] + rng.uniform(-0.022, 0.022),
+            category=rng.choice(categories),
+            score=round(rng.uniform(0.1, 2.0), 2),
+        )
+        for _ in range(n)
+    ]
+
+
+def build_graph_naive(lines, hazards):
+    """인덱스 도입 전 방식: 모든 세그먼트 × 모든 위험구역 비교"""
+    graph = {}
+    for line in lines:
+        for i in range(len(line) - 1):
+            p1 = line[i]
+            p2 = line[i + 1]
+            weight = haversine(p1[0], p1[1], p2[0], p2[1])
+            for hz in hazards:
+                if segment_circle_intersect(p1, p2, (hz.lat, hz.lon), hz.radius):
+                    weight += hz.score * 300
+            graph.setdefault(p1, []).append((p2, weight))
+            graph.setdefault(p2, []).append((p1, weight))
+    return graph
+
+
+def edge_map(graph: CompactGraph):
+    """비교용 {(좌표, 좌표): 가중치}"""
+    edges = {}
+    for u in range(len(graph)):
+        targets, weights = graph.neighbors(u)
+        for v, w in zip(targets, weights):
+            edges[(graph.coord(u), graph.coord(v))] = w
+    return edges
+
+
+def same_edges(a: CompactGraph, b: CompactGraph):
+    """간선 구성이 같고 가중치가 부동소수점 오차 범위에서 일치하는지"""
+    ea, eb = edge_map(a), edge_map(b)
+    return ea.keys() == eb.keys() and all(
+        math.isclose(ea[k], eb[k], rel_tol=1e-9) for k in ea
+    )
+
+
+def timed(fn, *args, repeat=3):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main():
+    rng = random.Random(42)
+    lines = [make_line(N_SEGMENTS, rng)]
+
+    print(f"segments={N_SEGMENTS}")
+    print(f"{'hazards':>8} {'naive(ms)':>10} {'build(ms)':>10} {'speedup':>8}")
+    for n in HAZARD_COUNTS:
+        hazards = make_hazards(n, rng)
+        t_naive, g_naive = timed(build_graph_naive, lines, hazards)
+        t_index, g_index = timed(build_graph, lines, hazards)
+        assert same_edges(
+            CompactGraph.from_adjacency(g_naive), g_index
+        ), "인덱스 결과가 전체 비교 결과와 다릅니다"
+        print(
+            f"{n:>8} {t_naive * 1000:>10.1f} {t_index * 1000:>10.1f} "
+            f"{t_naive / t_index:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
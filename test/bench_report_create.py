@@ -0,0 +1,193 @@
+# POST /reports/ 지연 벤치마크 (기존 생성 경로 vs 조인 조회 + 단일 트랜잭션 + 응답 후 알림)
+# DATABASE_URL의 PostGIS DB에 bench_ 접두사 유저/제보를 넣고 측정한 뒤 지운다.
+# poetry run python -m test.bench_report_create
+# FCM 전송은 FCM_DELAY_S 만큼 걸리는 가짜 전송으로, RabbitMQ 발행은 메모리 버스로 대체한다.
+# TestClient는 background task가 끝날 때까지 기다리므로, 지연은 응답 본문을 보낸 시각으로 잰다.
+import statistics
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from dependency_injector import providers
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+import report.application.report_service as report_service_module
+from common.auth import create_access_token
+from database import SessionLocal, engine
+from main import app
+from report.application.report_service import ReportService
+from report.domain.report import Report
+from report.infra.repository.postgres_report_repo import assign_cluster
+
+N_REQUESTS = 300
+FCM_DELAY_S = 0.08  # 실제 FCM HTTP v1 왕복 수준
+LAT0, LNG0 = 37.5665, 126.9780
+PARENT_ID, CHILD_ID = "bench_parent", "bench_child"
+
+
+class MemoryEventBus:
+    def __init__(self):
+        self.published = 0
+
+    async def publish(self, routing_key: str, message: dict):
+        self.published += 1
+
+
+def timed_app(asgi_app, latencies):
+    """요청 시작 → 응답 본문 전송 완료까지의 시간을 latencies에 기록하는 ASGI 래퍼"""
+
+    async def wrapper(scope, receive, send):
+        t0 = time.perf_counter()
+
+        async def timed_send(message):
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body"):
+                latencies.append(time.perf_counter() - t0)
+
+        await asgi_app(scope, receive, timed_send)
+
+    return wrapper
+
+
+def fake_send_push(token, title, body, data=None):
+    time.sleep(FCM_DELAY_S)
+    return "bench"
+
+
+class LegacyReportService(ReportService):
+    """변경 전 생성 경로: 세션 4번 (유저, 클러스터 배정, 저장, 보호자) + 응답 전 푸시/발행"""
+
+    async def create_report(
+        self,
+        reporter_id,
+        reporter_type,
+        location_lat,
+        location_lng,
+        image_url=None,
+        category=None,
+        description=None,
+        background_tasks=None,
+    ):
+        user = self.user_repo.get(reporter_id)
+        now = datetime.now(timezone.utc)
+        with SessionLocal() as db:
+            cluster_id = assign_cluster(
+                db,
+                location_lat,
+                location_lng,
+                self.cluster_service.radius_m,
+                str(uuid4()),
+            )
+            db.commit()
+        report = Report(
+            report_id=str(uuid4()),
+            reporter_id=reporter_id,
+            reporter_type=reporter_type,
+            location_lat=location_lat,
+            location_lng=location_lng,
+            cluster_id=cluster_id,
+            category=category,
+            status="PENDING",
+            not_there=0,
+            created_at=now,
+            updated_at=now,
+        )
+        saved = self.repo.save(report)
+        parent = self.user_repo.get(user.parent_id)
+        await self.notify_report_created(saved, user, parent)
+        return saved
+
+
+def seed():
+    now = datetime.now(timezone.utc)
+    with engine.begin() as conn:
+        for user_id, user_type, parent_id in (
+            (PARENT_ID, "parent", None),
+            (CHILD_ID, "child", PARENT_ID),
+        ):
+            conn.execute(
+                text(
+                    """
+                    INSERT INTO users (user_id, user_type, name, email, phone,
+                        password, parent_id, fcm_token, created_at, updated_at)
+                    VALUES (:id, :type, :id, :id || '@bench', '000', 'x',
+                        :parent, 'bench-token', :now, :now)
+                    ON CONFLICT (user_id) DO NOTHING
+                    """
+                ),
+                {"id": user_id, "type": user_type, "parent": parent_id, "now": now},
+            )
+
+
+def cleanup():
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                DELETE FROM report_cluster WHERE cluster_id IN (
+                    SELECT cluster_id FROM report WHERE reporter_id = :child
+                )
+                """
+            ),
+            {"child": CHILD_ID},
+        )
+        conn.execute(text("DELETE FROM report WHERE reporter_id = :c"), {"c": CHILD_ID})
+        conn.execute(
+            text("DELETE FROM users WHERE user_id IN (:p, :c)"),
+            {"p": PARENT_ID, "c": CHILD_ID},
+        )
+
+
+def run(client, latencies, service_cls, bus):
+    container = app.container
+    container.report_service.override(
+        providers.Factory(
+            service_cls,
+            repo=container.report_repo,
+            user_repo=container.user_repo,
+            event_bus=providers.Object(bus),
+            cluster_service=container.report_cluster_service,
+        )
+    )
+    token = create_access_token({"user_id": CHILD_ID, "user_type": "child"})
+    headers = {"Authorization": f"Bearer {token}"}
+    latencies.clear()
+    try:
+        for i in range(N_REQUESTS):
+            body = {
+                "location_lat": LAT0 + (i % 50) * 1e-3,
+                "location_lng": LNG0,
+                "category": "장애물",
+            }
+            client.post("/reports/", json=body, headers=headers).raise_for_status()
+    finally:
+        container.report_service.reset_override()
+    return sorted(latencies)
+
+
+def main():
+    report_service_module.send_push = fake_send_push
+    seed()
+    try:
+        latencies = []
+        with TestClient(timed_app(app, latencies)) as client:
+            print(f"{'path':>7} {'p50(ms)':>8} {'p99(ms)':>8} {'events':>7}")
+            for name, service_cls in (
+                ("legacy", LegacyReportService),
+                ("single", ReportService),
+            ):
+                bus = MemoryEventBus()
+                samples = run(client, latencies, service_cls, bus)
+                p50 = statistics.median(samples)
+                p99 = samples[int(len(samples) * 0.99) - 1]
+                print(
+                    f"{name:>7} {p50 * 1000:>8.1f} {p99 * 1000:>8.1f} "
+                    f"{bus.published:>7}"
+                )
+    finally:
+        cleanup()
+
+
+if __name__ == "__main__":
+    main()
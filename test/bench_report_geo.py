@@ -0,0 +1,108 @@
+# 제보 공간 쿼리 벤치마크 (행마다 geography 계산 vs location_geog GiST 인덱스)
+# DATABASE_URL의 PostGIS DB에 bench_report 테이블을 만들어 100만 건을 넣고 비교한 뒤 삭제한다.
+# poetry run python -m test.bench_report_geo
+import statistics
+import time
+
+from sqlalchemy import text
+
+from database import engine
+
+N_REPORTS = 1_000_000
+LAT0, LNG0 = 37.5665, 126.9780
+SPREAD_DEG = 0.5  # 서울 중심 ±0.5도 (약 ±55km)
+REPEAT = 20
+
+SETUP = [
+    "DROP TABLE IF EXISTS bench_report",
+    """
+    CREATE TABLE bench_report (
+        report_id VARCHAR PRIMARY KEY,
+        location_lat FLOAT,
+        location_lng FLOAT,
+        location_geog geography(Point, 4326) GENERATED ALWAYS AS (
+            ST_SetSRID(ST_MakePoint(location_lng, location_lat), 4326)::geography
+        ) STORED,
+        category VARCHAR,
+        status VARCHAR NOT NULL,
+        created_at TIMESTAMP NOT NULL
+    )
+    """,
+    f"""
+    INSERT INTO bench_report (report_id, location_lat, location_lng, category, status, created_at)
+    SELECT
+        'r' || g,
+        {LAT0} + (random() - 0.5) * {2 * SPREAD_DEG},
+        {LNG0} + (random() - 0.5) * {2 * SPREAD_DEG},
+        (ARRAY['공포', '도로폐쇄', '공사장', '장애물', '인도 없음'])[1 + g % 5],
+        CASE WHEN g % 10 < 8 THEN 'APPROVED' ELSE 'PENDING' END,
+        now() - (g || ' seconds')::interval
+    FROM generate_series(1, {N_REPORTS}) AS g
+    """,
+    "CREATE INDEX ix_bench_report_geog ON bench_report USING gist (location_geog)",
+    "ANALYZE bench_report",
+]
+
+# 기존 쿼리: 행마다 geography 계산 → 인덱스 사용 불가 (Seq Scan)
+OLD_QUERY = """
+    SELECT report_id, location_lat, location_lng, category
+    FROM bench_report
+    WHERE status = 'APPROVED'
+      AND ST_DWithin(
+          geography(ST_MakePoint(location_lng, location_lat)),
+          geography(ST_MakePoint(:lng, :lat)),
+          :radius
+      )
+"""
+
+# 새 쿼리: 저장된 location_geog + GiST 인덱스
+NEW_QUERY = """
+    SELECT report_id, location_lat, location_lng, category
+    FROM bench_report
+    WHERE status = 'APPROVED'
+      AND ST_DWithin(
+          location_geog,
+          ST_SetSRID(ST_MakePoint(:lng, :lat), 4326)::geography,
+          :radius
+      )
+"""
+
+
+def explain(conn, query, params):
+    rows = conn.execute(text("EXPLAIN (ANALYZE, BUFFERS) " + query), params).fetchall()
+    return "\n".join(r[0] for r in rows)
+
+
+def timed(conn, query, params):
+    samples = []
+    for _ in range(REPEAT):
+        t0 = time.perf_counter()
+        n = len(conn.execute(text(query), params).fetchall())
+        samples.append(time.perf_counter() - t0)
+    return n, statistics.median(samples) * 1000
+
+
+def main():
+    with engine.begin() as conn:
+        print(f"Seeding {N_REPORTS:,} reports...")
+        t0 = time.perf_counter()
+        for statement in SETUP:
+            conn.execute(text(statement))
+        print(f"  done in {time.perf_counter() - t0:.1f}s")
+
+    try:
+        with engine.connect() as conn:
+            for radius in (500, 2000):
+                params = {"lat": LAT0, "lng": LNG0, "radius": radius}
+                print(f"\n=== radius {radius}m ===")
+                for name, query in (("old", OLD_QUERY), ("new", NEW_QUERY)):
+                    n, ms = timed(conn, query, params)
+                    print(f"[{name}] rows={n} median={ms:.1f}ms")
+                    print(explain(conn, query, params))
+    finally:
+        with engine.begin() as conn:
+            conn.execute(text("DROP TABLE IF EXISTS bench_report"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# TMap 클라이언트 부하 벤치마크 (스레드풀 + requests vs 공유 세션 비동기 aiohttp)
+# poetry run python -m test.bench_tmap_client
+# 요청 N개가 한꺼번에 들어온 상황에서 각 요청의 완료 시각(대기열 시간 포함)을 잰다.
+# 스텁 서버는 GIL 경합을 피하려고 별도 프로세스로 띄운다.
+import asyncio
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from route.infra.tmap_client import TMAP_PEDESTRIAN_PATH, TMapClient
+
+O_LAT, O_LNG = 37.5665, 126.9780
+D_LAT, D_LNG = 37.5705, 126.9820
+TMAP_DELAY_S = 0.05  # 스텁 서버 응답 지연
+N_REQUESTS = 400
+THREADPOOL_SIZE = 40  # Starlette 기본 스레드풀 크기
+CONCURRENCY = [10, 40, 100]
+STUB_PORT = 8089
+
+
+def _form(i):
+    return {
+        "startX": O_LNG,
+        "startY": O_LAT + i * 1e-5,
+        "endX": D_LNG,
+        "endY": D_LAT,
+    }
+
+
+def run_sync(base_url, concurrency):
+    """sync 핸들러: 요청마다 requests.post (연결 재사용 없음), 스레드풀 크기로 동시성 제한"""
+    t0 = time.perf_counter()
+
+    def call(i):
+        r = requests.post(base_url + TMAP_PEDESTRIAN_PATH, data=_form(i))
+        r.raise_for_status()
+        return time.perf_counter() - t0
+
+    with ThreadPoolExecutor(min(concurrency, THREADPOOL_SIZE)) as pool:
+        return list(pool.map(call, range(N_REQUESTS)))
+
+
+async def run_async(base_url, concurrency):
+    """async 핸들러: 공유 ClientSession (keep-alive) + Semaphore 동시성 제한"""
+    client = TMapClient(
+        "key",
+        base_url=base_url,
+        max_connections=concurrency,
+        max_concurrency=concurrency,
+    )
+    t0 = time.perf_counter()
+
+    async def call(i):
+        await client.get_pedestrian_route(O_LAT + i * 1e-5, O_LNG, D_LAT, D_LNG)
+        return time.perf_counter() - t0
+
+    try:
+        return await asyncio.gather(*(call(i) for i in range(N_REQUESTS)))
+    finally:
+        await client.aclose()
+
+
+def start_stub():
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "test.tmap_stub_server",
+            "--port",
+            str(STUB_PORT),
+            "--delay",
+            str(TMAP_DELAY_S),
+        ]
+    )
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", STUB_PORT), timeout=0.1).close()
+            break
+        except OSError:
+            time.sleep(0.05)
+    return proc
+
+
+def report(name, concurrency, wall, latencies):
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"{name:>6} {concurrency:>5} {wall:>8.2f} {N_REQUESTS / wall:>8.0f} "
+        f"{p50 * 1000:>8.0f} {p99 * 1000:>8.0f}"
+    )
+
+
+def main():
+    base_url = f"http://127.0.0.1:{STUB_PORT}"
+    stub = start_stub()
+    try:
+        print(
+            f"{'client':>6} {'conc':>5} {'wall(s)':>8} {'req/s':>8} "
+            f"{'p50(ms)':>8} {'p99(ms)':>8}"
+        )
+        for concurrency in CONCURRENCY:
+            t0 = time.perf_counter()
+            latencies = run_sync(base_url, concurrency)
+            report("sync", concurrency, time.perf_counter() - t0, latencies)
+
+            t0 = time.perf_counter()
+            latencies = asyncio.run(run_async(base_url, concurrency))
+            report("async", concurrency, time.perf_counter() - t0, latencies)
+    finally:
+        stub.terminate()
+        stub.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+# 테스트용 메모리 AMQP 브로커 (aio_pika 연결/채널/큐에서 릴레이가 쓰는 부분만)
+# topic/direct/fanout exchange 라우팅(alternate exchange 포함), 큐 인자 기록, consumer별 prefetch,
+# basic.get, ack/nack/reject 재큐잉, 발행 실패(fail_publish), 메시지 TTL 만료 후 dead-letter(expire)를
+# 흉내낸다.
+import asyncio
+import itertools
+import json
+import re
+from collections import deque
+
+import aio_pika
+
+
+def topic_matches(pattern: str, routing_key: str) -> bool:
+    regex = re.escape(pattern).replace(r"\*", r"[^.]+").replace(r"\#", r".*")
+    return re.fullmatch(regex, routing_key) is not None
+
+
+def _binding_matches(exchange_type, key: str, routing_key: str) -> bool:
+    exchange_type = getattr(exchange_type, "value", exchange_type)
+    if exchange_type == "fanout":
+        return True
+    if exchange_type == "topic":
+        return topic_matches(key, routing_key)
+    return key == routing_key
+
+
+class FakeIncomingMessage:
+    def __init__(self, queue_state, consumer, message, routing_key, redelivered):
+        self._queue = queue_state
+        self._consumer = consumer
+        self._message = message
+        self.body = message.body
+        self.content_type = message.content_type
+        self.headers = dict(message.headers or {})
+        self.routing_key = routing_key
+        self.redelivered = redelivered
+        self._settled = False
+
+    def _settle(self):
+        assert not self._settled, "message settled twice"
+        self._settled = True
+        self._consumer["unacked"] -= 1
+
+    async def ack(self):
+        self._settle()
+        self._queue.broker.acked += 1
+        self._queue.pump()
+
+    async def nack(self, requeue=True):
+        self._settle()
+        if requeue:
+            self._queue.broker.requeued += 1
+            self._queue.messages.appendleft((self._message, self.routing_key, True))
+        self._queue.pump()
+
+    async def reject(self, requeue=False):
+        await self.nack(requeue=requeue)
+
+
+class _QueueState:
+    def __init__(self, broker, name, arguments):
+        self.broker = broker
+        self.name = name
+        self.arguments = arguments
+        self.messages = deque()  # (message, routing_key, redelivered)
+        self.consumers = []
+        self.delivered = 0  # consumer 전달 + basic.get
+
+    def pump(self):
+        while self.messages:
+            ready = [
+                c
+                for c in self.consumers
+                if not c["prefetch"] or c["unacked"] < c["prefetch"]
+            ]
+            if not ready:
+                return
+            consumer = min(ready, key=lambda c: c["unacked"])
+            message, routing_key, redelivered = self.messages.popleft()
+            consumer["unacked"] += 1
+            self.broker.deliveries += 1
+            self.delivered += 1
+            incoming = FakeIncomingMessage(
+                self, consumer, message, routing_key, redelivered
+            )
+            task = asyncio.get_running_loop().create_task(
+                consumer["callback"](incoming)
+            )
+            self.broker.tasks.add(task)
+            task.add_done_callback(self.broker.tasks.discard)
+
+
+class FakeQueue:
+    def __init__(self, channel, state):
+        self.channel = channel
+        self.state = state
+        self.name = state.name
+
+    async def bind(self, exchange, routing_key=None):
+        name = exchange if isinstance(exchange, str) else exchange.name
+        self.channel.broker.exchanges[name]["bindings"].append(
+            (routing_key, self.state)
+        )
+
+    async def unbind(self, exchange, routing_key=None):
+        name = exchange if isinstance(exchange, str) else exchange.name
+        bindings = self.channel.broker.exchanges[name]["bindings"]
+        bindings[:] = [
+            (key, state)
+            for key, state in bindings
+            if not (key == routing_key and state is self.state)
+        ]
+
+    async def get(self, no_ack=False, fail=True):
+        if not self.state.messages:
+            if fail:
+                raise LookupError(f"{self.name} is empty")
+            return None
+        message, routing_key, redelivered = self.state.messages.popleft()
+        self.channel.broker.deliveries += 1
+        self.state.delivered += 1
+        getter = {"unacked": 1}  # basic.get은 prefetch와 무관
+        return FakeIncomingMessage(
+            self.state, getter, message, routing_key, redelivered
+        )
+
+    async def consume(self, callback, no_ack=False):
+        tag = f"ctag-{next(self.channel.broker.tags)}"
+        self.state.consumers.append(
+            {
+                "tag": tag,
+                "callback": callback,
+                "prefetch": self.channel.prefetch_count,
+                "unacked": 0,
+            }
+        )
+        self.state.pump()
+        return tag
+
+    async def cancel(self, consumer_tag):
+        self.state.consumers = [
+            c for c in self.state.consumers if c["tag"] != consumer_tag
+        ]
+
+
+class FakeExchange:
+    def __init__(self, broker, name):
+        self.broker = broker
+        self.name = name
+
+    async def publish(self, message, routing_key):
+        if self.broker.fail_publish:
+            self.broker.fail_publish -= 1
+            raise ConnectionError("channel closed")
+        self.broker.route(self.name, message, routing_key)
+
+
+class FakeChannel:
+    def __init__(self, broker, publisher_confirms):
+        self.broker = broker
+        self.publisher_confirms = publisher_confirms
+        self.prefetch_count = 0
+        self.is_closed = False
+
+    async def set_qos(self, prefetch_count=0):
+        self.prefetch_count = prefetch_count
+
+    async def declare_exchange(self, name, type, durable=False, arguments=None):
+        self.broker.exchanges.setdefault(
+            name,
+            {
+                "type": type,
+                "bindings": [],
+                "alternate": (arguments or {}).get("alternate-exchange"),
+            },
+        )
+        return FakeExchange(self.broker, name)
+
+    async def declare_queue(
+        self, name, durable=False, exclusive=False, auto_delete=False, arguments=None
+    ):
+        self.broker.declares += 1
+        state = self.broker.queues.get(name)
+        if state is None:
+            state = self.broker.queues[name] = _QueueState(self.broker, name, arguments)
+        assert state.arguments == arguments, "queue redeclared with other arguments"
+        return FakeQueue(self, state)
+
+    async def close(self):
+        self.is_closed = True
+
+
+class FakeAmqpBroker:
+    """연결 객체 겸 브로커. connect(url)은 aio_pika.connect_robust 대신 쓴다"""
+
+    def __init__(self):
+        self.exchanges = {}
+        self.queues = {}
+        self.tags = itertools.count()
+        self.tasks = set()
+        self.deliveries = 0
+        self.requeued = 0
+        self.acked = 0
+        self.unroutable = 0
+        self.declares = 0
+        self.fail_publish = 0  # 다음 발행 n번 실패
+        self.is_closed = False
+
+    async def connect(self, url=None):
+        return self
+
+    async def channel(self, publisher_confirms=True):
+        return FakeChannel(self, publisher_confirms)
+
+    async def close(self):
+        self.is_closed = True
+
+    def route(self, exchange_name, message, routing_key):
+        exchange = self.exchanges[exchange_name]
+        matched = [
+            state
+            for key, state in exchange["bindings"]
+            if _binding_matches(exchange["type"], key, routing_key)
+        ]
+        if not matched:
+            if exchange["alternate"]:
+                self.route(exchange["alternate"], message, routing_key)
+            else:
+                self.unroutable += 1
+            return
+        for state in {id(s): s for s in matched}.values():
+            state.messages.append((message, routing_key, False))
+            state.pump()
+
+    async def publish_json(self, exchange_name, routing_key, event):
+        self.route(
+            exchange_name,
+            aio_pika.Message(
+                body=json.dumps(event).encode("utf-8"),
+                content_type="application/json",
+            ),
+            routing_key,
+        )
+
+    def expire(self, queue_name):
+        """
+        큐에 있는 메시지의 TTL(expiration)이 모두 지난 것으로 보고 x-dead-letter-exchange로
+        원래 routing key 그대로 보냄. 만료시킨 메시지의 expiration 목록 반환
+        """
+        state = self.queues[queue_name]
+        dead_letter_exchange = state.arguments["x-dead-letter-exchange"]
+        expired = []
+        while state.messages:
+            message, routing_key, _ = state.messages.popleft()
+            expired.append(message.expiration)
+            message.expiration = None
+            self.route(dead_letter_exchange, message, routing_key)
+        return expired
+
+    def depth(self, queue_name):
+        state = self.queues.get(queue_name)
+        return len(state.messages) if state else 0
+
+    async def settle(self):
+        """콜백 태스크가 모두 끝날 때까지 대기"""
+        while self.tasks:
+            await asyncio.gather(*list(self.tasks))
@@ -1,11 +1,18 @@
 # 테이블 자동 생성용 스크립트
 # poetry run python -m test.init_db
+from sqlalchemy import text
+
 from database import Base, engine
 from user.infra.db_models.user import User
 from report.infra.db_models.report import Report
+from report.infra.db_models.report_cluster import ReportCluster
+from report.infra.db_models.event_outbox import EventOutbox
 
 # from report.infra.db_models.report_comment import ReportComment
 
 print("Creating tables...")
+# report.location_geog (geography 생성 컬럼)에 PostGIS 필요
+with engine.begin() as conn:
+    conn.execute(text("CREATE EXTENSION IF NOT EXISTS postgis"))
 Base.metadata.create_all(bind=engine)
 print("Done.")
@@ -0,0 +1,106 @@
+# 같은 클러스터의 서로 다른 제보를 동시에 승인해도 클러스터 요약이 맞는지 확인 (PostgreSQL 필요)
+# TEST_DATABASE_URL=postgresql+psycopg2://... poetry run pytest test/test_cluster_summary_concurrency.py
+# (앱 설정(.env)도 필요 — database 모듈 import 시 읽음)
+# 테스트 DB에 테이블을 만들고 test_sum_ 접두사 데이터만 넣었다 지운다.
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set"
+)
+
+N_REPORTS = 30
+CLUSTER_ID = "test_sum_cluster"
+
+
+@pytest.fixture
+def repo():
+    from sqlalchemy import create_engine, text
+
+    from database import Base, SessionLocal
+    from report.infra.db_models.report import Report  # noqa: F401
+    from report.infra.db_models.report_cluster import ReportClusterSummary  # noqa: F401
+    from report.infra.repository.postgres_report_repo import PostgresReportRepository
+
+    engine = create_engine(TEST_DATABASE_URL, pool_size=N_REPORTS)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS postgis"))
+    Base.metadata.create_all(bind=engine)
+    SessionLocal.configure(bind=engine)
+
+    cleanup = [
+        f"DELETE FROM report_cluster_summary WHERE cluster_id = '{CLUSTER_ID}'",
+        "DELETE FROM report WHERE report_id LIKE 'test_sum_%'",
+    ]
+    created_at = datetime.utcnow()
+    with engine.begin() as conn:
+        for statement in cleanup:
+            conn.execute(text(statement))
+        for i in range(N_REPORTS):
+            conn.execute(
+                text(
+                    """
+                    INSERT INTO report (report_id, reporter_id, reporter_type,
+                        location_lat, location_lng, cluster_id, status, good_count,
+                        normal_count, bad_count, total_feedbacks, not_there,
+                        created_at, updated_at)
+                    VALUES (:id, 'test_sum_user', 'parent', 37.5665, 126.978,
+                        :cluster_id, 'PENDING', 0, 0, 1, 1, 0, :created_at,
+                        :created_at)
+                    """
+                ),
+                {
+                    "id": f"test_sum_{i:02d}",
+                    "cluster_id": CLUSTER_ID,
+                    "created_at": created_at + timedelta(seconds=i),
+                },
+            )
+
+    yield PostgresReportRepository(), engine
+
+    with engine.begin() as conn:
+        for statement in cleanup:
+            conn.execute(text(statement))
+    engine.dispose()
+
+
+def test_parallel_approvals_of_sibling_reports_keep_summary_complete(repo):
+    from sqlalchemy import text
+
+    repo, engine = repo
+    now = datetime.utcnow()
+    with ThreadPoolExecutor(N_REPORTS) as pool:
+        list(
+            pool.map(
+                lambda i: repo.update_status(
+                    SimpleNamespace(
+                        report_id=f"test_sum_{i:02d}", status="APPROVED", updated_at=now
+                    )
+                ),
+                range(N_REPORTS),
+            )
+        )
+
+    with engine.connect() as conn:
+        summary = (
+            conn.execute(
+                text(
+                    """
+                    SELECT latest_report_id, member_count, bad_count, total_feedbacks
+                    FROM report_cluster_summary WHERE cluster_id = :cluster_id
+                    """
+                ),
+                {"cluster_id": CLUSTER_ID},
+            )
+            .mappings()
+            .one()
+        )
+    assert summary["member_count"] == N_REPORTS
+    assert summary["latest_report_id"] == f"test_sum_{N_REPORTS - 1:02d}"
+    assert summary["bad_count"] == summary["total_feedbacks"] == N_REPORTS
@@ -0,0 +1,170 @@
+import asyncio
+
+import pytest
+
+from report.infra.event_bus import EventBus
+from report.infra.event_codec import decode_event, get_codec
+
+
+class FakeExchange:
+    def __init__(self, broker):
+        self.broker = broker
+
+    async def publish(self, message, routing_key):
+        await asyncio.sleep(self.broker.delay_s)
+        if self.broker.fail_next:
+            self.broker.fail_next -= 1
+            raise ConnectionError("broker unavailable")
+        self.broker.messages.append((routing_key, message))
+
+
+class FakeChannel:
+    def __init__(self, broker, publisher_confirms=True):
+        self.broker = broker
+        self.publisher_confirms = publisher_confirms
+
+    async def declare_exchange(self, name, type, durable):
+        return FakeExchange(self.broker)
+
+    async def get_exchange(self, name, ensure=True):
+        return FakeExchange(self.broker)
+
+    async def close(self):
+        self.broker.closed_channels += 1
+
+
+class FakeBroker:
+    """aio_pika 연결 대신 쓰는 로컬 가짜 브로커 (발행 메시지 기록)"""
+
+    def __init__(self, delay_s=0.0, fail_next=0):
+        self.delay_s = delay_s
+        self.fail_next = fail_next
+        self.messages = []
+        self.connects = 0
+        self.channels = []
+        self.closed_channels = 0
+        self.is_closed = False
+
+    async def connect(self, url):
+        self.connects += 1
+        return self
+
+    async def channel(self, publisher_confirms=True):
+        channel = FakeChannel(self, publisher_confirms)
+        self.channels.append(channel)
+        return channel
+
+    async def close(self):
+        self.is_closed = True
+
+    def decoded(self):
+        return [(rk, decode_event(m.body, m.content_type)) for rk, m in self.messages]
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgpack"])
+def test_codec_round_trip_by_content_type(name):
+    codec = get_codec(name)
+    event = {"reportId": "r1", "parentId": "p1", "imageUrl": None}
+    assert decode_event(codec.dumps(event), codec.content_type) == event
+
+
+def test_unknown_codec_rejected():
+    with pytest.raises(ValueError):
+        get_codec("xml")
+
+
+def test_direct_publish_reuses_connection_and_pooled_channels():
+    async def main():
+        broker = FakeBroker()
+        bus = EventBus(connect=broker.connect, channel_pool_size=2, confirms=False)
+        await asyncio.gather(
+            *(bus.publish("report.created", {"i": i}) for i in range(20))
+        )
+        return broker, bus
+
+    broker, bus = asyncio.run(main())
+    assert broker.connects == 1
+    # 선언용 채널 1개 + 발행 채널 풀 최대 2개
+    assert len(broker.channels) <= 3
+    assert all(not c.publisher_confirms for c in broker.channels[1:])
+    assert sorted(m["i"] for _, m in broker.decoded()) == list(range(20))
+    assert bus.published == 20
+
+
+def test_publisher_mode_batches_outbox_and_drains_on_stop():
+    async def main():
+        broker = FakeBroker(delay_s=0.001)
+        bus = EventBus(
+            connect=broker.connect, codec="msgpack", channel_pool_size=2, batch_size=50
+        )
+        bus.start_publisher()
+        for i in range(300):
+            await bus.publish("report.created", {"i": i})
+        queued = bus.stats()["outbox_depth"]
+        await bus.stop()
+        return broker, bus, queued
+
+    broker, bus, queued = asyncio.run(main())
+    assert queued == 300  # publish()는 outbox에 넣고 바로 반환
+    assert sorted(m["i"] for _, m in broker.decoded()) == list(range(300))
+    assert all(m.content_type == "application/msgpack" for _, m in broker.messages)
+    stats = bus.stats()
+    assert stats["outbox_depth"] == 0
+    assert stats["batches"] <= 300 // 50 + 2
+
+
+def test_failed_batch_is_retried():
+    async def main():
+        broker = FakeBroker(fail_next=1)
+        bus = EventBus(
+            connect=broker.connect, channel_pool_size=1, retry_backoff_s=0.01
+        )
+        bus.start_publisher()
+        await bus.publish("report.reviewed", {"reportId": "r1"})
+        await bus.stop()
+        return broker, bus
+
+    broker, bus = asyncio.run(main())
+    assert broker.decoded() == [("report.reviewed", {"reportId": "r1"})]
+    assert bus.stats()["failed_batches"] == 1
+
+
+def test_full_outbox_falls_back_to_direct_publish():
+    async def main():
+        broker = FakeBroker()
+        bus = EventBus(connect=broker.connect, outbox_size=2, channel_pool_size=1)
+        bus.start_publisher()
+        # 발행 태스크가 outbox를 비우기 전에 동시에 4건
+        await asyncio.gather(
+            *(bus.publish("report.created", {"i": i}) for i in range(4))
+        )
+        overflows = bus.stats()["outbox_overflows"]
+        await bus.stop()
+        return broker, overflows
+
+    broker, overflows = asyncio.run(main())
+    assert overflows == 2
+    assert sorted(m["i"] for _, m in broker.decoded()) == [0, 1, 2, 3]
+
+
+def test_unserializable_event_is_dropped_and_persistent_failure_gives_up():
+    async def main():
+        broker = FakeBroker(fail_next=100)
+        bus = EventBus(
+            connect=broker.connect,
+            channel_pool_size=1,
+            retry_backoff_s=0.001,
+            max_retries=2,
+        )
+        bus.start_publisher()
+        await bus.publish("report.created", {"reportId": object()})
+        await bus.publish("report.created", {"reportId": "r1"})
+        await bus.stop(timeout_s=1)
+        return broker, bus
+
+    broker, bus = asyncio.run(main())
+    stats = bus.stats()
+    assert broker.messages == []
+    assert stats["outbox_depth"] == 0
+    assert stats["failed_batches"] == 3  # 처음 1번 + 재시도 2번 후 포기
+    assert stats["dropped"] == 2  # 직렬화 실패 1건 + 발행 포기 1건
@@ -0,0 +1,165 @@
+import threading
+import time
+
+from report.application.feedback_buffer import FeedbackCounterBuffer
+from report.application.report_not_there_service import ReportNotThereService
+from report.domain.feedback_delta import FeedbackDelta
+from report.domain.report import Report
+
+
+def _report(report_id, status="APPROVED", not_there=0):
+    return Report(
+        report_id=report_id,
+        reporter_id="u1",
+        reporter_type="parent",
+        status=status,
+        not_there=not_there,
+    )
+
+
+class FakeReportRepo:
+    def __init__(self, reports=()):
+        self.reports = {r.report_id: r for r in reports}
+        self.batches = []
+        self.fail = False
+        self.flushed = threading.Event()
+
+    def apply_feedback_deltas(self, deltas):
+        if self.fail:
+            raise RuntimeError("db down")
+        self.batches.append({k: FeedbackDelta().merge(v) for k, v in deltas.items()})
+        self.flushed.set()
+        updated = []
+        for report_id, delta in deltas.items():
+            report = self.reports.get(report_id)
+            if report is not None:
+                report.not_there = (report.not_there or 0) + delta.not_there
+                updated.append(report.model_copy())
+        return updated
+
+    def get(self, report_id):
+        report = self.reports.get(report_id)
+        return report.model_copy() if report else None
+
+    def delete(self, report_id):
+        self.reports.pop(report_id, None)
+
+    def update_feedback_counts(self, report):
+        raise AssertionError("읽어 둔 카운트로 덮어쓰지 않아야 함")
+
+
+class FakeOverlay:
+    def __init__(self):
+        self.updated = []
+
+    def update_report(self, report):
+        self.updated.append(report.report_id)
+
+
+def test_deltas_for_same_report_merge_into_one_update():
+    repo, overlay = (
+        FakeReportRepo([_report("r1"), _report("r2", "PENDING")]),
+        FakeOverlay(),
+    )
+    buffer = FeedbackCounterBuffer(repo, hazard_overlay=overlay)
+
+    for _ in range(100):
+        buffer.add("r1", FeedbackDelta.evaluation("bad", 1))
+    buffer.add("r1", FeedbackDelta.evaluation("bad", -1))
+    buffer.add("r2", FeedbackDelta(not_there=1))
+    buffer.add(
+        "r3",
+        FeedbackDelta.evaluation("good", 1).merge(FeedbackDelta.evaluation("good", -1)),
+    )
+
+    assert buffer.flush() == 2
+    (batch,) = repo.batches
+    assert batch == {
+        "r1": FeedbackDelta(bad=99, total=99),
+        "r2": FeedbackDelta(not_there=1),
+    }
+    # 승인된 제보만 경로 페널티 갱신
+    assert overlay.updated == ["r1"]
+    assert buffer.flush() == 0 and len(repo.batches) == 1
+
+
+def test_size_threshold_flushes_immediately():
+    repo = FakeReportRepo()
+    buffer = FeedbackCounterBuffer(repo, max_pending=3)
+    buffer.add("r1", FeedbackDelta(not_there=1))
+    buffer.add("r2", FeedbackDelta(not_there=1))
+    assert repo.batches == []
+    buffer.add("r3", FeedbackDelta(not_there=1))
+    assert len(repo.batches) == 1 and len(repo.batches[0]) == 3
+
+
+def test_failed_flush_keeps_deltas_for_retry():
+    repo = FakeReportRepo()
+    buffer = FeedbackCounterBuffer(repo)
+    buffer.add("r1", FeedbackDelta.evaluation("good", 1))
+    repo.fail = True
+    assert buffer.flush() == 0
+    buffer.add("r1", FeedbackDelta.evaluation("good", 1))
+    repo.fail = False
+    buffer.flush()
+    assert repo.batches == [{"r1": FeedbackDelta(good=2, total=2)}]
+
+
+def test_background_flush_bounds_staleness_and_stop_flushes_rest():
+    repo = FakeReportRepo()
+    buffer = FeedbackCounterBuffer(repo, flush_interval_s=0.05)
+    buffer.start()
+    try:
+        t0 = time.monotonic()
+        buffer.add("r1", FeedbackDelta(not_there=1))
+        assert repo.flushed.wait(1.0)
+        assert time.monotonic() - t0 < 0.5
+    finally:
+        buffer.add("r2", FeedbackDelta(not_there=1))
+        buffer.stop()
+    assert repo.batches[-1] == {"r2": FeedbackDelta(not_there=1)}
+
+
+class FakeNotThereRepo:
+    def has_user_marked(self, report_id, user_id):
+        return False
+
+    def save(self, record):
+        pass
+
+
+def test_not_there_counts_pending_taps_toward_auto_delete():
+    repo = FakeReportRepo([_report("r1", not_there=1)])
+    buffer = FeedbackCounterBuffer(repo)
+    service = ReportNotThereService(FakeNotThereRepo(), repo, feedback_buffer=buffer)
+
+    assert service.mark_not_there("r1", "u2")["notThere"] == 2
+    assert service.mark_not_there("r1", "u3")["notThere"] == 3
+    assert buffer.pending("r1") == FeedbackDelta(not_there=2)
+
+    # DB에는 아직 1이지만 버퍼 포함 4 → 삭제, 대기 증감분도 버림
+    service.mark_not_there("r1", "u4")
+    assert "r1" not in repo.reports
+    assert buffer.flush() == 0
+
+
+def test_not_there_without_buffer_increments_in_database():
+    repo = FakeReportRepo([_report("r1", not_there=2)])
+    service = ReportNotThereService(FakeNotThereRepo(), repo)
+
+    assert service.mark_not_there("r1", "u2")["notThere"] == 3
+    assert repo.batches == [{"r1": FeedbackDelta(not_there=1)}]
+    assert repo.reports["r1"].not_there == 3
+
+    service.mark_not_there("r1", "u3")  # DB 값 4 → 삭제
+    assert "r1" not in repo.reports
+
+
+def test_not_there_without_buffer_on_missing_report_is_404():
+    import pytest
+    from fastapi import HTTPException
+
+    service = ReportNotThereService(FakeNotThereRepo(), FakeReportRepo())
+    with pytest.raises(HTTPException) as e:
+        service.mark_not_there("missing", "u1")
+    assert e.value.status_code == 404
@@ -0,0 +1,179 @@
+import asyncio
+
+import numpy as np
+
+from report.application.report_not_there_service import ReportNotThereService
+from report.domain.report import Report
+from report.domain.risk_score import risk_score
+from route.algorithms.road_network import RoadNetwork
+from route.algorithms.safe_path_finder import hazard_from_report
+from route.application.hazard_overlay import HazardOverlay
+from route.application.route_service import RouteService
+
+LAT0, LON0 = 37.5665, 126.9780
+STEP = 0.001  # 약 110m 간격
+
+
+def _grid_lines(size=8):
+    pts = [
+        [(round(LAT0 + i * STEP, 6), round(LON0 + j * STEP, 6)) for j in range(size)]
+        for i in range(size)
+    ]
+    cols = [[pts[i][j] for i in range(size)] for j in range(size)]
+    return pts + cols
+
+
+def _report(report_id, lat, lng, status="APPROVED", good=0, bad=0):
+    # risk_score는 DB 생성 컬럼이 돌려주는 값과 같은 식으로 채움
+    return Report(
+        report_id=report_id,
+        reporter_id="u1",
+        reporter_type="parent",
+        location_lat=lat,
+        location_lng=lng,
+        category="장애물",
+        status=status,
+        good_count=good,
+        bad_count=bad,
+        total_feedbacks=good + bad,
+        risk_score=risk_score(good, 0, bad),
+        not_there=0,
+    )
+
+
+class FakeReportRepo:
+    def __init__(self, reports):
+        self.reports = {r.report_id: r for r in reports}
+        self.nearby_calls = 0
+
+    def find_approved_hazards(self, min_risk_score=0.0):
+        return [
+            hazard_from_report(
+                r.report_id,
+                r.location_lat,
+                r.location_lng,
+                r.category,
+                r.risk_score,
+            )
+            for r in self.reports.values()
+            if r.status == "APPROVED" and r.risk_score >= min_risk_score
+        ]
+
+    def find_along_route(self, route, width_m, min_risk_score=0.0):
+        self.nearby_calls += 1
+        return self.find_approved_hazards(min_risk_score)
+
+    def get(self, report_id):
+        return self.reports.get(report_id)
+
+    def delete(self, report_id):
+        self.reports.pop(report_id, None)
+
+    def apply_feedback_deltas(self, deltas):
+        updated = []
+        for report_id, delta in deltas.items():
+            report = self.reports.get(report_id)
+            if report is not None:
+                report.not_there = (report.not_there or 0) + delta.not_there
+                updated.append(report)
+        return updated
+
+
+class FakeNotThereRepo:
+    def has_user_marked(self, report_id, user_id):
+        return False
+
+    def save(self, record):
+        pass
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_warm_then_incremental_updates_touch_only_hazard_segments():
+    network = RoadNetwork(_grid_lines())
+    base = network.graph.weights.copy()
+    repo = FakeReportRepo([_report("r1", LAT0, LON0 + 3.5 * STEP)])
+    overlay = HazardOverlay(network, repo)
+
+    overlay.warm()
+    warmed = network.graph.weights.copy()
+    touched = np.flatnonzero(warmed != base)
+    assert len(touched) > 0
+
+    # 재평가 → 같은 세그먼트만 새 점수로
+    rescored = _report("r1", LAT0, LON0 + 3.5 * STEP, good=1, bad=3)
+    overlay.update_report(rescored)
+    changed = np.flatnonzero(network.graph.weights != warmed)
+    assert set(changed) == set(touched)
+    expected = round(rescored.risk_score, 3) * 300
+    assert np.allclose(network.graph.weights[touched] - base[touched], expected)
+
+    # 승인 상태가 아니면 제거
+    overlay.update_report(_report("r1", LAT0, LON0 + 3.5 * STEP, status="REJECTED"))
+    assert (network.graph.weights == base).all()
+
+
+def test_negligible_risk_reports_get_no_penalty():
+    network = RoadNetwork(_grid_lines())
+    base = network.graph.weights.copy()
+    safe = _report("r1", LAT0, LON0 + 3.5 * STEP, good=20)
+    assert safe.risk_score < 0.1
+    repo = FakeReportRepo([safe])
+    overlay = HazardOverlay(network, repo, min_risk_score=0.1)
+
+    overlay.warm()
+    assert (network.graph.weights == base).all()
+
+    # 평가가 바뀌어 임계값을 넘으면 반영, 다시 내려가면 제거
+    risky = _report("r1", LAT0, LON0 + 3.5 * STEP, good=20, bad=20)
+    overlay.update_report(risky)
+    assert (network.graph.weights != base).any()
+    overlay.update_report(safe)
+    assert (network.graph.weights == base).all()
+
+
+def test_not_there_delete_removes_penalty():
+    network = RoadNetwork(_grid_lines())
+    base = network.graph.weights.copy()
+    report = _report("r1", LAT0, LON0 + 3.5 * STEP)
+    report.not_there = 3
+    repo = FakeReportRepo([report])
+    overlay = HazardOverlay(network, repo)
+    overlay.warm()
+
+    service = ReportNotThereService(FakeNotThereRepo(), repo, hazard_overlay=overlay)
+    service.mark_not_there("r1", "u2")
+
+    assert "r1" not in repo.reports
+    assert (network.graph.weights == base).all()
+
+
+def test_route_preview_skips_hazard_query_while_overlay_fresh():
+    network = RoadNetwork(_grid_lines())
+    repo = FakeReportRepo([_report("r1", LAT0, LON0 + 3.5 * STEP, bad=30)])
+    clock = FakeClock()
+    overlay = HazardOverlay(network, repo, resync_s=60, clock=clock)
+    overlay.warm()
+    service = RouteService(
+        None, repo, road_network=network, tmap_client=object(), hazard_overlay=overlay
+    )
+
+    async def preview():
+        return await service.generate_safe_route(LAT0, LON0, LAT0, LON0 + 7 * STEP)
+
+    path = asyncio.run(preview())
+    assert any(p["lat"] != LAT0 for p in path)  # 장애물 우회
+    assert repo.nearby_calls == 0
+
+    # 재동기화 주기가 지나면 전체 제보로 다시 맞춤 (다른 프로세스의 삭제 반영)
+    repo.reports.clear()
+    clock.now = 61
+    path = asyncio.run(preview())
+    assert all(p["lat"] == LAT0 for p in path)
+    assert overlay.synced_at == 61
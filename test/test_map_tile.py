@@ -0,0 +1,33 @@
+import pytest
+
+from report.domain.map_tile import CELLS_PER_TILE, cell_deg, tile_bbox
+
+
+def test_tile_bbox_world_and_quadrants():
+    world = tile_bbox(0, 0, 0)
+    assert world.min_lng == -180 and world.max_lng == 180
+    assert world.max_lat == pytest.approx(85.0511, abs=1e-4)
+    assert world.min_lat == pytest.approx(-85.0511, abs=1e-4)
+
+    nw = tile_bbox(1, 0, 0)
+    assert (nw.min_lat, nw.min_lng, nw.max_lng) == (0, -180, 0)
+
+
+def test_tile_bbox_contains_seoul_and_neighbours_touch():
+    # 서울시청 z=15 타일
+    z, x, y = 15, 27941, 12689
+    bbox = tile_bbox(z, x, y)
+    assert bbox.min_lat <= 37.5665 <= bbox.max_lat
+    assert bbox.min_lng <= 126.9780 <= bbox.max_lng
+
+    east, south = tile_bbox(z, x + 1, y), tile_bbox(z, x, y + 1)
+    assert east.min_lng == pytest.approx(bbox.max_lng)
+    assert south.max_lat == pytest.approx(bbox.min_lat)
+
+
+def test_cell_deg_splits_tile_width():
+    for z in (0, 8, 12):
+        tile = tile_bbox(z, 0, 0)
+        assert cell_deg(z) * CELLS_PER_TILE == pytest.approx(
+            tile.max_lng - tile.min_lng
+        )
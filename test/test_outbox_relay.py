@@ -0,0 +1,258 @@
+import asyncio
+from collections import Counter
+
+import pytest
+
+from report.application.outbox_relay import OutboxRelay
+from report.domain.outbox import OutboxEvent
+from report.domain.repository.outbox_repo import OutboxRepository
+
+
+class FakeOutboxRepo(OutboxRepository):
+    """event_outbox 테이블 대신 쓰는 메모리 outbox (lease는 now 값으로 흉내)"""
+
+    def __init__(self):
+        self.rows = {}  # outbox_id → [event, locked_until]
+        self.parked = {}
+        self.attempts = Counter()
+        self.next_id = 1
+        self.now = 0.0
+        self.claims = 0
+
+    def add(self, routing_key, payload):
+        self.rows[self.next_id] = [
+            OutboxEvent(routing_key, payload, outbox_id=self.next_id),
+            None,
+        ]
+        self.next_id += 1
+
+    def claim(self, limit, lease_s):
+        self.claims += 1
+        claimed = []
+        for outbox_id in sorted(self.rows):
+            row = self.rows[outbox_id]
+            if row[1] is None or row[1] < self.now:
+                row[1] = self.now + lease_s
+                claimed.append(row[0])
+                if len(claimed) == limit:
+                    break
+        return claimed
+
+    def mark_published(self, outbox_ids):
+        for outbox_id in outbox_ids:
+            self.rows.pop(outbox_id, None)
+
+    def release(self, outbox_ids):
+        for outbox_id in outbox_ids:
+            if outbox_id in self.rows:
+                self.rows[outbox_id][1] = None
+
+    def record_failure(self, outbox_ids, max_attempts):
+        parked = []
+        for outbox_id in outbox_ids:
+            self.attempts[outbox_id] += 1
+            self.rows[outbox_id][1] = None
+            if self.attempts[outbox_id] >= max_attempts:
+                self.parked[outbox_id] = self.rows.pop(outbox_id)[0]
+                parked.append(outbox_id)
+        return parked
+
+    def count_pending(self):
+        return len(self.rows)
+
+    def count_parked(self):
+        return len(self.parked)
+
+
+class FakeEventBus:
+    def __init__(self, fail_next=0, poison=None, delay_s=0.0):
+        self.fail_next = fail_next
+        self.poison = poison  # 이 payload(또는 목록)가 든 배치는 항상 실패
+        self.delay_s = delay_s
+        self.batches = []
+        self.calls = 0
+
+    async def publish_batch(self, events):
+        self.calls += 1
+        await asyncio.sleep(self.delay_s)
+        if self.fail_next:
+            self.fail_next -= 1
+            raise ConnectionError("broker unavailable")
+        poison = self.poison if isinstance(self.poison, list) else [self.poison]
+        if any(payload in poison for _, payload in events):
+            raise ValueError("unroutable event")
+        self.batches.append(list(events))
+
+    def published(self):
+        return [event for batch in self.batches for event in batch]
+
+
+async def _wait_until(predicate, timeout_s=2.0):
+    for _ in range(int(timeout_s / 0.01)):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("timed out")
+
+
+def test_events_left_before_restart_are_relayed_in_batches():
+    async def main():
+        repo = FakeOutboxRepo()
+        for i in range(250):
+            repo.add("report.created", {"i": i})  # 이전 프로세스가 커밋만 하고 죽음
+        bus = FakeEventBus()
+        relay = OutboxRelay(repo, bus, batch_size=100, poll_interval_s=10)
+        relay.start()
+        await _wait_until(lambda: not repo.rows)
+        await relay.stop()
+        return bus, relay
+
+    bus, relay = asyncio.run(main())
+    assert [len(b) for b in bus.batches] == [100, 100, 50]
+    assert [m["i"] for _, m in bus.published()] == list(range(250))
+    assert relay.stats()["published"] == 250
+
+
+def test_notify_wakes_relay_without_waiting_for_poll():
+    async def main():
+        repo = FakeOutboxRepo()
+        bus = FakeEventBus()
+        relay = OutboxRelay(repo, bus, poll_interval_s=10)
+        relay.start()
+        await _wait_until(lambda: repo.claims == 1)  # 빈 outbox 확인 후 대기 중
+        repo.add("report.reviewed", {"reportId": "r1"})
+        relay.notify()
+        await _wait_until(lambda: bus.batches, timeout_s=1.0)
+        await relay.stop()
+        return bus
+
+    bus = asyncio.run(main())
+    assert bus.published() == [("report.reviewed", {"reportId": "r1"})]
+
+
+def test_failed_batch_is_released_and_retried():
+    async def main():
+        repo = FakeOutboxRepo()
+        repo.add("report.deleted", {"reportId": "r1"})
+        bus = FakeEventBus(fail_next=2)
+        relay = OutboxRelay(repo, bus, poll_interval_s=10, retry_backoff_s=0.01)
+        relay.start()
+        await _wait_until(lambda: not repo.rows)
+        await relay.stop()
+        return bus, relay
+
+    bus, relay = asyncio.run(main())
+    assert bus.published() == [("report.deleted", {"reportId": "r1"})]
+    assert relay.stats()["failed_batches"] == 2
+
+
+def test_claimed_batch_of_crashed_relay_is_picked_up_after_lease():
+    async def main():
+        repo = FakeOutboxRepo()
+        repo.add("report.created", {"reportId": "r1"})
+        repo.claim(10, lease_s=30)  # 다른 릴레이가 가져간 뒤 발행 전에 죽음
+
+        bus = FakeEventBus()
+        relay = OutboxRelay(repo, bus, lease_s=30)
+        assert await relay.relay_once() == 0  # lease 중에는 건드리지 않음
+        repo.now = 31
+        assert await relay.relay_once() == 1
+        return bus
+
+    bus = asyncio.run(main())
+    assert bus.published() == [("report.created", {"reportId": "r1"})]
+
+
+def test_stop_leaves_unpublished_events_in_outbox():
+    async def main():
+        repo = FakeOutboxRepo()
+        bus = FakeEventBus(fail_next=1000)
+        relay = OutboxRelay(repo, bus, retry_backoff_s=0.01)
+        repo.add("report.created", {"reportId": "r1"})
+        relay.start()
+        await _wait_until(lambda: relay.failed_batches > 0)
+        await relay.stop()
+        return repo
+
+    repo = asyncio.run(main())
+    # 브로커가 계속 죽어 있어도 이벤트는 outbox에 남아 재시작 후 발행된다
+    assert repo.count_pending() == 1
+    assert all(locked is None for _, locked in repo.rows.values())
+
+
+def test_event_that_keeps_failing_is_parked_without_blocking_its_batch():
+    async def main():
+        repo = FakeOutboxRepo()
+        for i in range(5):
+            repo.add("report.created", {"i": i})
+        bus = FakeEventBus(poison={"i": 2})
+        relay = OutboxRelay(repo, bus, max_attempts=3)
+        assert await relay.relay_once() == 4  # 배치 실패 → 한 건씩, 나쁜 한 건만 남음
+        assert list(repo.rows) == [3] and repo.attempts[3] == 1
+        # 혼자 남으면 브로커 문제와 구분할 수 없어 세지 않음
+        with pytest.raises(ValueError):
+            await relay.relay_once()
+        assert repo.attempts[3] == 1
+        for i in range(5, 7):  # 다른 이벤트와 함께 실패할 때마다 셈 → 3번째에 park
+            repo.add("report.created", {"i": i})
+            assert await relay.relay_once() == 1
+        return repo, bus, relay
+
+    repo, bus, relay = asyncio.run(main())
+    assert sorted(m["i"] for _, m in bus.published()) == [0, 1, 3, 4, 5, 6]
+    assert not repo.rows and list(repo.parked) == [3]
+    assert repo.attempts[3] == 3
+    assert relay.stats()["parked"] == 1
+
+
+def test_two_bad_events_at_the_head_do_not_look_like_broker_outage():
+    async def main():
+        repo = FakeOutboxRepo()
+        for i in range(5):
+            repo.add("report.created", {"i": i})
+        bus = FakeEventBus(poison=[{"i": 0}, {"i": 1}])
+        relay = OutboxRelay(repo, bus, max_attempts=1)
+        assert await relay.relay_once() == 3
+        return repo
+
+    repo = asyncio.run(main())
+    assert not repo.rows and sorted(repo.parked) == [1, 2]
+
+
+def test_broker_outage_longer_than_max_attempts_parks_nothing():
+    async def main():
+        repo = FakeOutboxRepo()
+        for i in range(50):
+            repo.add("report.created", {"i": i})
+        bus = FakeEventBus(fail_next=1000)
+        relay = OutboxRelay(repo, bus, max_attempts=3)
+        for _ in range(10):
+            with pytest.raises(ConnectionError):
+                await relay.relay_once()
+        calls = bus.calls
+        bus.fail_next = 0  # 브로커 복구
+        assert await relay.relay_once() == 50
+        return repo, bus, relay, calls
+
+    repo, bus, relay, calls = asyncio.run(main())
+    assert calls == 10 * 4  # 사이클마다 배치 1번 + 한 건씩 3번 (앞 두 건, 마지막 건)
+    assert not repo.rows and not repo.parked and not repo.attempts
+    assert relay.stats()["parked"] == 0
+    assert [m["i"] for _, m in bus.published()] == list(range(50))
+
+
+def test_stop_cancels_relay_stuck_in_publish():
+    async def main():
+        repo = FakeOutboxRepo()
+        repo.add("report.created", {"reportId": "r1"})
+        bus = FakeEventBus(delay_s=60)
+        relay = OutboxRelay(repo, bus)
+        relay.start()
+        await _wait_until(lambda: bus.calls == 1)
+        task = relay._task
+        await relay.stop(timeout_s=0.05)
+        return task, repo
+
+    task, repo = asyncio.run(main())
+    assert task.cancelled()
+    assert repo.count_pending() == 1
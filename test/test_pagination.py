@@ -0,0 +1,66 @@
+from datetime import datetime
+
+import pytest
+
+from report.domain.pagination import (
+    decode_cursor,
+    encode_cursor,
+    make_page,
+    parse_fields,
+    project,
+    query_columns,
+)
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    created_at = datetime(2025, 5, 1, 12, 30, 15, 123456)
+    cursor = encode_cursor(created_at, "01JTX0ABCDEF")
+    assert decode_cursor(cursor) == (created_at, "01JTX0ABCDEF")
+
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_parse_fields_accepts_aliases_and_snake_case():
+    assert parse_fields("reportId, category,location_lat,category") == [
+        "report_id",
+        "category",
+        "location_lat",
+    ]
+    assert parse_fields(None) is None and parse_fields(" , ") is None
+
+    with pytest.raises(ValueError):
+        parse_fields("password")
+    # 클러스터 요약 값은 latest-by-cluster에서만
+    with pytest.raises(ValueError):
+        parse_fields("memberCount")
+    assert parse_fields("memberCount", summary=True) == ["member_count"]
+
+
+def test_projection_reads_keyset_columns_but_returns_requested_only():
+    columns = ["category", "location_lat"]
+    assert query_columns(columns) == [
+        "category",
+        "location_lat",
+        "created_at",
+        "report_id",
+    ]
+
+    row = {
+        "category": "공사장",
+        "location_lat": 37.5,
+        "created_at": datetime(2025, 1, 1),
+        "report_id": "r1",
+    }
+    assert project(row, columns) == {"category": "공사장", "locationLat": 37.5}
+
+
+def test_make_page_uses_extra_row_for_next_cursor():
+    rows = [(datetime(2025, 1, 3 - i), f"r{i}") for i in range(3)]
+
+    page = make_page(rows, 2, key=lambda r: r)
+    assert page.items == rows[:2]
+    assert decode_cursor(page.next_cursor) == rows[1]
+
+    last = make_page(rows[:2], 2, key=lambda r: r)
+    assert last.next_cursor is None
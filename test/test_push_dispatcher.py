@@ -0,0 +1,169 @@
+import asyncio
+import threading
+
+from report.application.push_dispatcher import PushDispatcher
+from report.domain.push import FAILED, RETRY, SENT, PushMessage, PushSender
+
+
+class FakeFcmSender(PushSender):
+    """
+    로컬 가짜 FCM. send_each 호출을 기록하고, outcomes[token]에 적힌 결과를
+    호출마다 앞에서부터 하나씩 돌려준다 (비면 SENT)
+    """
+
+    def __init__(self, outcomes=None):
+        self.outcomes = {k: list(v) for k, v in (outcomes or {}).items()}
+        self.calls = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def send_each(self, messages):
+        self.release.wait()
+        self.calls.append(list(messages))
+        return [
+            self.outcomes[m.token].pop(0) if self.outcomes.get(m.token) else SENT
+            for m in messages
+        ]
+
+
+def _msg(token, title="제보 등록 알림", report_id="r1"):
+    return PushMessage(token, title, "본문", {"reportId": report_id})
+
+
+async def _drain(dispatcher):
+    dispatcher.start()
+    try:
+        for _ in range(200):
+            await asyncio.sleep(0.01)
+            stats = dispatcher.stats()
+            if stats["queue_depth"] == 0 and stats["retry_waiting"] == 0:
+                await dispatcher._queue.join()
+                if dispatcher.stats()["retry_waiting"] == 0:
+                    break
+    finally:
+        await dispatcher.stop()
+    return dispatcher.stats()
+
+
+def test_messages_with_per_report_data_share_one_send_each_call():
+    async def main():
+        sender = FakeFcmSender()
+        dispatcher = PushDispatcher(sender, workers=1, batch_wait_s=0.02)
+        for i in range(5):  # 제보마다 data의 reportId가 다름
+            assert dispatcher.enqueue(_msg(f"t{i}", report_id=f"r{i}"))
+        dispatcher.enqueue(_msg("t0", report_id="r0"))  # 같은 알림 중복 → 한 번만
+        dispatcher.enqueue(_msg("t0", report_id="r9"))  # 같은 기기, 다른 제보 → 따로
+        dispatcher.enqueue(_msg("t9", title="제보 삭제 알림", report_id="r8"))
+        return sender, await _drain(dispatcher)
+
+    sender, stats = asyncio.run(main())
+    assert len(sender.calls) == 1
+    sent = [(m.token, m.title, m.data["reportId"]) for m in sender.calls[0]]
+    assert sent == [(f"t{i}", "제보 등록 알림", f"r{i}") for i in range(5)] + [
+        ("t0", "제보 등록 알림", "r9"),
+        ("t9", "제보 삭제 알림", "r8"),
+    ]
+    assert stats["send_calls"] == 1
+    assert stats["sent"] == 7
+    assert stats["send_p50_ms"] is not None
+
+
+def test_send_each_calls_are_capped_at_batch_size():
+    async def main():
+        sender = FakeFcmSender()
+        dispatcher = PushDispatcher(sender, workers=1, batch_size=4, batch_wait_s=0.02)
+        for i in range(10):
+            dispatcher.enqueue(_msg(f"t{i}", report_id=f"r{i}"))
+        return sender, await _drain(dispatcher)
+
+    sender, stats = asyncio.run(main())
+    assert [len(call) for call in sender.calls] == [4, 4, 2]
+    assert stats["sent"] == 10
+
+
+def test_transient_failure_retried_with_backoff_then_sent():
+    async def main():
+        sender = FakeFcmSender({"t1": [RETRY, RETRY]})
+        dispatcher = PushDispatcher(
+            sender, workers=1, batch_wait_s=0, retry_backoff_s=0.01
+        )
+        dispatcher.enqueue(_msg("t1"))
+        return sender, await _drain(dispatcher)
+
+    sender, stats = asyncio.run(main())
+    assert len(sender.calls) == 3
+    assert stats["retried"] == 2
+    assert stats["sent"] == 1
+    assert stats["failed"] == 0
+
+
+def test_permanent_failure_and_exhausted_retries_counted_as_failed():
+    async def main():
+        sender = FakeFcmSender({"bad": [FAILED], "flaky": [RETRY] * 10})
+        dispatcher = PushDispatcher(
+            sender, workers=1, batch_wait_s=0, max_retries=2, retry_backoff_s=0.01
+        )
+        dispatcher.enqueue(_msg("bad"))
+        dispatcher.enqueue(_msg("flaky"))
+        return await _drain(dispatcher)
+
+    stats = asyncio.run(main())
+    assert stats["failed"] == 2
+    assert stats["retried"] == 2
+    assert stats["sent"] == 0
+
+
+def test_sender_exception_is_treated_as_transient():
+    class BrokenOnceSender(FakeFcmSender):
+        def send_each(self, messages):
+            if not self.calls:
+                self.calls.append(None)
+                raise ConnectionError("fcm down")
+            return super().send_each(messages)
+
+    async def main():
+        sender = BrokenOnceSender()
+        dispatcher = PushDispatcher(
+            sender, workers=1, batch_wait_s=0, retry_backoff_s=0.01
+        )
+        dispatcher.enqueue(_msg("t1"))
+        return await _drain(dispatcher)
+
+    stats = asyncio.run(main())
+    assert stats["sent"] == 1
+    assert stats["retried"] == 1
+
+
+def test_full_queue_drops_without_blocking():
+    async def main():
+        sender = FakeFcmSender()
+        dispatcher = PushDispatcher(sender, max_queue=2)
+        results = [dispatcher.enqueue(_msg(f"t{i}")) for i in range(4)]
+        stats = dispatcher.stats()
+        await _drain(dispatcher)
+        return results, stats
+
+    results, stats = asyncio.run(main())
+    assert results == [True, True, False, False]
+    assert stats["queue_depth"] == 2
+    assert stats["dropped"] == 2
+
+
+def test_enqueue_does_not_wait_for_slow_fcm():
+    async def main():
+        sender = FakeFcmSender()
+        sender.release.clear()  # FCM 응답이 오지 않는 상태
+        dispatcher = PushDispatcher(sender, workers=1, batch_wait_s=0)
+        dispatcher.start()
+        dispatcher.enqueue(_msg("t0"))
+        await asyncio.sleep(0.05)  # 워커가 t0 전송에서 멈춤
+        for i in range(1, 3):
+            dispatcher.enqueue(_msg(f"t{i}"))
+        depth = dispatcher.stats()["queue_depth"]
+        sender.release.set()
+        await dispatcher.stop()
+        return depth, dispatcher.stats()
+
+    depth, stats = asyncio.run(main())
+    assert depth == 2  # 워커 하나가 첫 배치를 보내는 중, 나머지는 큐에서 대기
+    assert stats["sent"] == 3
@@ -2,7 +2,6 @@ from report.application.report_service import ReportService
 from report.domain.repository.report_repo import ReportRepository
 from user.domain.repository.user_repo import UserRepository
 from report.domain.report import Report
-import math
 
 
 # --- Report용 Fake Repository ---
@@ -23,26 +22,6 @@ class FakeRepo(ReportRepository):
     def update_feedback_counts(self, report):
         return report
 
-    def find_nearby_reports(self, lat, lng, radius_m):
-        """500m 이내 제보 검색 (Haversine 이용)"""
-
-        def haversine(lat1, lon1, lat2, lon2):
-            R = 6371000
-            phi1, phi2 = math.radians(lat1), math.radians(lat2)
-            dphi = math.radians(lat2 - lat1)
-            dlambda = math.radians(lon2 - lon1)
-            a = (
-                math.sin(dphi / 2) ** 2
-                + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
-            )
-            return 2 * R * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-
-        return [
-            r
-            for r in self.reports
-            if haversine(lat, lng, r.location_lat, r.location_lng) <= radius_m
-        ]
-
 
 # --- User용 Fake Repository ---
 class FakeUserRepo(UserRepository):
@@ -0,0 +1,83 @@
+from report.application.report_cluster_service import (
+    ReportClusterService,
+    build_clusters,
+)
+from report.domain.report import Report
+
+LAT0, LNG0 = 37.5665, 126.9780
+STEP = 0.001  # 약 110m
+
+
+class FakeClusterRepo:
+    def __init__(self, points=()):
+        self.points = list(points)
+        self.removed = []
+        self.replaced = None
+
+    def remove_member(self, cluster_id, lat, lng):
+        self.removed.append((cluster_id, lat, lng))
+
+    def recluster(self, eps_m, min_points, build):
+        self.replaced = build(self.points)
+        return self.replaced
+
+
+def test_build_clusters_groups_labels_and_attaches_pending_reports():
+    points = [
+        ("a1", LAT0, LNG0, "APPROVED", 0),
+        ("a2", LAT0 + STEP, LNG0, "APPROVED", 0),
+        ("b1", LAT0 + 20 * STEP, LNG0, "APPROVED", 1),
+        ("b2", LAT0 + 20 * STEP, LNG0 + STEP, "APPROVED", 1),
+        ("noise", LAT0 - 20 * STEP, LNG0, "APPROVED", None),
+        ("p-near", LAT0 + 2 * STEP, LNG0, "PENDING", None),
+        ("p-far", LAT0 + 40 * STEP, LNG0, "PENDING", None),
+    ]
+
+    clusters, assignments = build_clusters(points, radius_m=500)
+
+    assert assignments["a1"] == assignments["a2"] == assignments["p-near"]
+    assert assignments["b1"] == assignments["b2"]
+    assert len({assignments[r] for r in ("a1", "b1", "noise", "p-far")}) == 4
+    assert len(clusters) == 4
+
+    by_id = {c.cluster_id: c for c in clusters}
+    a = by_id[assignments["a1"]]
+    assert a.member_count == 3
+    assert abs(a.center_lat - (LAT0 + STEP)) < 1e-9
+    assert sum(c.member_count for c in clusters) == len(points)
+
+
+def test_build_clusters_without_approved_reports():
+    clusters, assignments = build_clusters([("p1", LAT0, LNG0, "PENDING", None)])
+    assert len(clusters) == 1 and clusters[0].member_count == 1
+    assert assignments == {"p1": clusters[0].cluster_id}
+
+
+def test_recluster_rewrites_all_assignments_in_one_call():
+    repo = FakeClusterRepo(
+        [
+            ("a1", LAT0, LNG0, "APPROVED", 0),
+            ("a2", LAT0 + STEP, LNG0, "APPROVED", 0),
+        ]
+    )
+    result = ReportClusterService(repo).recluster()
+
+    clusters, assignments = repo.replaced
+    assert result == {"clusters": 1, "reports": 2}
+    assert set(assignments.values()) == {clusters[0].cluster_id}
+
+
+def test_release_skips_reports_without_cluster():
+    repo = FakeClusterRepo()
+    service = ReportClusterService(repo)
+    report = Report(
+        report_id="r1",
+        reporter_id="u1",
+        reporter_type="child",
+        location_lat=LAT0,
+        location_lng=LNG0,
+    )
+    service.release(report)
+    report.cluster_id = "c1"
+    service.release(report)
+    assert repo.removed == [("c1", LAT0, LNG0)]
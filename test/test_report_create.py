@@ -0,0 +1,175 @@
+# 제보 생성 경로 리포지토리 확인: 유저+보호자 조인 조회, 클러스터 배정+INSERT(+outbox) 단일 트랜잭션
+# TEST_DATABASE_URL=postgresql+psycopg2://... poetry run pytest test/test_report_create.py
+# (앱 설정(.env)도 필요 — database 모듈 import 시 읽음)
+# 테스트 DB에 테이블을 만들고 test_ 접두사 데이터만 넣었다 지운다.
+import os
+from datetime import datetime
+
+import pytest
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set"
+)
+
+LAT0, LNG0 = 37.5665, 126.9780
+
+
+@pytest.fixture
+def engine():
+    from sqlalchemy import create_engine, text
+
+    from database import Base, SessionLocal
+    from report.infra.db_models.report import Report  # noqa: F401
+    from report.infra.db_models.report_cluster import ReportCluster  # noqa: F401
+    from report.infra.db_models.event_outbox import EventOutbox  # noqa: F401
+    from user.infra.db_models.user import User  # noqa: F401
+
+    engine = create_engine(TEST_DATABASE_URL)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS postgis"))
+    Base.metadata.create_all(bind=engine)
+    SessionLocal.configure(bind=engine)
+
+    cleanup = [
+        "DELETE FROM report WHERE report_id LIKE 'test_create_%'",
+        "DELETE FROM report_cluster WHERE cluster_id LIKE 'test_create_%'",
+        "DELETE FROM report_cluster_summary WHERE cluster_id LIKE 'test_create_%'",
+        "DELETE FROM users WHERE user_id LIKE 'test_create_%'",
+        "DELETE FROM event_outbox WHERE payload->>'reportId' LIKE 'test_create_%'",
+    ]
+    with engine.begin() as conn:
+        for statement in cleanup:
+            conn.execute(text(statement))
+    yield engine
+    with engine.begin() as conn:
+        for statement in cleanup:
+            conn.execute(text(statement))
+
+
+def _user(user_id, user_type, parent_id=None):
+    from user.domain.user import User
+
+    return User(
+        user_id=user_id,
+        user_type=user_type,
+        name=user_id,
+        email=f"{user_id}@test",
+        phone="000",
+        password="x",
+        parent_id=parent_id,
+        fcm_token="token",
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow(),
+    )
+
+
+def _report(report_id, lat, lng, cluster_id):
+    from report.domain.report import Report
+
+    return Report(
+        report_id=report_id,
+        reporter_id="test_create_child",
+        reporter_type="child",
+        location_lat=lat,
+        location_lng=lng,
+        cluster_id=cluster_id,
+        category="장애물",
+        status="APPROVED",
+        not_there=0,
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow(),
+    )
+
+
+def test_get_with_parent_joins_parent(engine):
+    from user.infra.repository.postgres_user_repo import PostgresUserRepository
+
+    repo = PostgresUserRepository()
+    repo.save(_user("test_create_parent", "parent"))
+    repo.save(_user("test_create_child", "child", "test_create_parent"))
+
+    child, parent = repo.get_with_parent("test_create_child")
+    assert child.user_id == "test_create_child"
+    assert parent.user_id == "test_create_parent"
+    assert repo.get_with_parent("test_create_parent")[1] is None
+    assert repo.get_with_parent("test_create_missing") == (None, None)
+
+
+def test_save_with_cluster_assigns_nearest_cluster_in_same_transaction(engine):
+    from report.infra.repository.postgres_report_cluster_repo import (
+        PostgresReportClusterRepository,
+    )
+    from report.infra.repository.postgres_report_repo import (
+        PostgresReportRepository,
+    )
+
+    repo = PostgresReportRepository()
+    clusters = PostgresReportClusterRepository()
+
+    first = repo.save_with_cluster(
+        _report("test_create_1", LAT0, LNG0, "test_create_c1"), 500
+    )
+    assert first.cluster_id == "test_create_c1"
+
+    # 100m 옆 → 기존 클러스터, 중심점 이동 평균
+    near = repo.save_with_cluster(
+        _report("test_create_2", LAT0 + 0.0009, LNG0, "test_create_c2"), 500
+    )
+    assert near.cluster_id == "test_create_c1"
+    cluster = clusters.get("test_create_c1")
+    assert cluster.member_count == 2
+    assert cluster.center_lat == pytest.approx(LAT0 + 0.00045)
+    assert clusters.get("test_create_c2") is None
+
+    # 5km 밖 → 새 클러스터
+    far = repo.save_with_cluster(
+        _report("test_create_3", LAT0 + 0.05, LNG0, "test_create_c3"), 500
+    )
+    assert far.cluster_id == "test_create_c3"
+
+
+def test_outbox_event_commits_with_report_and_is_claimed_once(engine):
+    from sqlalchemy import text
+
+    from report.domain.outbox import OutboxEvent
+    from report.infra.repository.postgres_outbox_repo import (
+        PostgresOutboxRepository,
+    )
+    from report.infra.repository.postgres_report_repo import (
+        PostgresReportRepository,
+    )
+
+    repo = PostgresReportRepository()
+    outbox = PostgresOutboxRepository()
+    event = OutboxEvent("report.created", {"reportId": "test_create_ob"})
+
+    repo.save_with_cluster(
+        _report("test_create_ob", LAT0, LNG0, "test_create_cob"), 500, [event]
+    )
+
+    # 다른 릴레이가 잡고 있는 동안에는 다시 가져가지 않음
+    claimed = [
+        e for e in outbox.claim(1000, 30) if e.payload["reportId"] == "test_create_ob"
+    ]
+    assert [(e.routing_key, e.payload) for e in claimed] == [
+        ("report.created", {"reportId": "test_create_ob"})
+    ]
+    assert not [
+        e for e in outbox.claim(1000, 30) if e.payload["reportId"] == "test_create_ob"
+    ]
+
+    # 발행 실패 → lease 해제 후 다시 claim, 발행 확인 → 삭제
+    outbox.release([claimed[0].outbox_id])
+    again = [
+        e for e in outbox.claim(1000, 30) if e.payload["reportId"] == "test_create_ob"
+    ]
+    assert [e.outbox_id for e in again] == [claimed[0].outbox_id]
+    outbox.mark_published([claimed[0].outbox_id])
+    with engine.connect() as conn:
+        left = conn.execute(
+            text("SELECT count(*) FROM event_outbox WHERE outbox_id = :id"),
+            {"id": claimed[0].outbox_id},
+        ).scalar_one()
+    assert left == 0
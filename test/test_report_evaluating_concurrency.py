@@ -0,0 +1,140 @@
+# 동시 이모지 평가 후 제보 카운트가 실제 평가 행과 일치하는지 확인 (PostgreSQL 필요)
+# TEST_DATABASE_URL=postgresql+psycopg2://... poetry run pytest test/test_report_evaluating_concurrency.py
+# (앱 설정(.env)도 필요 — database 모듈 import 시 읽음)
+# 테스트 DB에 테이블을 만들고 test_ 접두사 데이터만 넣었다 지운다.
+import os
+import random
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set"
+)
+
+N_USERS = 40
+TAPS_PER_USER = 25
+
+
+@pytest.fixture
+def repo():
+    from sqlalchemy import create_engine, text
+
+    from database import Base, SessionLocal
+    from report.infra.db_models.report import Report  # noqa: F401
+    from report.infra.db_models.report_cluster import ReportClusterSummary  # noqa: F401
+    from report.infra.db_models.report_evaluating import ReportEvaluating  # noqa: F401
+    from report.infra.repository.postgres_report_evaluating_repo import (
+        PostgresReportEvaluatingRepository,
+    )
+    from user.infra.db_models.user import User  # noqa: F401
+
+    engine = create_engine(TEST_DATABASE_URL, pool_size=N_USERS)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS postgis"))
+    Base.metadata.create_all(bind=engine)
+    SessionLocal.configure(bind=engine)
+
+    cleanup = [
+        "DELETE FROM report_evaluating WHERE report_id = 'test_report'",
+        "DELETE FROM report_cluster_summary WHERE cluster_id = 'test_cluster'",
+        "DELETE FROM report WHERE report_id = 'test_report'",
+        "DELETE FROM users WHERE user_id LIKE 'test_user_%'",
+    ]
+    with engine.begin() as conn:
+        for statement in cleanup:
+            conn.execute(text(statement))
+        conn.execute(
+            text(
+                """
+                INSERT INTO report (report_id, reporter_id, reporter_type,
+                    location_lat, location_lng, cluster_id, status, good_count,
+                    normal_count, bad_count, total_feedbacks, not_there,
+                    created_at, updated_at)
+                VALUES ('test_report', 'test_user_0', 'parent', 37.5665, 126.978,
+                    'test_cluster', 'APPROVED', 0, 0, 0, 0, 0, :now, :now)
+                """
+            ),
+            {"now": datetime.utcnow()},
+        )
+        for i in range(N_USERS):
+            conn.execute(
+                text(
+                    """
+                    INSERT INTO users (user_id, user_type, name, email, phone, password)
+                    VALUES (:id, 'parent', 'test', :email, '010', 'x')
+                    """
+                ),
+                {"id": f"test_user_{i}", "email": f"test_user_{i}@example.com"},
+            )
+
+    yield PostgresReportEvaluatingRepository(), engine
+
+    with engine.begin() as conn:
+        for statement in cleanup:
+            conn.execute(text(statement))
+    engine.dispose()
+
+
+def _counts(engine):
+    from sqlalchemy import text
+
+    with engine.connect() as conn:
+        report = (
+            conn.execute(
+                text(
+                    """
+                    SELECT good_count, normal_count, bad_count, total_feedbacks
+                    FROM report WHERE report_id = 'test_report'
+                    """
+                )
+            )
+            .mappings()
+            .one()
+        )
+        rows = conn.execute(
+            text(
+                """
+                SELECT lower(evaluation::text) AS evaluation, count(*) AS n
+                FROM report_evaluating WHERE report_id = 'test_report'
+                GROUP BY 1
+                """
+            )
+        ).all()
+    return dict(report), {r.evaluation: r.n for r in rows}
+
+
+def test_parallel_first_taps_are_not_lost(repo):
+    repo, engine = repo
+    with ThreadPoolExecutor(N_USERS) as pool:
+        list(
+            pool.map(
+                lambda i: repo.apply_evaluation("test_report", f"test_user_{i}", "bad"),
+                range(N_USERS),
+            )
+        )
+
+    report, rows = _counts(engine)
+    assert report["bad_count"] == N_USERS == report["total_feedbacks"]
+    assert rows == {"bad": N_USERS}
+
+
+def test_parallel_random_taps_keep_counts_in_sync_with_rows(repo):
+    repo, engine = repo
+    rng = random.Random(0)
+    taps = [
+        (f"test_user_{rng.randrange(N_USERS)}", rng.choice(["good", "normal", "bad"]))
+        for _ in range(N_USERS * TAPS_PER_USER)
+    ]
+
+    with ThreadPoolExecutor(N_USERS) as pool:
+        list(pool.map(lambda t: repo.apply_evaluation("test_report", *t), taps))
+
+    report, rows = _counts(engine)
+    assert report["good_count"] == rows.get("good", 0)
+    assert report["normal_count"] == rows.get("normal", 0)
+    assert report["bad_count"] == rows.get("bad", 0)
+    assert report["total_feedbacks"] == sum(rows.values())
@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from report.application.report_evaluating_service import ReportEvaluatingService
+from report.domain.feedback_delta import FeedbackDelta
+from report.domain.report import Report
+
+
+class FakeEvaluatingRepo:
+    def __init__(self, report):
+        self.report = report
+        self.calls = []
+
+    def apply_evaluation(self, report_id, user_id, evaluation):
+        self.calls.append((report_id, user_id, evaluation))
+        if self.report is None:
+            return None
+        return "added", self.report
+
+
+class FakeToggleRepo:
+    def toggle_evaluation(self, report_id, user_id, evaluation):
+        return "changed", FeedbackDelta.evaluation("good", -1).merge(
+            FeedbackDelta.evaluation(evaluation, 1)
+        )
+
+    def apply_evaluation(self, *args):
+        raise AssertionError("write-behind 모드에서는 카운트를 바로 쓰지 않아야 함")
+
+
+class FakeBuffer:
+    def __init__(self):
+        self.added = []
+
+    def add(self, report_id, delta):
+        self.added.append((report_id, delta))
+
+
+class FakeOverlay:
+    def __init__(self):
+        self.updated = []
+
+    def update_report(self, report):
+        self.updated.append(report.report_id)
+
+
+def _report(status):
+    return Report(
+        report_id="r1",
+        reporter_id="u1",
+        reporter_type="parent",
+        status=status,
+        bad_count=1,
+        total_feedbacks=1,
+    )
+
+
+def test_evaluate_uses_single_repo_call_and_refreshes_overlay():
+    repo, overlay = FakeEvaluatingRepo(_report("APPROVED")), FakeOverlay()
+    service = ReportEvaluatingService(None, repo, hazard_overlay=overlay)
+
+    result = asyncio.run(service.evaluate_report("r1", "u2", "bad"))
+
+    assert result["action"] == "added"
+    assert repo.calls == [("r1", "u2", "bad")]
+    assert overlay.updated == ["r1"]
+
+
+def test_evaluate_skips_overlay_for_pending_report():
+    repo, overlay = FakeEvaluatingRepo(_report("PENDING")), FakeOverlay()
+    service = ReportEvaluatingService(None, repo, hazard_overlay=overlay)
+    asyncio.run(service.evaluate_report("r1", "u2", "good"))
+    assert overlay.updated == []
+
+
+@pytest.mark.parametrize(
+    "report, evaluation, status_code",
+    [(None, "good", 404), (_report("APPROVED"), "great", 400)],
+)
+def test_evaluate_errors(report, evaluation, status_code):
+    service = ReportEvaluatingService(None, FakeEvaluatingRepo(report))
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(service.evaluate_report("r1", "u2", evaluation))
+    assert exc.value.status_code == status_code
+
+
+def test_evaluate_with_buffer_defers_counter_update():
+    buffer = FakeBuffer()
+    service = ReportEvaluatingService(None, FakeToggleRepo(), feedback_buffer=buffer)
+    result = asyncio.run(service.evaluate_report("r1", "u2", "bad"))
+    assert result["action"] == "changed"
+    assert buffer.added == [("r1", FeedbackDelta(good=-1, bad=1))]
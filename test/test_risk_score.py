@@ -0,0 +1,28 @@
+import sqlite3
+
+from report.domain.risk_score import RISK_SCORE_SQL, risk_score
+
+
+def _sql_risk_score(good, normal, bad):
+    # 생성 컬럼 식을 SQLite에서 계산해 파이썬 함수와 비교 (exp는 SQLite 수학 함수)
+    with sqlite3.connect(":memory:") as conn:
+        return conn.execute(
+            f"SELECT {RISK_SCORE_SQL} FROM "
+            "(SELECT ? AS good_count, ? AS normal_count, ? AS bad_count)",
+            (good, normal, bad),
+        ).fetchone()[0]
+
+
+def test_no_feedback_is_neutral():
+    assert risk_score(0, 0, 0) == 0.5
+    assert risk_score(None, None, None) == 0.5
+
+
+def test_more_bad_feedback_raises_score():
+    assert risk_score(0, 0, 10) > risk_score(0, 5, 5) > risk_score(10, 0, 0)
+    assert risk_score(20, 0, 0) < 0.1 < risk_score(0, 0, 1)
+
+
+def test_sql_expression_matches_python():
+    for counts in [(0, 0, 0), (1, 0, 3), (20, 0, 0), (0, 5, 7), (None, 2, None)]:
+        assert abs(_sql_risk_score(*counts) - risk_score(*counts)) < 1e-9
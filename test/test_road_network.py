@@ -0,0 +1,125 @@
+import json
+
+from route.algorithms.road_network import RoadNetwork
+from route.algorithms.safe_path_finder import Hazard, HazardCategory, haversine
+from route.infra.road_network_loader import load_road_lines
+
+LAT0, LON0 = 37.5665, 126.9780
+STEP = 0.001  # 약 110m 간격
+
+
+def _grid_lines(size=8):
+    pts = [
+        [(round(LAT0 + i * STEP, 6), round(LON0 + j * STEP, 6)) for j in range(size)]
+        for i in range(size)
+    ]
+    cols = [[pts[i][j] for i in range(size)] for j in range(size)]
+    return pts + cols
+
+
+def _path_length(path):
+    return sum(
+        haversine(a["lat"], a["lon"], b["lat"], b["lon"])
+        for a, b in zip(path, path[1:])
+    )
+
+
+def test_find_path_detours_around_hazard_and_restores_on_remove():
+    network = RoadNetwork(_grid_lines())
+    origin, dest = (LAT0, LON0), (LAT0, LON0 + 7 * STEP)
+    base_weights = network.graph.weights.copy()
+
+    straight = network.find_path(origin, dest)
+    assert all(p["lat"] == LAT0 for p in straight)
+
+    # 직선 경로 한가운데 공사장 → 한 줄 위로 우회
+    hz = Hazard(LAT0, LON0 + 3.5 * STEP, HazardCategory.OBSTACLE, 2.0, report_id="r1")
+    network.apply_hazard(hz)
+    detour = network.find_path(origin, dest)
+    assert any(p["lat"] != LAT0 for p in detour)
+    assert _path_length(detour) > _path_length(straight)
+
+    assert network.remove_hazard("r1")
+    assert (network.graph.weights == base_weights).all()
+    assert network.find_path(origin, dest) == straight
+
+
+def test_sync_hazards_only_touches_changes_inside_query_area():
+    network = RoadNetwork(_grid_lines())
+    near = Hazard(LAT0, LON0 + 2.5 * STEP, HazardCategory.FEAR, 1.0, report_id="near")
+    far = Hazard(LAT0 + 7 * STEP, LON0, HazardCategory.FEAR, 1.0, report_id="far")
+    network.sync_hazards([near, far])
+
+    # 조회 범위(near 주변 100m) 안에서 사라진 것만 제거, 범위 밖 far는 유지
+    network.sync_hazards([], corridor=[(near.lat, near.lon)], width_m=100)
+    assert set(network._applied) == {"far"}
+
+    # 점수가 바뀐 위험구역은 교체
+    rescored = Hazard(far.lat, far.lon, HazardCategory.FEAR, 0.2, report_id="far")
+    network.sync_hazards([rescored])
+    assert network._applied["far"][2] == 0.2 * 300
+
+
+def test_rescoring_hazard_never_exposes_unpenalized_weights_to_readers():
+    network = RoadNetwork(_grid_lines())
+    base = network.graph.weights.copy()
+    hz = Hazard(LAT0, LON0 + 3.5 * STEP, HazardCategory.OBSTACLE, 2.0, report_id="r1")
+    network.apply_hazard(hz)
+    edges = network._segment_edges[network.segments_within(hz)].reshape(-1)
+    before = network.graph.weights
+
+    # 탐색 중인 쪽이 잡고 있던 배열은 그대로, 교체는 새 배열로 한 번에
+    network.apply_hazard(
+        Hazard(hz.lat, hz.lon, HazardCategory.OBSTACLE, 1.0, report_id="r1")
+    )
+    assert network.graph.weights is not before
+    assert (before[edges] == base[edges] + 2.0 * 300).all()
+    assert (network.graph.weights[edges] == base[edges] + 1.0 * 300).all()
+
+    network.sync_hazards([hz])
+    assert (network.graph.weights[edges] == base[edges] + 2.0 * 300).all()
+
+
+def test_find_path_outside_network_returns_none():
+    network = RoadNetwork(_grid_lines(), max_snap_m=200)
+    assert network.find_path((LAT0, LON0), (LAT0 + 0.05, LON0)) is None
+
+
+def test_load_road_lines_from_geojson(tmp_path):
+    path = tmp_path / "roads.geojson"
+    path.write_text(
+        json.dumps(
+            {
+                "type": "FeatureCollection",
+                "features": [
+                    {
+                        "properties": {"highway": "footway"},
+                        "geometry": {
+                            "type": "LineString",
+                            "coordinates": [[127.0, 37.0], [127.001, 37.0]],
+                        },
+                    },
+                    {
+                        "properties": {"highway": "motorway"},
+                        "geometry": {
+                            "type": "LineString",
+                            "coordinates": [[127.0, 37.1], [127.001, 37.1]],
+                        },
+                    },
+                    {
+                        "properties": {},
+                        "geometry": {
+                            "type": "MultiLineString",
+                            "coordinates": [[[127.0, 37.2], [127.0, 37.201]]],
+                        },
+                    },
+                    {"properties": {}, "geometry": {"type": "Point"}},
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    assert load_road_lines(str(path)) == [
+        [(37.0, 127.0), (37.0, 127.001)],
+        [(37.2, 127.0), (37.201, 127.0)],
+    ]
@@ -0,0 +1,231 @@
+import heapq
+import random
+
+from route.algorithms.safe_path_finder import (
+    Hazard,
+    HazardCategory,
+    astar_graph,
+    build_graph,
+    haversine,
+    snap_to_nearest_node,
+)
+from route.algorithms.compact_graph import CompactGraph
+from route.algorithms.node_index import NodeIndex
+
+
+def _random_graph(rng, n, spread=0.02):
+    """서울시청 주변 무작위 노드 그래프 (간선은 스냅 테스트에 필요 없음)"""
+    graph = {}
+    for _ in range(n):
+        node = (
+            round(37.5665 + rng.uniform(-spread, spread), 6),
+            round(126.9780 + rng.uniform(-spread, spread), 6),
+        )
+        graph.setdefault(node, [])
+    return graph
+
+
+# --- 노드 스냅 ---
+def test_node_index_matches_linear_scan():
+    rng = random.Random(0)
+    graph = _random_graph(rng, 3000)
+    index = NodeIndex(graph.keys())
+
+    for _ in range(500):
+        point = (
+            37.5665 + rng.uniform(-0.03, 0.03),
+            126.9780 + rng.uniform(-0.03, 0.03),
+        )
+        assert snap_to_nearest_node(graph, point, index) == snap_to_nearest_node(
+            graph, point
+        )
+
+
+def test_node_index_tie_picks_first_inserted_node():
+    # 기준점에서 정확히 같은 거리의 두 노드 → 선형 탐색처럼 먼저 들어온 노드 선택
+    graph = {(37.0, 127.001): [], (37.0, 126.999): [], (37.5, 127.0): []}
+    index = NodeIndex(graph.keys())
+    point = (37.0, 127.0)
+    assert snap_to_nearest_node(graph, point, index) == snap_to_nearest_node(
+        graph, point
+    )
+    assert snap_to_nearest_node(graph, point, index) == (37.0, 127.001)
+
+
+def test_compact_graph_snap_matches_dict_linear_scan():
+    rng = random.Random(2)
+    graph = _random_graph(rng, 1000)
+    compact = CompactGraph.from_adjacency(graph)
+    for _ in range(200):
+        point = (
+            37.5665 + rng.uniform(-0.03, 0.03),
+            126.9780 + rng.uniform(-0.03, 0.03),
+        )
+        assert snap_to_nearest_node(compact, point) == snap_to_nearest_node(
+            graph, point
+        )
+
+
+def test_node_index_exact_node_and_empty_graph():
+    graph = _random_graph(random.Random(1), 50)
+    index = NodeIndex(graph.keys())
+    for node in graph:
+        assert index.nearest(node) == node
+
+    assert NodeIndex([]).nearest((37.0, 127.0)) is None
+    assert snap_to_nearest_node({}, (37.0, 127.0)) == (37.0, 127.0)
+
+
+# --- CSR 그래프 + A* ---
+def _reference_astar(graph, start, goal):
+    """dict 그래프 기반 기존 A* (비교 기준)"""
+    open_set = [(0, start)]
+    came_from = {}
+    g_score = {start: 0}
+    while open_set:
+        _, current = heapq.heappop(open_set)
+        if haversine(current[0], current[1], goal[0], goal[1]) < 100:
+            path = [goal]
+            while current in came_from:
+                path.append(current)
+                current = came_from[current]
+            path.append(start)
+            path.reverse()
+            return [{"lat": lat, "lon": lon} for lat, lon in path]
+        for neighbor, weight in graph.get(current, []):
+            tentative_g = g_score[current] + weight
+            if neighbor not in g_score or tentative_g < g_score[neighbor]:
+                g_score[neighbor] = tentative_g
+                f_score = tentative_g + haversine(
+                    neighbor[0], neighbor[1], goal[0], goal[1]
+                )
+                heapq.heappush(open_set, (f_score, neighbor))
+                came_from[neighbor] = current
+    return []
+
+
+def _grid_lines(size=15, step=0.0008):
+    """가로/세로 LineString으로 이루어진 격자 도로망 (교차점 꼭짓점 공유)"""
+    lat0, lon0 = 37.5665, 126.9780
+    pts = [
+        [(round(lat0 + i * step, 6), round(lon0 + j * step, 6)) for j in range(size)]
+        for i in range(size)
+    ]
+    cols = [[pts[i][j] for i in range(size)] for j in range(size)]
+    return pts + cols
+
+
+def _grid_hazards(rng, n):
+    lat0, lon0 = 37.5665, 126.9780
+    return [
+        Hazard(
+            lat=lat0 + rng.uniform(0, 0.011),
+            lon=lon0 + rng.uniform(0, 0.011),
+            category=rng.choice(list(HazardCategory)),
+            score=round(rng.uniform(0.1, 2.0), 3),
+        )
+        for _ in range(n)
+    ]
+
+
+def _to_dict_graph(graph):
+    adjacency = {}
+    for u in range(len(graph)):
+        targets, weights = graph.neighbors(u)
+        adjacency[graph.coord(u)] = [
+            (graph.coord(v), w) for v, w in zip(targets, weights)
+        ]
+    return adjacency
+
+
+def test_build_graph_merges_shared_vertices_and_duplicate_edges():
+    a, b, c = (37.0, 127.0), (37.001, 127.0), (37.002, 127.0)
+    graph = build_graph([[a, b, c], [a, b]], [])
+    assert isinstance(graph, CompactGraph)
+    assert len(graph) == 3
+    # a-b 간선은 두 LineString에 모두 있지만 양방향 1개씩만 남음
+    assert graph.n_edges == 4
+    targets, weights = graph.neighbors(graph.node_id(a))
+    assert targets == [graph.node_id(b)]
+    assert weights[0] == haversine(*a, *b)
+
+
+def test_astar_on_compact_graph_matches_dict_graph():
+    rng = random.Random(3)
+    lines = _grid_lines()
+    for _ in range(5):
+        hazards = _grid_hazards(rng, 20)
+        compact = build_graph(lines, hazards)
+        legacy = _to_dict_graph(compact)
+        nodes = compact.keys()
+        for _ in range(10):
+            start, goal = rng.choice(nodes), rng.choice(nodes)
+            assert astar_graph(compact, start, goal) == _reference_astar(
+                legacy, start, goal
+            )
+            # dict 그래프를 넘겨도 변환 후 같은 결과
+            assert astar_graph(legacy, start, goal) == _reference_astar(
+                legacy, start, goal
+            )
+
+
+def _dijkstra_cost(graph, start, goal):
+    dist = {start: 0.0}
+    heap = [(0.0, start)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if u == goal:
+            return d
+        if d > dist[u]:
+            continue
+        for v, w in graph[u]:
+            if d + w < dist.get(v, float("inf")):
+                dist[v] = d + w
+                heapq.heappush(heap, (d + w, v))
+    return None
+
+
+def _path_cost(graph, path):
+    nodes = [(p["lat"], p["lon"]) for p in path[:-1]]
+    cost = 0.0
+    for a, b in zip(nodes, nodes[1:]):
+        cost += min(w for v, w in graph[a] if v == b)
+    return cost
+
+
+def test_astar_expands_each_node_at_most_once():
+    rng = random.Random(5)
+    compact = build_graph(_grid_lines(), _grid_hazards(rng, 40))
+    nodes = compact.keys()
+    stats = {}
+    astar_graph(compact, nodes[0], nodes[-1], stats=stats)
+    assert 0 < stats["expanded"] <= len(compact)
+
+
+def test_bidirectional_astar_finds_shortest_path_to_goal_node():
+    rng = random.Random(11)
+    lines = _grid_lines(size=20)
+    for _ in range(5):
+        compact = build_graph(lines, _grid_hazards(rng, 30))
+        legacy = _to_dict_graph(compact)
+        nodes = compact.keys()
+        for _ in range(10):
+            start, goal = rng.choice(nodes), rng.choice(nodes)
+            path = astar_graph(compact, start, goal, bidirectional=True)
+            assert path[0] == {"lat": start[0], "lon": start[1]}
+            assert path[-1] == {"lat": goal[0], "lon": goal[1]}
+            if start == goal:
+                assert len(path) == 2
+                continue
+            assert path[-2] == path[-1]
+            assert (
+                abs(_path_cost(legacy, path) - _dijkstra_cost(legacy, start, goal))
+                < 1e-6
+            )
+
+
+def test_bidirectional_astar_reports_disconnected_graph():
+    a = [(37.5665, 126.978), (37.5675, 126.978)]
+    b = [(37.58, 126.99), (37.581, 126.99)]
+    compact = build_graph([a, b], [])
+    assert astar_graph(compact, a[0], b[1], bidirectional=True) == []
@@ -0,0 +1,47 @@
+from route.infra.tmap_cache import InMemoryTMapRouteCache, route_cache_key
+
+LINES = [[(37.5665, 126.978), (37.567, 126.979)]]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_key_snaps_to_grid():
+    a = route_cache_key(37.566512, 126.978049, 37.57, 126.99, precision=4)
+    b = route_cache_key(37.566488, 126.977951, 37.57, 126.99, precision=4)
+    assert a == b == "37.5665:126.9780:37.5700:126.9900"
+    assert a != route_cache_key(37.5667, 126.978, 37.57, 126.99, precision=4)
+
+
+def test_ttl_expiry_and_counters():
+    clock = FakeClock()
+    cache = InMemoryTMapRouteCache(maxsize=10, ttl_s=60, clock=clock)
+
+    assert cache.get("k") is None
+    cache.set("k", LINES)
+    assert cache.get("k") == LINES
+
+    clock.now = 61
+    assert cache.get("k") is None
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["expirations"]) == (1, 2, 1)
+    assert stats["size"] == 0
+
+
+def test_lru_eviction_keeps_recently_used():
+    cache = InMemoryTMapRouteCache(maxsize=2, ttl_s=60)
+    cache.set("a", LINES)
+    cache.set("b", LINES)
+    cache.get("a")  # a를 최근 사용으로
+    cache.set("c", LINES)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == LINES
+    assert cache.get("c") == LINES
+    assert cache.stats()["evictions"] == 1
@@ -0,0 +1,177 @@
+import asyncio
+import time
+
+import pytest
+
+from route.algorithms.safe_path_finder import Hazard, HazardCategory
+from route.application.route_service import RouteService
+from route.infra.tmap_cache import InMemoryTMapRouteCache
+from route.infra.tmap_client import TMapClient
+from test.tmap_stub_server import run_stub_server
+
+O_LAT, O_LNG = 37.5665, 126.9780
+D_LAT, D_LNG = 37.5705, 126.9820
+
+
+class FakeReportRepo:
+    def __init__(self, hazards):
+        self.hazards = hazards
+        self.corridors = []
+
+    def find_along_route(self, route, width_m, min_risk_score=0.0):
+        self.corridors.append((list(route), width_m))
+        return self.hazards
+
+
+def _run(coro_fn):
+    return asyncio.run(coro_fn())
+
+
+def test_client_parses_stub_route():
+    async def main():
+        with run_stub_server() as stub:
+            client = TMapClient("key", base_url=stub.base_url)
+            try:
+                return await client.get_pedestrian_route(O_LAT, O_LNG, D_LAT, D_LNG)
+            finally:
+                await client.aclose()
+
+    lines = _run(main)
+    assert len(lines) == 2
+    assert lines[0][0] == (O_LAT, O_LNG)
+    assert lines[-1][-1] == (D_LAT, D_LNG)
+
+
+def test_concurrency_is_bounded_and_connections_reused():
+    async def main(stub):
+        client = TMapClient(
+            "key", base_url=stub.base_url, max_connections=4, max_concurrency=4
+        )
+        try:
+            for _ in range(3):
+                await asyncio.gather(
+                    *(
+                        client.get_pedestrian_route(
+                            O_LAT + i * 1e-3, O_LNG, D_LAT, D_LNG
+                        )
+                        for i in range(12)
+                    )
+                )
+        finally:
+            await client.aclose()
+
+    with run_stub_server(delay_s=0.02) as stub:
+        asyncio.run(main(stub))
+
+    assert stub.requests == 36
+    assert stub.max_in_flight <= 4
+    # keep-alive: 36개 요청이 풀 크기만큼의 연결만 사용
+    assert len(stub.client_ports) <= 4
+
+
+def test_read_timeout_raises():
+    async def main(stub):
+        client = TMapClient("key", base_url=stub.base_url, read_timeout_s=0.05)
+        try:
+            await client.get_pedestrian_route(O_LAT, O_LNG, D_LAT, D_LNG)
+        finally:
+            await client.aclose()
+
+    with run_stub_server(delay_s=0.5) as stub:
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(main(stub))
+
+
+def test_client_calls_tmap_once_per_grid_cell():
+    async def main(stub):
+        client = TMapClient(
+            "key", cache=InMemoryTMapRouteCache(), base_url=stub.base_url
+        )
+        try:
+            first = await client.get_pedestrian_route(
+                37.56651, 126.97801, 37.57, 126.99
+            )
+            second = await client.get_pedestrian_route(
+                37.56649, 126.97799, 37.57, 126.99
+            )
+            return first, second, client.cache_stats()
+        finally:
+            await client.aclose()
+
+    with run_stub_server() as stub:
+        first, second, stats = asyncio.run(main(stub))
+
+    assert first == second
+    assert stub.requests == 1
+    assert stats["hits"] == 1
+
+
+def test_generate_safe_route_end_to_end_against_stub():
+    hazard = Hazard(37.5685, 126.9800, HazardCategory.OBSTACLE, 1.0, report_id="r1")
+
+    async def main(stub, hazards):
+        client = TMapClient("key", base_url=stub.base_url)
+        service = RouteService(None, FakeReportRepo(hazards), tmap_client=client)
+        try:
+            return await service.generate_safe_route(O_LAT, O_LNG, D_LAT, D_LNG)
+        finally:
+            await client.aclose()
+
+    with run_stub_server() as stub:
+        flat = asyncio.run(main(stub, []))
+        avoided = asyncio.run(main(stub, [hazard]))
+
+    assert flat[0] == {"lat": O_LAT, "lon": O_LNG}
+    assert flat[-1] == {"lat": D_LAT, "lon": D_LNG}
+    assert avoided[0] == {"lat": O_LAT, "lon": O_LNG}
+    assert avoided[-1] == {"lat": D_LAT, "lon": D_LNG}
+
+
+def test_hazard_query_and_tmap_fetch_run_concurrently(caplog):
+    class SlowReportRepo(FakeReportRepo):
+        def find_along_route(self, route, width_m, min_risk_score=0.0):
+            time.sleep(0.3)
+            return self.hazards
+
+    async def main(stub):
+        client = TMapClient("key", base_url=stub.base_url)
+        service = RouteService(None, SlowReportRepo([]), tmap_client=client)
+        try:
+            t0 = time.perf_counter()
+            await service.generate_safe_route(O_LAT, O_LNG, D_LAT, D_LNG)
+            return time.perf_counter() - t0
+        finally:
+            await client.aclose()
+
+    with run_stub_server(delay_s=0.3) as stub, caplog.at_level("INFO"):
+        elapsed = asyncio.run(main(stub))
+
+    # 순차 실행이면 0.6초 이상
+    assert elapsed < 0.5
+    timing_logs = [r.message for r in caplog.records if "timings" in r.message]
+    assert "hazards=" in timing_logs[-1] and "tmap=" in timing_logs[-1]
+
+
+def test_hazard_corridor_follows_cached_route_polyline():
+    async def main(stub, repo):
+        client = TMapClient(
+            "key", cache=InMemoryTMapRouteCache(), base_url=stub.base_url
+        )
+        service = RouteService(
+            None, repo, tmap_client=client, corridor_m=150, od_corridor_m=800
+        )
+        try:
+            for _ in range(2):
+                await service.generate_safe_route(O_LAT, O_LNG, D_LAT, D_LNG)
+        finally:
+            await client.aclose()
+
+    repo = FakeReportRepo([])
+    with run_stub_server() as stub:
+        asyncio.run(main(stub, repo))
+
+    assert stub.requests == 1
+    # 캐시 miss: 출발-도착 선분, 캐시 hit: TMap 경로 폴리라인
+    (od, od_width), (polyline, width) = repo.corridors
+    assert od == [(O_LAT, O_LNG), (D_LAT, D_LNG)] and od_width == 800
+    assert len(polyline) > 2 and width == 150
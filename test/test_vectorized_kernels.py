@@ -0,0 +1,176 @@
+import math
+
+import numpy as np
+from hypothesis import given, settings, strategies as st
+
+from route.algorithms.hazard_index import DEG_PER_M, HazardGridIndex
+from route.algorithms.safe_path_finder import (
+    Hazard,
+    HazardCategory,
+    build_graph,
+    haversine,
+    segment_circle_intersect,
+)
+from route.algorithms.vectorized import (
+    haversine_vec,
+    segment_circle_intersect_vec,
+    within_corridor,
+)
+
+# 서비스 지역(한반도 부근) 좌표
+lats = st.floats(min_value=33.0, max_value=39.0, allow_nan=False)
+lons = st.floats(min_value=124.0, max_value=132.0, allow_nan=False)
+points = st.tuples(lats, lons)
+# 세그먼트/위험구역은 서로 가까운 곳에서 생성해야 교차 케이스가 충분히 나옴
+offsets = st.floats(min_value=-0.005, max_value=0.005, allow_nan=False)
+radii = st.sampled_from([50, 100, 200])
+
+
+@settings(max_examples=300)
+@given(st.lists(st.tuples(points, points), min_size=1, max_size=50))
+def test_haversine_vec_matches_scalar(pairs):
+    a = np.array([p for p, _ in pairs])
+    b = np.array([q for _, q in pairs])
+    result = haversine_vec(a[:, 0], a[:, 1], b[:, 0], b[:, 1])
+
+    for (p, q), d in zip(pairs, result):
+        expected = haversine(p[0], p[1], q[0], q[1])
+        assert math.isclose(d, expected, rel_tol=1e-9, abs_tol=1e-6)
+
+
+def _decision_margin(p1, p2, center, radius):
+    """스칼라 판정식이 경계(판별식 0, t = 0 또는 1)에서 얼마나 떨어져 있는지"""
+    x1, y1, x2, y2 = p1[1], p1[0], p2[1], p2[0]
+    cx, cy = center[1], center[0]
+    dx, dy = x2 - x1, y2 - y1
+    fx, fy = x1 - cx, y1 - cy
+    a = dx * dx + dy * dy
+    b = 2 * (fx * dx + fy * dy)
+    c = (fx * fx + fy * fy) - (radius / 111000) ** 2
+    disc = b * b - 4 * a * c
+    if disc < 0:
+        return abs(disc) / (b * b + abs(4 * a * c) + 1e-300)
+    root = math.sqrt(disc)
+    ts = [(-b - root) / (2 * a), (-b + root) / (2 * a)]
+    return min(
+        [disc / (b * b + abs(4 * a * c) + 1e-300)]
+        + [min(abs(t), abs(t - 1)) for t in ts]
+    )
+
+
+@settings(max_examples=500)
+@given(
+    center=points,
+    segments=st.lists(
+        st.tuples(offsets, offsets, offsets, offsets, radii), min_size=1, max_size=30
+    ),
+)
+def test_segment_circle_intersect_vec_matches_scalar(center, segments):
+    p1 = np.array([(center[0] + a, center[1] + b) for a, b, _, _, _ in segments])
+    p2 = np.array([(center[0] + c, center[1] + d) for _, _, c, d, _ in segments])
+    radius = np.array([r for *_, r in segments], dtype=float)
+
+    result = segment_circle_intersect_vec(
+        p1[:, 0], p1[:, 1], p2[:, 0], p2[:, 1], center[0], center[1], radius
+    )
+
+    for i, hit in enumerate(result):
+        s1, s2 = tuple(p1[i]), tuple(p2[i])
+        if s1 == s2:
+            continue  # 길이 0 세그먼트는 스칼라 버전이 0으로 나눔
+        # 판정 경계 바로 위의 값은 반올림에 따라 어느 쪽이든 허용
+        if _decision_margin(s1, s2, center, radius[i]) < 1e-9:
+            continue
+        assert hit == segment_circle_intersect(s1, s2, center, radius[i])
+
+
+def test_segment_circle_intersect_vec_zero_length_segment_is_false():
+    p = (37.5665, 126.9780)
+    assert not segment_circle_intersect_vec(p[0], p[1], p[0], p[1], p[0], p[1], 100)
+
+
+@settings(max_examples=100, deadline=None)
+@given(
+    origin=points,
+    steps=st.lists(st.tuples(offsets, offsets), min_size=1, max_size=40),
+    hazards=st.lists(
+        st.tuples(offsets, offsets, st.sampled_from(list(HazardCategory)), radii),
+        max_size=20,
+    ),
+)
+def test_build_graph_weights_match_scalar_loop(origin, steps, hazards):
+    line = [origin]
+    for d_lat, d_lon in steps:
+        line.append((line[-1][0] + d_lat / 5, line[-1][1] + d_lon / 5))
+    hz = [
+        Hazard(origin[0] + a, origin[1] + b, category, score=r / 100)
+        for a, b, category, r in hazards
+    ]
+
+    # 스칼라 함수로 세그먼트별 가중치 계산 (중복 세그먼트는 최소 가중치)
+    expected = {}
+    for p1, p2 in zip(line, line[1:]):
+        if p1 == p2:
+            continue
+        w = haversine(p1[0], p1[1], p2[0], p2[1])
+        for h in hz:
+            if segment_circle_intersect(p1, p2, (h.lat, h.lon), h.radius):
+                w += h.score * 300
+        for key in ((p1, p2), (p2, p1)):
+            expected[key] = min(w, expected.get(key, math.inf))
+
+    graph = build_graph([line], hz)
+    for (p1, p2), w in expected.items():
+        targets, weights = graph.neighbors(graph.node_id(p1))
+        actual = weights[targets.index(graph.node_id(p2))]
+        assert math.isclose(actual, w, rel_tol=1e-9, abs_tol=1e-6)
+
+
+@settings(max_examples=200, deadline=None)
+@given(
+    origin=points,
+    segments=st.lists(
+        st.tuples(offsets, offsets, offsets, offsets), min_size=1, max_size=30
+    ),
+    hazards=st.lists(
+        st.tuples(offsets, offsets, st.sampled_from(list(HazardCategory))),
+        max_size=20,
+    ),
+)
+def test_candidate_pairs_match_bbox_brute_force(origin, segments, hazards):
+    hz = [
+        Hazard(origin[0] + a, origin[1] + b, category, 1.0)
+        for a, b, category in hazards
+    ]
+    p1 = np.array([(origin[0] + a, origin[1] + b) for a, b, _, _ in segments])
+    p2 = np.array([(origin[0] + c, origin[1] + d) for _, _, c, d in segments])
+
+    # 모든 (세그먼트, 위험구역) 쌍의 bbox 겹침을 직접 비교
+    expected = []
+    for s, (a, b) in enumerate(zip(p1, p2)):
+        for h, hazard in enumerate(hz):
+            r = hazard.radius * DEG_PER_M
+            if (
+                hazard.lat - r <= max(a[0], b[0])
+                and hazard.lat + r >= min(a[0], b[0])
+                and hazard.lon - r <= max(a[1], b[1])
+                and hazard.lon + r >= min(a[1], b[1])
+            ):
+                expected.append((s, h))
+
+    seg, idx = HazardGridIndex(hz).candidate_pairs(
+        p1[:, 0], p1[:, 1], p2[:, 0], p2[:, 1]
+    )
+    assert list(zip(seg.tolist(), idx.tolist())) == expected
+
+
+def test_within_corridor_uses_distance_to_polyline():
+    # 동쪽으로 가다 북쪽으로 꺾는 L자 경로 (한 칸 ≈ 110m)
+    corridor = [(37.5, 127.0), (37.5, 127.01), (37.51, 127.01)]
+    lat = np.array([37.5005, 37.505, 37.505, 37.5, 37.49])
+    lon = np.array([127.005, 127.0105, 127.0, 126.995, 127.005])
+    result = within_corridor(lat, lon, corridor, 100)
+    # 선분 근처 2곳만 포함, 꺾인 안쪽/시작점 밖/남쪽은 제외
+    assert result.tolist() == [True, True, False, False, False]
+    # 점 하나짜리 회랑은 원
+    assert within_corridor(37.5005, 127.0, [(37.5, 127.0)], 100).tolist() == [True]
@@ -0,0 +1,130 @@
+"""
+TMap 보행자 경로 API 로컬 스텁 서버 (테스트/벤치마크용).
+
+출발지 → 중간점 → 도착지를 잇는 LineString 두 개를 돌려준다.
+delay_s로 TMap 응답 지연을 흉내 내고, 요청 수 / 최대 동시 처리 수 /
+클라이언트 연결(포트) 수를 기록해 keep-alive와 동시성 제한을 확인할 수 있다.
+
+    with run_stub_server(delay_s=0.05) as stub:
+        client = TMapClient("key", base_url=stub.base_url)
+
+별도 프로세스로도 띄울 수 있다 (TMAP_BASE_URL=http://127.0.0.1:8089 로 서버 연결):
+
+    python -m test.tmap_stub_server --port 8089 --delay 0.05
+"""
+
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+import argparse
+import json
+import threading
+import time
+
+
+class StubState:
+    def __init__(self, delay_s: float):
+        self.delay_s = delay_s
+        self.base_url = ""
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.client_ports = set()
+        self._lock = threading.Lock()
+
+    def enter(self, port: int):
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.client_ports.add(port)
+
+    def leave(self):
+        with self._lock:
+            self.in_flight -= 1
+
+
+def route_features(start_x, start_y, end_x, end_y) -> list:
+    mid = [(start_x + end_x) / 2, (start_y + end_y) / 2]
+    return [
+        {"geometry": {"type": "Point", "coordinates": [start_x, start_y]}},
+        {"geometry": {"type": "LineString", "coordinates": [[start_x, start_y], mid]}},
+        {"geometry": {"type": "LineString", "coordinates": [mid, [end_x, end_y]]}},
+    ]
+
+
+def _make_handler(state: StubState):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive
+        disable_nagle_algorithm = True  # 헤더/본문 분할 전송 시 delayed ACK 지연 방지
+
+        def do_POST(self):
+            state.enter(self.client_address[1])
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                form = parse_qs(self.rfile.read(length).decode())
+                if state.delay_s:
+                    time.sleep(state.delay_s)
+
+                coords = [
+                    float(form[k][0]) for k in ("startX", "startY", "endX", "endY")
+                ]
+                body = json.dumps(
+                    {"type": "FeatureCollection", "features": route_features(*coords)}
+                ).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            finally:
+                state.leave()
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+class _QuietServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = (
+        256  # 부하 테스트 시 listen backlog 부족으로 연결이 끊기지 않게
+    )
+
+    def handle_error(self, request, client_address):
+        # 타임아웃 테스트에서 클라이언트가 먼저 끊는 경우 (BrokenPipe) 무시
+        pass
+
+
+@contextmanager
+def run_stub_server(delay_s: float = 0.0):
+    state = StubState(delay_s)
+    server = _QuietServer(("127.0.0.1", 0), _make_handler(state))
+    state.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield state
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--delay", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = _QuietServer(
+        ("127.0.0.1", args.port), _make_handler(StubState(args.delay))
+    )
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Tuple
 from uuid import UUID
 from user.domain.user import User
 
@@ -10,6 +10,11 @@ class UserRepository(ABC):
         """user_id로 유저 조회"""
         raise NotImplementedError
 
+    @abstractmethod
+    def get_with_parent(self, user_id: str) -> Tuple[Optional[User], Optional[User]]:
+        """유저와 연결된 보호자를 한 번에 조회 (보호자가 없으면 (user, None))"""
+        raise NotImplementedError
+
     @abstractmethod
     def find_by_email(self, email: str) -> Optional[User]:
         """이메일로 유저 조회"""
@@ -1,4 +1,6 @@
-from sqlalchemy.orm import Session
+from typing import Tuple
+
+from sqlalchemy.orm import Session, aliased
 from fastapi import HTTPException
 
 from user.domain.repository.user_repo import UserRepository
@@ -49,6 +51,24 @@ class PostgresUserRepository(UserRepository):
                 return None
             return UserVO.model_validate(user)
 
+    def get_with_parent(self, user_id: str) -> Tuple[UserVO | None, UserVO | None]:
+        """users 자기 조인(LEFT JOIN) 한 번으로 유저 + 보호자 조회"""
+        Parent = aliased(UserDB)
+        with SessionLocal() as db:
+            row = (
+                db.query(UserDB, Parent)
+                .outerjoin(Parent, Parent.user_id == UserDB.parent_id)
+                .filter(UserDB.user_id == user_id)
+                .first()
+            )
+            if not row:
+                return None, None
+            user, parent = row
+            return (
+                UserVO.model_validate(user),
+                UserVO.model_validate(parent) if parent else None,
+            )
+
     def find_by_email(self, email: str) -> UserVO | None:
         with SessionLocal() as db:
             user = db.query(UserDB).filter(UserDB.email == email).first()